@@ -181,6 +181,26 @@ register an entry point under the group ``invenio_admin.views`` inside its
       },
     )
 
+Selecting the views per process
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Processes that do not serve the admin panel (e.g. API-only or Celery
+processes) can skip building it entirely with ``ADMIN_ENABLED = False``.
+Other processes can load only some entry points by name with
+``ADMIN_ENTRY_POINTS_ALLOWLIST`` and ``ADMIN_ENTRY_POINTS_DENYLIST``:
+
+.. code-block:: python
+
+    ADMIN_ENTRY_POINTS_DENYLIST = ['invenio_diner_stats']
+
+In disabled processes, ``current_admin`` is a state without views whose
+``enabled`` attribute is ``False``; the ``flask admin`` commands refuse to
+run there.
+
+The time and unique memory spent building the admin interface, and the
+skipped entry points, are logged when the application is finalized; the
+amount saved by a selection is the difference with the cost logged by a
+process loading all entry points.
+
 
 Authentication and authorization
 --------------------------------
@@ -258,9 +278,33 @@ default the template mode is set to Bootstrap 3 but can be controlled through
 
 from __future__ import absolute_import, print_function
 
-from .ext import InvenioAdmin
-from .proxies import current_admin
+import importlib
 
 __version__ = "1.6.1"
 
 __all__ = ("__version__", "InvenioAdmin", "current_admin")
+
+# Public names and the submodules they are imported from on first access.
+_lazy_imports = {
+    "InvenioAdmin": ".ext",
+    "current_admin": ".proxies",
+}
+
+
+def __getattr__(name):
+    """Import the public names lazily.
+
+    :param name: Attribute name.
+    """
+    if name not in _lazy_imports:
+        raise AttributeError(
+            "module {0!r} has no attribute {1!r}".format(__name__, name)
+        )
+    value = getattr(importlib.import_module(_lazy_imports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the public names, including the lazily imported ones."""
+    return sorted(set(globals()) | set(_lazy_imports))
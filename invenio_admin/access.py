@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Request-level loading of the actions granted to an identity.
+
+:class:`invenio_access.Permission` expands each action into the users and
+roles allowed to perform it, with three queries per action and permission
+check. As the admin menu checks the permission of every view, rendering a
+page runs these queries once per registered view.
+
+:class:`AdminPermission` instead loads, on the first check of a request,
+every action granted to or denied for the current identity with one query,
+and answers the following checks from memory. It is used by the default
+permission factories when Invenio-Access is installed.
+"""
+
+from __future__ import absolute_import, print_function
+
+from flask import has_request_context, request
+from invenio_access import Permission
+from invenio_access.models import ActionRoles, ActionSystemRoles, ActionUsers
+from invenio_db import db
+from sqlalchemy import false, literal, union_all
+
+
+def _matches(rows, need):
+    """Check if an action need matches a set of (action, argument) rows."""
+    argument = getattr(need, "argument", None)
+    if (need.value, None) in rows:
+        return True
+    return argument is not None and (need.value, str(argument)) in rows
+
+
+class IdentityGrants(object):
+    """Actions granted to and denied for an identity."""
+
+    def __init__(self, identity):
+        """Initialize the grants.
+
+        :param identity: The identity (with its provided needs loaded).
+        """
+        self.provides = frozenset(identity.provides)
+        self.granted = set()
+        self.excluded = set()
+        self.assigned = set()
+        self.loaded_actions = set()
+        self.loaded = False
+
+    def _identity_queries(self):
+        """Get the queries of the actions granted to the identity."""
+        values = {}
+        for need in self.provides:
+            values.setdefault(need.method, set()).add(need.value)
+        conditions = (
+            (ActionUsers, ActionUsers.user_id, values.get("id")),
+            (ActionRoles, ActionRoles.role_id, values.get("role")),
+            (ActionSystemRoles, ActionSystemRoles.role_name, values.get("system_role")),
+        )
+        return [
+            db.select(literal("identity"), m.action, m.argument, m.exclude).where(
+                column.in_(sorted(needs, key=str))
+            )
+            for m, column, needs in conditions
+            if needs
+        ]
+
+    def _assigned_queries(self, actions):
+        """Get the queries of the actions allowed to anybody."""
+        return [
+            db.select(literal("assigned"), m.action, m.argument, false())
+            .where(m.action.in_(sorted(actions)), m.exclude.is_(False))
+            .distinct()
+            for m in (ActionUsers, ActionRoles, ActionSystemRoles)
+        ]
+
+    def load(self, actions):
+        """Load the grants of the identity and the assignment of actions.
+
+        Everything is fetched with a single query; actions whose assignment
+        is already known are skipped.
+
+        :param actions: Names of the actions to check.
+        """
+        actions = set(actions) - self.loaded_actions
+        queries = [] if self.loaded else self._identity_queries()
+        if actions:
+            queries.extend(self._assigned_queries(actions))
+        self.loaded = True
+        self.loaded_actions.update(actions)
+        if not queries:
+            return
+        for kind, action, argument, exclude in db.session.execute(union_all(*queries)):
+            if kind == "assigned":
+                self.assigned.add((action, argument))
+            elif exclude:
+                self.excluded.add((action, argument))
+            else:
+                self.granted.add((action, argument))
+
+    def allows(self, needs):
+        """Check if the identity is allowed by a set of needs.
+
+        This follows :meth:`invenio_access.Permission.allows`: the action
+        needs are expanded into the users and roles they are granted to; if
+        nobody is, the identity must provide the action needs themselves.
+
+        :param needs: Needs of the permission.
+        :returns: ``True`` if the identity is allowed.
+        """
+        action_needs = {n for n in needs if n.method == "action"}
+        other_needs = set(needs) - action_needs
+        self.load(n.value for n in action_needs)
+
+        if any(_matches(self.excluded, n) for n in action_needs):
+            return False
+        if other_needs or any(_matches(self.assigned, n) for n in action_needs):
+            return bool(other_needs & self.provides) or any(
+                _matches(self.granted, n) for n in action_needs
+            )
+        return bool(action_needs & self.provides)
+
+
+def identity_grants(identity):
+    """Get the grants of an identity, loaded once per request.
+
+    :param identity: The identity.
+    :returns: The :class:`IdentityGrants` of the identity.
+    """
+    grants = request.environ.get("invenio_admin.grants")
+    if grants is None or grants.provides != frozenset(identity.provides):
+        grants = request.environ["invenio_admin.grants"] = IdentityGrants(identity)
+    return grants
+
+
+class AdminPermission(Permission):
+    """Permission answering from the grants loaded once per request."""
+
+    def allows(self, identity):
+        """Check whether the identity can access this permission.
+
+        :param identity: The identity.
+        """
+        if not has_request_context() or self.explicit_excludes:
+            return super(AdminPermission, self).allows(identity)
+        return identity_grants(identity).allows(self.explicit_needs)
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Admin views provided by Invenio-Admin.
+
+The views are not registered by default. :class:`CacheView` shows the backend
+of the admin cache and purges the cached admin pages (see
+:func:`invenio_admin.cache.cached_view`). Applications enable it in the
+"System" menu with an entry point:
+
+.. code-block:: toml
+
+    [project.entry-points."invenio_admin.views"]
+    invenio_admin_cache = "invenio_admin.admin:cache_adminview"
+
+or by registering it themselves:
+
+.. code-block:: python
+
+    from invenio_admin.admin import CacheView
+
+    current_admin.register_view(CacheView, name='Cache', category='System')
+"""
+
+from __future__ import absolute_import, print_function
+
+from flask import flash, redirect
+from flask_admin.base import BaseView, expose
+from flask_admin.helpers import get_form_data, validate_form_on_submit
+from invenio_i18n import lazy_gettext as _
+
+from .cache import purge_fragments
+from .forms import ConfirmForm
+from .proxies import current_admin
+
+
+class CacheView(BaseView):
+    """Manage the cache of Invenio-Admin."""
+
+    @expose("/")
+    def index(self):
+        """Cache overview."""
+        return self.render(
+            "invenio_admin/cache.html",
+            backend=type(current_admin.cache.backend).__name__,
+            form=ConfirmForm(),
+        )
+
+    @expose("/purge/", methods=("POST",))
+    def purge(self):
+        """Purge all cached admin pages."""
+        if validate_form_on_submit(ConfirmForm(get_form_data())):
+            purge_fragments()
+            flash(_("Cached admin pages were purged."), "success")
+        return redirect(self.get_url(".index"))
+
+
+cache_adminview = {
+    "view_class": CacheView,
+    "kwargs": {
+        "name": _("Cache"),
+        "category": _("System"),
+        "endpoint": "invenio_admin_cache",
+    },
+}
@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Index advisor of the admin model views.
+
+Sorting, filtering or searching a list view on a column which does not lead
+an index of its table makes the database scan the whole table. The advisor
+walks the sortable, filterable and searchable columns (and the default sort)
+of every registered SQLAlchemy model view and reports those without an
+index:
+
+.. code-block:: console
+
+    $ flask admin indexes
+
+With :data:`invenio_admin.config.ADMIN_INDEX_ADVISOR` the report is logged
+when the application is finalized. With
+:data:`invenio_admin.config.ADMIN_INDEX_ADVISOR_HIDE_SORTS_THRESHOLD` the
+unindexed sorts of tables estimated larger than the threshold are removed
+from the views (PostgreSQL only, see :func:`~.facets.estimate_rows`).
+"""
+
+from __future__ import absolute_import, print_function
+
+import logging
+from collections import namedtuple
+
+from flask_admin.contrib.sqla import ModelView
+from flask_admin.contrib.sqla.filters import BaseSQLAFilter
+from sqlalchemy.exc import SQLAlchemyError
+
+from .explain import is_indexed
+from .facets import estimate_rows
+
+log = logging.getLogger(__name__)
+
+Finding = namedtuple("Finding", ("endpoint", "table", "column", "usage", "rows"))
+"""Column of a view used without an index.
+
+``usage`` is one of ``default sort``, ``sort``, ``filter`` and ``search``;
+``rows`` is the estimated size of the table, if known."""
+
+
+def _columns(field):
+    """Get the columns of a sort field, which can be a list of fields."""
+    return field if isinstance(field, (list, tuple)) else [field]
+
+
+def view_columns(view):
+    """Get the columns a model view sorts, filters and searches on.
+
+    :param view: The admin view.
+    :returns: List of ``(usage, name, column)`` tuples.
+    """
+    if not isinstance(view, ModelView):
+        return []
+    columns = []
+    for attr, _, _ in view._get_default_order():
+        columns.append(("default sort", None, attr))
+    for name, field in (view._sortable_columns or {}).items():
+        columns.extend(("sort", name, c) for c in _columns(field))
+    seen = set()
+    for flt in view._filters or ():
+        column = flt.column if isinstance(flt, BaseSQLAFilter) else None
+        if column is not None and id(column) not in seen:
+            seen.add(id(column))
+            columns.append(("filter", None, column))
+    for field, _ in view._search_fields or ():
+        columns.append(("search", None, field))
+    return columns
+
+
+def _table_rows(view, table, rows):
+    """Estimate the rows of a table once per audit."""
+    if table.fullname not in rows:
+        try:
+            rows[table.fullname] = estimate_rows(view.session, table)
+        except SQLAlchemyError:
+            view.session.rollback()
+            rows[table.fullname] = None
+    return rows[table.fullname]
+
+
+def audit_view(view, rows=None):
+    """Find the columns of a view used without an index.
+
+    Searches match with ``ILIKE '%term%'``, which cannot use B-tree indexes,
+    so searchable columns are always reported.
+
+    :param view: The admin view.
+    :param rows: Dictionary caching the estimated rows by table name.
+    :returns: List of :class:`Finding`.
+    """
+    rows = {} if rows is None else rows
+    findings = []
+    for usage, _, column in view_columns(view):
+        expression = getattr(column, "expression", column)
+        table = getattr(expression, "table", None)
+        if table is None or not hasattr(table, "indexes"):
+            continue
+        if usage != "search" and is_indexed(expression) is not False:
+            continue
+        findings.append(
+            Finding(
+                view.endpoint,
+                table.fullname,
+                expression.name,
+                usage,
+                _table_rows(view, table, rows),
+            )
+        )
+    return findings
+
+
+def audit_views(views):
+    """Find the columns of several views used without an index.
+
+    :param views: The admin views.
+    :returns: List of :class:`Finding`.
+    """
+    rows = {}
+    findings = []
+    for view in views:
+        findings.extend(audit_view(view, rows))
+    return findings
+
+
+def _column_key(column):
+    """Identify a column by its table and name."""
+    expression = getattr(column, "expression", column)
+    table = getattr(expression, "table", None)
+    return getattr(table, "fullname", None), getattr(expression, "name", None)
+
+
+def _sortable_name(entry):
+    """Get the name of an entry of ``column_sortable_list``."""
+    if isinstance(entry, tuple):
+        return entry[0]
+    if isinstance(entry, str):
+        return entry
+    return getattr(entry, "key", str(entry))
+
+
+def hide_unindexed_sorts(view, threshold, rows=None):
+    """Remove the unindexed sorts of a view on a large table.
+
+    The sorts are removed from ``column_sortable_list``, so they stay hidden
+    when the view refreshes its cached columns. The columns of the default
+    sort are kept, with a warning.
+
+    :param view: The admin view.
+    :param threshold: Estimated number of rows above which the sorts are
+        removed.
+    :param rows: Dictionary caching the estimated rows by table name.
+    :returns: Names of the removed sortable columns.
+    """
+    rows = {} if rows is None else rows
+    defaults = set()
+    if isinstance(view, ModelView):
+        defaults = {_column_key(attr) for attr, _, _ in view._get_default_order()}
+    hidden = set()
+    for usage, name, column in view_columns(view):
+        if usage != "sort" or name in hidden:
+            continue
+        expression = getattr(column, "expression", column)
+        table = getattr(expression, "table", None)
+        if table is None or is_indexed(expression) is not False:
+            continue
+        estimate = _table_rows(view, table, rows)
+        if estimate is None or estimate <= threshold:
+            continue
+        if _column_key(column) in defaults:
+            log.warning(
+                "Admin view %s: unindexed default sort %s kept.", view.endpoint, name
+            )
+            continue
+        hidden.add(name)
+    if hidden:
+        if view.column_sortable_list is None:
+            entries = list(view._sortable_columns)
+        else:
+            entries = list(view.column_sortable_list)
+        view.column_sortable_list = [
+            e for e in entries if _sortable_name(e) not in hidden
+        ]
+        view._refresh_cache()
+    return sorted(hidden)
@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Read-only JSON API of the admin model views.
+
+When :data:`invenio_admin.config.ADMIN_API_ENABLED` is set, each protected
+SQLAlchemy model view exposes two endpoints, protected by the same
+permissions as the view itself:
+
+``/admin/<endpoint>/api/``
+    List of records with the columns of ``column_list``. The view's search
+    (``search``) and filters (``flt<n>_<filter>``) arguments are supported.
+    Records are ordered by primary key and paged with the opaque ``cursor``
+    returned in the ``next`` key of the previous page. The page size is set
+    with ``size``.
+
+``/admin/<endpoint>/api/details/?id=<id>``
+    A single record with the columns of the details view.
+
+Responses are streamed and no template is rendered.
+"""
+
+from __future__ import absolute_import, print_function
+
+import base64
+import datetime
+import json
+
+from flask import Response, abort, current_app, request, stream_with_context
+from flask_admin.base import expose
+from flask_admin.contrib.sqla import ModelView
+from flask_admin.model.helpers import get_mdict_item_or_list
+from flask_admin.tools import rec_getattr
+from sqlalchemy import tuple_
+
+
+def json_default(value):
+    """Serialize values not supported by :mod:`json`.
+
+    :param value: Value to serialize.
+    :returns: ISO 8601 representation of dates and times, otherwise the string
+        representation of the value.
+    """
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(values):
+    """Encode primary key values into an opaque cursor.
+
+    :param values: List of primary key values.
+    :returns: URL-safe cursor.
+    """
+    data = json.dumps(values, default=json_default).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """Decode a cursor into primary key values.
+
+    :param cursor: Cursor created by :func:`encode_cursor`.
+    :returns: List of primary key values.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except ValueError:
+        abort(400)
+    if not isinstance(values, list):
+        abort(400)
+    return values
+
+
+class APIMixin(object):
+    """JSON list and details endpoints of a model view."""
+
+    def _check_api(self):
+        """Check if the API is available for this view."""
+        if not current_app.config.get("ADMIN_API_ENABLED") or not isinstance(
+            self, ModelView
+        ):
+            abort(404)
+
+    def _primary_key_attrs(self):
+        """Get the primary key attribute names of the model."""
+        if isinstance(self._primary_key, tuple):
+            return list(self._primary_key)
+        return [self._primary_key]
+
+    def get_filtered_query(self, search, filters):
+        """Get the query of the view with search and filters applied.
+
+        Unlike :meth:`flask_admin.contrib.sqla.ModelView.get_list` neither
+        counts nor sorts the records.
+
+        :param search: Search query.
+        :param filters: List of filter tuples.
+        :returns: Tuple of the SQLAlchemy query object and its joins.
+        """
+        joins, count_joins = {}, {}
+        query = self.get_query()
+        if self._search_supported and search:
+            query, _, joins, count_joins = self._apply_search(
+                query, None, joins, count_joins, search
+            )
+        if filters and self._filters:
+            query, _, joins, count_joins = self._apply_filters(
+                query, None, joins, count_joins, filters
+            )
+        return query, joins
+
+    def get_api_keyset_query(self, query, cursor):
+        """Order a query by primary key and seek after a cursor.
+
+        :param query: SQLAlchemy query object.
+        :param cursor: Cursor of the last record of the previous page, or
+            ``None`` for the first page.
+        :returns: SQLAlchemy query object.
+        """
+        columns = [getattr(self.model, attr) for attr in self._primary_key_attrs()]
+        if cursor:
+            values = decode_cursor(cursor)
+            if len(values) != len(columns):
+                abort(400)
+            if len(columns) == 1:
+                query = query.filter(columns[0] > values[0])
+            else:
+                query = query.filter(tuple_(*columns) > tuple_(*values))
+        return query.order_by(None).order_by(*columns)
+
+    def serialize_api_record(self, model, columns):
+        """Serialize a record.
+
+        :param model: Model instance.
+        :param columns: List of ``(name, label)`` tuples of the columns.
+        :returns: Dictionary of the raw column values, with the primary key
+            of the record in ``id``.
+        """
+        record = {"id": self.get_pk_value(model)}
+        for name, _ in columns:
+            record[name] = rec_getattr(model, name)
+        return record
+
+    @expose("/api/")
+    def api_list_view(self):
+        """List records as JSON."""
+        self._check_api()
+        view_args = self._get_list_extra_args()
+        max_size = current_app.config["ADMIN_API_MAX_PAGE_SIZE"]
+        size = request.args.get("size", self.page_size, type=int) or max_size
+        size = max(1, min(size, max_size))
+
+        query, _ = self.get_filtered_query(view_args.search, view_args.filters)
+        query = self.get_api_keyset_query(query, request.args.get("cursor"))
+        # Fetch one more row to know if there is a next page.
+        query = query.limit(size + 1).yield_per(min(size + 1, 100))
+        pk_attrs = self._primary_key_attrs()
+        columns = self._list_columns
+
+        def generate():
+            yield '{"hits": ['
+            count, last, next_cursor = 0, None, None
+            for model in query:
+                if count == size:
+                    next_cursor = encode_cursor([getattr(last, a) for a in pk_attrs])
+                    break
+                if count:
+                    yield ","
+                yield json.dumps(
+                    self.serialize_api_record(model, columns), default=json_default
+                )
+                count, last = count + 1, model
+            yield '], "next": {0}}}'.format(json.dumps(next_cursor))
+
+        return Response(stream_with_context(generate()), mimetype="application/json")
+
+    @expose("/api/details/")
+    def api_details_view(self):
+        """Get a record as JSON."""
+        self._check_api()
+        id = get_mdict_item_or_list(request.args, "id")
+        model = self.get_one(id) if id is not None else None
+        if model is None:
+            abort(404)
+        columns = self._details_columns if self.can_view_details else None
+        return Response(
+            json.dumps(
+                self.serialize_api_record(model, columns or self._list_columns),
+                default=json_default,
+            ),
+            mimetype="application/json",
+        )
@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Fingerprinted static assets of the administration interface.
+
+Flask-Admin serves its static files (Bootstrap, jQuery, ...) with short
+cache lifetimes, so browsers revalidate them on every page. The files of the
+configured ``ADMIN_TEMPLATE_MODE`` can instead be copied at build time with
+a content hash in their name, and precompressed with gzip (and Brotli if the
+``brotli`` package is installed):
+
+.. code-block:: console
+
+    $ flask admin assets --output /var/www/admin-assets
+
+With ``ADMIN_STATIC_ASSETS_FOLDER`` pointing to the output folder, the
+admin templates, including custom ``ADMIN_BASE_TEMPLATE`` templates using
+``admin_static.url()``, link the fingerprinted copies. They are served from
+``ADMIN_STATIC_ASSETS_URL`` with ``Cache-Control: immutable``, as their
+content never changes for a given URL.
+"""
+
+from __future__ import absolute_import, print_function
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import posixpath
+
+import flask_admin
+from flask import abort, current_app, request, send_from_directory, url_for
+from werkzeug.security import safe_join
+
+from .proxies import current_admin
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+MANIFEST_NAME = "manifest.json"
+"""Name of the manifest mapping the static files to their copies."""
+
+COMPRESSED_EXTENSIONS = (".css", ".js", ".json", ".map", ".svg", ".txt", ".html")
+"""Extensions of the files which are precompressed."""
+
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+"""Content encodings of the precompressed files, by order of preference."""
+
+
+def static_folder():
+    """Get the folder of Flask-Admin's static files."""
+    return os.path.join(os.path.dirname(flask_admin.__file__), "static")
+
+
+def is_template_mode_file(path, template_mode):
+    """Check if a static file is used by a template mode.
+
+    :param path: Path of the file relative to the static folder.
+    :param template_mode: Flask-Admin template mode (e.g. ``'bootstrap3'``).
+    :returns: ``False`` for the Bootstrap files of the other template modes.
+    """
+    parts = path.split("/")
+    return not (
+        len(parts) > 2
+        and parts[0] in ("bootstrap", "vendor")
+        and parts[1].startswith("bootstrap")
+        and parts[1][len("bootstrap") :].isdigit()
+        and parts[1] != template_mode
+    )
+
+
+def fingerprint(path, data):
+    """Get the name of a file including a hash of its content.
+
+    :param path: Path of the file.
+    :param data: Content of the file.
+    :returns: Path with the hash before the extension.
+    """
+    base, ext = posixpath.splitext(path)
+    return "{0}.{1}{2}".format(base, hashlib.sha256(data).hexdigest()[:12], ext)
+
+
+def build_assets(output, template_mode, source=None):
+    """Copy the static files with fingerprinted names and compress them.
+
+    :param output: Output folder.
+    :param template_mode: Flask-Admin template mode of the application.
+    :param source: Folder of the static files. (Default: Flask-Admin's)
+    :returns: Manifest mapping the static files to their copies.
+    """
+    source = source or static_folder()
+    manifest = {}
+    for root, dirs, files in os.walk(source):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.relpath(os.path.join(root, name), source)
+            path = path.replace(os.sep, "/")
+            if not is_template_mode_file(path, template_mode):
+                continue
+            with open(os.path.join(root, name), "rb") as fp:
+                data = fp.read()
+            target = fingerprint(path, data)
+            manifest[path] = target
+
+            target = os.path.join(output, *target.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as fp:
+                fp.write(data)
+            if os.path.splitext(name)[1] in COMPRESSED_EXTENSIONS:
+                with open(target + ".gz", "wb") as fp:
+                    fp.write(gzip.compress(data, 9, mtime=0))
+                if brotli is not None:
+                    with open(target + ".br", "wb") as fp:
+                        fp.write(brotli.compress(data))
+
+    with open(os.path.join(output, MANIFEST_NAME), "w") as fp:
+        json.dump(manifest, fp, indent=2, sort_keys=True)
+    return manifest
+
+
+def load_assets_manifest(folder):
+    """Load the manifest of the fingerprinted static files.
+
+    :param folder: Folder of the fingerprinted static files.
+    :returns: The manifest, or ``None`` if the folder was not built.
+    """
+    try:
+        with open(os.path.join(folder, MANIFEST_NAME)) as fp:
+            return json.load(fp)
+    except (IOError, ValueError):
+        current_app.logger.warning(
+            "Invalid admin static assets folder %s, run 'flask admin assets'.",
+            folder,
+        )
+        return None
+
+
+def asset_url(filename):
+    """Get the URL of the fingerprinted copy of a static file.
+
+    :param filename: Path of the file in Flask-Admin's static folder.
+    :returns: The URL, or ``None`` if there is no fingerprinted copy.
+    """
+    manifest = current_admin.assets_manifest
+    if manifest and filename in manifest:
+        return url_for("invenio_admin_assets", filename=manifest[filename])
+    return None
+
+
+def send_asset(filename):
+    """Send a fingerprinted static file.
+
+    The precompressed file is sent if the client accepts its encoding.
+
+    :param filename: Path of the file in the assets folder.
+    """
+    folder = current_app.config.get("ADMIN_STATIC_ASSETS_FOLDER")
+    if not folder:
+        abort(404)
+    mimetype = mimetypes.guess_type(filename)[0]
+    encoding = None
+    for name, suffix in ENCODINGS:
+        path = safe_join(folder, filename + suffix)
+        if request.accept_encodings[name] and path and os.path.isfile(path):
+            encoding, filename = name, filename + suffix
+            break
+    response = send_from_directory(folder, filename, mimetype=mimetype)
+    if encoding:
+        response.content_encoding = encoding
+    response.vary.add("Accept-Encoding")
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config["ADMIN_STATIC_ASSETS_MAX_AGE"]
+    response.cache_control.immutable = True
+    return response
@@ -0,0 +1,348 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Audit trail of the admin mutations.
+
+When :data:`invenio_admin.config.ADMIN_AUDIT_ENABLED` is set, protected
+SQLAlchemy model views record an event for every created, updated and
+deleted record and for every action, once the change is committed:
+
+.. code-block:: python
+
+    {
+        "timestamp": "2026-01-01T12:00:00.000000+00:00",
+        "user_id": "1",
+        "endpoint": "snack",
+        "model": "Snack",
+        "operation": "update",
+        "ids": ["42"],
+    }
+
+Events are put on an in-process queue and written by a background thread in
+batches, outside of the admin requests and their transactions, to the sink
+created by :data:`invenio_admin.config.ADMIN_AUDIT_SINK`:
+
+- :func:`file_sink_factory` appends JSON lines to
+  :data:`invenio_admin.config.ADMIN_AUDIT_FILE`.
+- :func:`database_sink_factory` inserts the events into the table of the
+  model :data:`invenio_admin.config.ADMIN_AUDIT_MODEL`, which must have a
+  column for each key of the events.
+
+When the queue is full, requests wait up to
+:data:`invenio_admin.config.ADMIN_AUDIT_PUT_TIMEOUT` seconds for the writer
+before the event is dropped and logged. Pending events are flushed when the
+process exits.
+"""
+
+from __future__ import absolute_import, print_function
+
+import atexit
+import json
+import os
+import queue
+import threading
+from datetime import datetime, timezone
+
+from flask import current_app, g, request, session
+from flask_admin.contrib.sqla import ModelView
+from flask_login import current_user
+from sqlalchemy import inspect
+from werkzeug.utils import import_string
+
+from .proxies import current_admin
+
+
+class FileSink(object):
+    """Append events as JSON lines to a file."""
+
+    def __init__(self, path):
+        """Initialize the sink.
+
+        :param path: Path of the file.
+        """
+        self.path = path
+
+    def write(self, events):
+        """Write a batch of events.
+
+        :param events: List of events.
+        """
+        data = "".join(json.dumps(e, sort_keys=True) + "\n" for e in events)
+        with open(self.path, "a") as fp:
+            fp.write(data)
+
+
+class DatabaseSink(object):
+    """Insert events into the table of a model."""
+
+    def __init__(self, app, model):
+        """Initialize the sink.
+
+        :param app: The Flask application.
+        :param model: The model class.
+        """
+        self.app = app
+        self.model = model
+
+    def write(self, events):
+        """Write a batch of events with one multi-row insert.
+
+        :param events: List of events.
+        """
+        from invenio_db import db
+
+        with self.app.app_context():
+            try:
+                db.session.execute(self.model.__table__.insert(), events)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+
+def file_sink_factory(app):
+    """Create a sink writing to ``ADMIN_AUDIT_FILE``.
+
+    The folder of the file (by default the instance folder, which Flask does
+    not create) is created if needed.
+
+    :param app: The Flask application.
+    :returns: A :class:`FileSink`. (Default file: ``admin_audit.jsonl`` in
+        the instance folder)
+    """
+    path = app.config["ADMIN_AUDIT_FILE"] or os.path.join(
+        app.instance_path, "admin_audit.jsonl"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return FileSink(path)
+
+
+def database_sink_factory(app):
+    """Create a sink inserting into the table of ``ADMIN_AUDIT_MODEL``.
+
+    :param app: The Flask application.
+    :returns: A :class:`DatabaseSink`.
+    """
+    return DatabaseSink(app, import_string(app.config["ADMIN_AUDIT_MODEL"]))
+
+
+class AuditQueue(object):
+    """Queue of audit events written in batches by a background thread."""
+
+    def __init__(self, app, sink, maxsize=10000, batch_size=500, interval=1.0):
+        """Initialize the queue.
+
+        :param app: The Flask application.
+        :param sink: Sink with a ``write(events)`` method.
+        :param maxsize: Maximum number of pending events.
+        :param batch_size: Maximum number of events written at once.
+        :param interval: Maximum delay in seconds before writing an event.
+        """
+        self.app = app
+        self.sink = sink
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._registered = False
+
+    def _ensure_writer(self):
+        """Start the writer thread of this process if needed."""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            if self._pid is not None:
+                # Forked worker: threads do not survive forking and the
+                # pending events belong to the parent process.
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+            self._thread = threading.Thread(
+                target=self._run, name="invenio-admin-audit", daemon=True
+            )
+            self._thread.start()
+            if not self._registered:
+                atexit.register(self.close)
+                self._registered = True
+            self._pid = pid
+
+    def put(self, event, timeout=1.0):
+        """Add an event to the queue.
+
+        :param event: The event dictionary.
+        :param timeout: Seconds to wait for space in a full queue.
+        :returns: ``False`` if the event was dropped.
+        """
+        self._ensure_writer()
+        try:
+            self._queue.put(event, timeout=timeout)
+        except queue.Full:
+            self.dropped += 1
+            self.app.logger.error("Admin audit queue full, event dropped: %s", event)
+            return False
+        return True
+
+    def _next_batch(self):
+        """Wait for the next batch of events, ``None`` after closing."""
+        try:
+            first = self._queue.get(timeout=self.interval)
+        except queue.Empty:
+            return []
+        batch = [first]
+        while len(batch) < self.batch_size and batch[-1] is not None:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        """Write the batches of events until the queue is closed."""
+        closed = False
+        while not closed:
+            batch = self._next_batch()
+            closed = None in batch
+            events = [e for e in batch if e is not None]
+            try:
+                if events:
+                    self.sink.write(events)
+            except Exception:
+                self.app.logger.exception(
+                    "Admin audit sink failed, %s events lost.", len(events)
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self):
+        """Wait until all queued events are written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self, timeout=10.0):
+        """Write the pending events and stop the writer thread.
+
+        :param timeout: Seconds to wait for the writer.
+        """
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        thread.join(timeout)
+        self._thread, self._pid = None, None
+
+
+def audit_queue_factory(app):
+    """Create the audit queue of an application.
+
+    :param app: The Flask application.
+    :returns: An :class:`AuditQueue` writing to the configured sink.
+    """
+    return AuditQueue(
+        app,
+        import_string(app.config["ADMIN_AUDIT_SINK"])(app),
+        maxsize=app.config["ADMIN_AUDIT_QUEUE_SIZE"],
+        batch_size=app.config["ADMIN_AUDIT_BATCH_SIZE"],
+        interval=app.config["ADMIN_AUDIT_FLUSH_INTERVAL"],
+    )
+
+
+def is_audited(view):
+    """Check if the mutations of a view are recorded.
+
+    :param view: The admin view.
+    """
+    return current_app.config.get("ADMIN_AUDIT_ENABLED") and isinstance(view, ModelView)
+
+
+def identity(model):
+    """Get the primary key of a record without loading it.
+
+    Records are expired after being committed; their identity is known
+    without refreshing them.
+
+    :param model: Model instance.
+    :returns: Primary key as a string.
+    """
+    key = inspect(model).identity or ()
+    return ",".join(str(value) for value in key)
+
+
+def record_event(view, operation, ids):
+    """Record an audit event of a model view.
+
+    :param view: The admin model view.
+    :param operation: ``create``, ``update``, ``delete`` or
+        ``action:<name>``.
+    :param ids: Primary keys of the affected records.
+    """
+    event = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "user_id": current_user.get_id(),
+        "endpoint": view.endpoint,
+        "model": view.model.__name__,
+        "operation": operation,
+        "ids": [str(i) for i in ids],
+    }
+    current_admin.audit.put(
+        event, timeout=current_app.config["ADMIN_AUDIT_PUT_TIMEOUT"]
+    )
+
+
+def _flashed_errors():
+    """Count the error messages flashed in the current session."""
+    return sum(1 for category, _ in session.get("_flashes", ()) if category == "error")
+
+
+class AuditMixin(object):
+    """Record the mutations of a model view in the audit trail.
+
+    Actions are recorded as one ``action:<name>`` event for all selected
+    records, without the events of the records they modify (e.g. the
+    ``delete`` events of the ``delete`` action), and only if they succeed.
+    """
+
+    def _is_recorded(self):
+        """Check if the mutations of a record are recorded."""
+        return is_audited(self) and not g.get("invenio_admin_audit_action")
+
+    def after_model_change(self, form, model, is_created):
+        """Record the created or updated record."""
+        super(AuditMixin, self).after_model_change(form, model, is_created)
+        if self._is_recorded():
+            operation = "create" if is_created else "update"
+            record_event(self, operation, [identity(model)])
+
+    def after_model_delete(self, model):
+        """Record the deleted record."""
+        super(AuditMixin, self).after_model_delete(model)
+        if self._is_recorded():
+            record_event(self, "delete", [identity(model)])
+
+    def handle_action(self, return_view=None):
+        """Record the actions run on the selected records."""
+        if not is_audited(self):
+            return super(AuditMixin, self).handle_action(return_view)
+
+        # Flask-Admin flashes the errors of failed actions.
+        errors = _flashed_errors()
+        g.invenio_admin_audit_action = True
+        try:
+            response = super(AuditMixin, self).handle_action(return_view)
+        finally:
+            g.invenio_admin_audit_action = False
+        name = request.form.get("action")
+        if (
+            name in self._actions_data
+            and self.is_action_allowed(name)
+            and _flashed_errors() == errors
+        ):
+            record_event(self, "action:{0}".format(name), request.form.getlist("rowid"))
+        return response
@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Batched inline edits of admin list views.
+
+Model views with ``can_batch_edit = True`` and a ``column_editable_list``
+queue inline edits in the browser instead of saving every cell on its own.
+The queued edits are sent to ``/admin/<endpoint>/ajax/update_batch/`` in one
+request and applied in a single transaction:
+
+.. code-block:: python
+
+    class HarvestJobModelView(ModelView):
+        column_editable_list = ('status', 'comment')
+        can_batch_edit = True
+
+The request body is a JSON object with the CSRF token of the list form (if
+any) and the edits, one per record:
+
+.. code-block:: json
+
+    {
+        "csrf_token": "...",
+        "edits": [
+            {"pk": "1", "version": 3, "data": {"status": "done"}}
+        ]
+    }
+
+Each edit is validated with the list form of the view. If ``version`` is
+given, it must match the version of the record (see
+:attr:`~invenio_admin.views.ProtectedModelViewMixin.etag_version_attr`),
+otherwise the edit is rejected as the record was modified in the meantime.
+The response lists the new version of the updated records and the error
+message of the rejected edits, keyed by primary key. Its status is ``409``
+if an edit was rejected because of its version, ``422`` if edits were
+rejected for other reasons (e.g. validation errors), and ``200`` otherwise.
+
+.. note::
+
+    Views overriding :meth:`~flask_admin.contrib.sqla.ModelView.update_model`
+    (e.g. for versioning or custom persistence) get each edit applied through
+    their override. As ``update_model`` commits, these edits are saved one
+    record at a time instead of in a single transaction.
+"""
+
+from __future__ import absolute_import, print_function
+
+import logging
+
+from flask import abort, jsonify, request
+from flask_admin.babel import gettext
+from flask_admin.base import expose
+from flask_admin.contrib.sqla import ModelView
+from werkzeug.datastructures import MultiDict
+
+log = logging.getLogger(__name__)
+
+
+class BatchEditMixin(object):
+    """Apply queued inline edits in a single transaction."""
+
+    can_batch_edit = False
+    """Queue inline edits and save them in one request."""
+
+    batch_edit_max_size = 500
+    """Maximum number of edits per request."""
+
+    def get_batch_versions(self, models):
+        """Get the versions of the listed records.
+
+        :param models: Models displayed in the list.
+        :returns: Dictionary of the versions keyed by primary key.
+        """
+        return {
+            str(self.get_pk_value(m)): getattr(m, self.etag_version_attr, None)
+            for m in models
+        }
+
+    def _get_batch_records(self, pks):
+        """Get the edited records keyed by primary key."""
+        if isinstance(self, ModelView) and not isinstance(self._primary_key, tuple):
+            column = getattr(self.model, self._primary_key)
+            query = self.get_query().filter(column.in_(pks))
+            return {str(self.get_pk_value(m)): m for m in query}
+        records = {}
+        for pk in pks:
+            model = self.get_one(pk)
+            if model is not None:
+                records[pk] = model
+        return records
+
+    def _has_custom_update(self):
+        """Check if the view overrides how a record is updated."""
+        update_model = getattr(type(self), "update_model", None)
+        return isinstance(self, ModelView) and update_model is not (
+            ModelView.update_model
+        )
+
+    def _get_batch_form(self, edit, csrf_token):
+        """Get the list form of an edit restricted to the submitted fields."""
+        formdata = MultiDict(edit["data"])
+        formdata["list_form_pk"] = edit["pk"]
+        if csrf_token is not None:
+            formdata["csrf_token"] = csrf_token
+        form = self._list_form_class(formdata)
+        # Prevent validation issues due to submitting only some fields.
+        for field in list(form):
+            if field.name not in formdata:
+                del form[field.name]
+        return form
+
+    @expose("/ajax/update_batch/", methods=("POST",))
+    def ajax_update_batch(self):
+        """Apply a batch of inline edits."""
+        if not self.can_batch_edit or not self.column_editable_list:
+            abort(404)
+
+        payload = request.get_json(silent=True)
+        edits = payload.get("edits") if isinstance(payload, dict) else None
+        if (
+            not isinstance(edits, list)
+            or len(edits) > self.batch_edit_max_size
+            or not all(
+                isinstance(e, dict)
+                and isinstance(e.get("data"), dict)
+                and e.get("pk") is not None
+                for e in edits
+            )
+        ):
+            abort(400)
+        for edit in edits:
+            edit["pk"] = str(edit["pk"])
+
+        errors = {}
+        updated = {}
+        conflicts = False
+        changed = []
+        custom_update = self._has_custom_update()
+        records = self._get_batch_records([e["pk"] for e in edits])
+        for edit in edits:
+            pk = edit["pk"]
+            form = self._get_batch_form(edit, payload.get("csrf_token"))
+            if not self.validate_form(form):
+                errors[pk] = gettext(
+                    "Failed to update record. %(error)s",
+                    error=", ".join(str(e) for field in form for e in field.errors),
+                )
+                continue
+            model = records.get(pk)
+            if model is None:
+                errors[pk] = gettext("Record does not exist.")
+                continue
+            version = edit.get("version")
+            if version is not None and version != getattr(
+                model, self.etag_version_attr, None
+            ):
+                errors[pk] = gettext(
+                    "Record was modified by someone else. Reload and try again."
+                )
+                conflicts = True
+                continue
+            if custom_update:
+                # Committed and post-processed by the override.
+                if self.update_model(form, model):
+                    updated[pk] = getattr(model, self.etag_version_attr, None)
+                else:
+                    errors[pk] = gettext("Failed to update record.")
+                continue
+            try:
+                form.populate_obj(model)
+                self._on_model_change(form, model, False)
+            except Exception as ex:
+                # Discard the partial changes of the record.
+                self.session.expire(model)
+                errors[pk] = gettext("Failed to update record. %(error)s", error=ex)
+                continue
+            changed.append((pk, form, model))
+
+        try:
+            self.session.commit()
+        except Exception as ex:
+            self.session.rollback()
+            if not self.handle_view_exception(ex):
+                log.exception("Failed to update records.")
+            for pk, _, _ in changed:
+                errors[pk] = gettext("Failed to update record. %(error)s", error=ex)
+            changed = []
+
+        for pk, form, model in changed:
+            self.after_model_change(form, model, False)
+            updated[pk] = getattr(model, self.etag_version_attr, None)
+
+        response = jsonify(updated=updated, errors=errors)
+        response.status_code = 409 if conflicts else 422 if errors else 200
+        return response
@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Precompiled admin templates.
+
+Jinja compiles each template on its first render, in every worker process,
+which causes latency spikes after deployments. With
+:data:`invenio_admin.config.ADMIN_TEMPLATE_BYTECODE_CACHE` set to a folder,
+the compiled templates are stored in a bytecode cache shared by all workers
+(and all templates of the application):
+
+.. code-block:: console
+
+    $ flask admin templates
+
+precompiles all templates reachable (through ``extends``, ``include`` and
+``import``) from the templates of the admin views in the active template
+mode, including ``ADMIN_BASE_TEMPLATE``. Set
+:data:`invenio_admin.config.ADMIN_TEMPLATE_PRECOMPILE` to precompile them
+when the application starts instead.
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+
+from flask_admin.model import BaseModelView
+from jinja2 import FileSystemBytecodeCache, TemplateNotFound, meta
+
+_MODEL_TEMPLATES = (
+    "list_template",
+    "edit_template",
+    "create_template",
+    "details_template",
+    "edit_modal_template",
+    "create_modal_template",
+    "details_modal_template",
+)
+
+
+def template_names(admin):
+    """Get the names of the templates used by the admin views.
+
+    :param admin: The Flask-Admin application.
+    :returns: Sorted list of template names.
+    """
+    names = {admin.base_template, "admin/master.html", "admin/index.html"}
+    for view in admin._views:
+        if isinstance(view, BaseModelView):
+            names.update(getattr(view, attr) for attr in _MODEL_TEMPLATES)
+    return sorted(names)
+
+
+def install_bytecode_cache(app, folder=None):
+    """Store the compiled templates of an application in a folder.
+
+    :param app: The Flask application.
+    :param folder: Folder of the cache.
+        (Default: ``ADMIN_TEMPLATE_BYTECODE_CACHE``)
+    :returns: The bytecode cache.
+    """
+    folder = folder or app.config["ADMIN_TEMPLATE_BYTECODE_CACHE"]
+    os.makedirs(folder, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(folder)
+    # Templates already loaded (e.g. by the warmup) must be compiled again
+    # to be stored in the new cache.
+    if app.jinja_env.cache is not None:
+        app.jinja_env.cache.clear()
+    return app.jinja_env.bytecode_cache
+
+
+def referenced_templates(env, name):
+    """Get the names of the templates referenced by a template.
+
+    :param env: The Jinja environment.
+    :param name: Name of the template.
+    :returns: Set of names; dynamic references are ignored.
+    """
+    source, _, _ = env.loader.get_source(env, name)
+    ast = env.parse(source, name)
+    return {n for n in meta.find_referenced_templates(ast) if n is not None}
+
+
+def reachable_templates(app, admin):
+    """Get the admin templates and the templates they reference.
+
+    :param app: The Flask application.
+    :param admin: The Flask-Admin application.
+    :returns: Sorted list of template names.
+    """
+    names = set(template_names(admin))
+    if app.config.get("ADMIN_BASE_TEMPLATE"):
+        names.add(app.config["ADMIN_BASE_TEMPLATE"])
+    if "invenio_admin" in app.blueprints:
+        names.add("invenio_admin/model/list.html")
+
+    env = app.jinja_env
+    found, pending = set(), sorted(names)
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+        try:
+            references = referenced_templates(env, name)
+        except TemplateNotFound:
+            app.logger.warning("Admin template %s not found.", name)
+            continue
+        found.add(name)
+        pending.extend(references - found)
+    return sorted(found)
+
+
+def precompile_templates(app, admin):
+    """Compile the admin templates into the bytecode cache.
+
+    :param app: The Flask application.
+    :param admin: The Flask-Admin application.
+    :returns: Sorted list of the compiled template names.
+    """
+    names = reachable_templates(app, admin)
+    for name in names:
+        app.jinja_env.get_template(name)
+    return names
@@ -0,0 +1,330 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Caching utilities for Invenio-Admin.
+
+Expensive pages of custom admin views can be cached with
+:func:`cached_view`:
+
+.. code-block:: python
+
+    from flask_admin.base import BaseView, expose
+    from invenio_admin.cache import cached_view
+
+    class DinerStats(BaseView):
+        @expose('/')
+        @cached_view(timeout=600)
+        def index(self):
+            return self.render('invenio_diner/stats.html', ...)
+
+The rendered output is cached per endpoint, view arguments and permission
+key (the needs provided by the current identity), so users with different
+permissions never share a cached page. Cached pages are purged with
+:func:`purge_fragments`, or from the admin interface with the
+:class:`invenio_admin.admin.CacheView` view.
+
+All caches of Invenio-Admin go through :class:`AdminCache`, available as
+``current_admin.cache``. It stores the entries in the backend created by
+:data:`invenio_admin.config.ADMIN_CACHE_BACKEND` under namespaced keys
+(``<prefix>:<namespace>:<generation>:<hash>``), with expirations configured
+by namespace in :data:`invenio_admin.config.ADMIN_CACHE_TIMEOUTS`:
+
+.. code-block:: python
+
+    cache = current_admin.cache
+    cache.set('diner-stats', ('daily', day), stats, timeout=3600)
+    cache.get('diner-stats', ('daily', day))
+    cache.invalidate('diner-stats')
+
+Namespaces are invalidated for all processes sharing the backend. The
+default backend is the cache of Invenio-Cache (e.g. Redis) when it is
+installed, and an in-process LRU cache otherwise.
+
+.. warning::
+
+    With the in-process cache, each process has its own entries and
+    generations: invalidations (e.g. after a commit, see
+    :mod:`invenio_admin.pkcache`) only reach the process making them, and
+    the other workers serve their entries until they expire. Install
+    Invenio-Cache, or set :data:`invenio_admin.config.ADMIN_CACHE_BACKEND`
+    to a shared backend, when running several workers.
+
+The namespaces in :data:`REGISTRY_NAMESPACES` are invalidated whenever a
+view is registered after the cache was first used.
+"""
+
+from __future__ import absolute_import, print_function
+
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import wraps
+
+from flask import g, request, session
+from werkzeug.utils import import_string
+
+from .proxies import current_admin
+
+
+class LRUCache(object):
+    """In-process least recently used cache with expiration."""
+
+    def __init__(self, maxsize=1024):
+        """Initialize the cache.
+
+        :param maxsize: Maximum number of entries kept in the cache.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Get a value from the cache.
+
+        :param key: Cache key.
+        :returns: The cached value or ``None`` if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires is not None and expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        """Set a value in the cache.
+
+        :param key: Cache key.
+        :param value: Value to cache.
+        :param timeout: Expiration in seconds. (Default: never expire)
+        """
+        expires = time.monotonic() + timeout if timeout else None
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return True
+
+    def delete(self, key):
+        """Delete a value from the cache.
+
+        :param key: Cache key.
+        """
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+
+def lru_cache_factory(app):
+    """Create an in-process LRU cache.
+
+    :param app: The Flask application.
+    :returns: A :class:`LRUCache` instance.
+    """
+    return LRUCache(maxsize=app.config["ADMIN_CACHE_LRU_MAXSIZE"])
+
+
+def invenio_cache_factory(app):
+    """Use the cache of Invenio-Cache (e.g. Redis) shared across processes.
+
+    :param app: The Flask application.
+    :returns: The Flask-Caching cache instance of Invenio-Cache.
+    """
+    return app.extensions["invenio-cache"].cache
+
+
+def default_cache_factory(app):
+    """Use Invenio-Cache if it is installed, otherwise an in-process cache.
+
+    The in-process cache is not shared by the workers of the application,
+    so its invalidations only apply to the current process.
+
+    :param app: The Flask application.
+    :returns: Cache instance.
+    """
+    if "invenio-cache" in app.extensions:
+        return invenio_cache_factory(app)
+    return lru_cache_factory(app)
+
+
+def permission_key():
+    """Compute a key identifying the permissions of the current identity.
+
+    :returns: Hash of the needs provided by the current identity.
+    """
+    identity = getattr(g, "identity", None)
+    needs = sorted(repr(n) for n in identity.provides) if identity else []
+    return hashlib.sha1("|".join(needs).encode("utf-8")).hexdigest()
+
+
+REGISTRY_NAMESPACES = ("fragments",)
+"""Namespaces invalidated when the registry of admin views changes."""
+
+
+class AdminCache(object):
+    """Namespaced cache of Invenio-Admin on top of a cache backend.
+
+    Each namespace has a generation token stored in the backend and part of
+    all its keys. Invalidating a namespace replaces the token, so with a
+    backend shared across processes (e.g. Redis through Invenio-Cache) the
+    invalidation is seen by all workers at once. With an in-process backend,
+    it is only seen by the current process.
+    """
+
+    def __init__(self, backend, prefix="invenio_admin", timeouts=None, timeout=300):
+        """Initialize the cache.
+
+        :param backend: Backend with ``get``, ``set`` and ``delete`` methods
+            (e.g. :class:`LRUCache` or a Flask-Caching cache).
+        :param prefix: Prefix of all keys.
+        :param timeouts: Expiration in seconds by namespace.
+        :param timeout: Expiration in seconds of the other namespaces.
+        """
+        self.backend = backend
+        self.prefix = prefix
+        self.timeouts = timeouts or {}
+        self.timeout = timeout
+
+    @property
+    def shared(self):
+        """Whether the backend is shared across processes."""
+        return not isinstance(self.backend, LRUCache)
+
+    def _generation_key(self, namespace):
+        """Get the key of the generation of a namespace."""
+        return "{0}:{1}:generation".format(self.prefix, namespace)
+
+    def generation(self, namespace):
+        """Get the current generation of a namespace.
+
+        :param namespace: Name of the namespace.
+        :returns: Generation token.
+        """
+        key = self._generation_key(namespace)
+        generation = self.backend.get(key)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            self.backend.set(key, generation, timeout=0)
+        return generation
+
+    def key(self, namespace, key):
+        """Get the backend key of a cache entry.
+
+        :param namespace: Name of the namespace.
+        :param key: Key of the entry, any value with a stable ``repr``.
+        :returns: Backend key.
+        """
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return "{0}:{1}:{2}:{3}".format(
+            self.prefix, namespace, self.generation(namespace), digest
+        )
+
+    def get(self, namespace, key):
+        """Get a value from the cache.
+
+        :param namespace: Name of the namespace.
+        :param key: Key of the entry.
+        :returns: The cached value or ``None``.
+        """
+        return self.backend.get(self.key(namespace, key))
+
+    def set(self, namespace, key, value, timeout=None):
+        """Set a value in the cache.
+
+        :param namespace: Name of the namespace.
+        :param key: Key of the entry.
+        :param value: Value to cache.
+        :param timeout: Expiration in seconds. (Default: the expiration of
+            the namespace)
+        """
+        if timeout is None:
+            timeout = self.timeouts.get(namespace, self.timeout)
+        return self.backend.set(self.key(namespace, key), value, timeout=timeout)
+
+    def delete(self, namespace, key):
+        """Delete a value from the cache.
+
+        :param namespace: Name of the namespace.
+        :param key: Key of the entry.
+        """
+        return self.backend.delete(self.key(namespace, key))
+
+    def invalidate(self, *namespaces):
+        """Invalidate all entries of namespaces.
+
+        The invalidation applies to all processes sharing the backend.
+
+        :param namespaces: Names of the namespaces.
+        """
+        for namespace in namespaces:
+            self.backend.set(
+                self._generation_key(namespace), uuid.uuid4().hex, timeout=0
+            )
+
+
+def admin_cache_factory(app):
+    """Create the cache of Invenio-Admin.
+
+    :param app: The Flask application.
+    :returns: An :class:`AdminCache` using the backend created by
+        :data:`invenio_admin.config.ADMIN_CACHE_BACKEND`.
+    """
+    return AdminCache(
+        import_string(app.config["ADMIN_CACHE_BACKEND"])(app),
+        prefix=app.config["ADMIN_CACHE_KEY_PREFIX"],
+        timeouts=app.config["ADMIN_CACHE_TIMEOUTS"],
+        timeout=app.config["ADMIN_CACHE_DEFAULT_TIMEOUT"],
+    )
+
+
+def purge_fragments():
+    """Invalidate all pages cached with :func:`cached_view`."""
+    current_admin.cache.invalidate("fragments")
+
+
+def cached_view(timeout=None):
+    """Cache the rendered output of an admin view method.
+
+    The decorator can be combined with
+    :func:`flask_admin.base.expose` in any order. Only ``GET`` requests
+    rendering a string (e.g. :meth:`flask_admin.base.BaseView.render`) are
+    cached.
+
+    :param timeout: Expiration of cached output in seconds. (Default: the
+        expiration of the ``fragments`` namespace)
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def inner(self, *args, **kwargs):
+            # Pages rendering flashed messages must not be cached.
+            if request.method != "GET" or "_flashes" in session:
+                return f(self, *args, **kwargs)
+
+            cache = current_admin.cache
+            key = (
+                self.endpoint,
+                f.__name__,
+                args,
+                sorted(kwargs.items()),
+                sorted(request.args.items(multi=True)),
+                permission_key(),
+            )
+            cached = cache.get("fragments", key)
+            if cached is not None:
+                return cached
+
+            rv = f(self, *args, **kwargs)
+            if isinstance(rv, str):
+                cache.set("fragments", key, rv, timeout=timeout)
+            return rv
+
+        return inner
+
+    return decorator
@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Command line interface for Invenio-Admin."""
+
+from __future__ import absolute_import, print_function
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from .advisor import audit_views
+from .assets import build_assets
+from .bytecode import install_bytecode_cache
+from .dashboard import refresh_stats
+from .manifest import write_manifest
+from .proxies import current_admin
+
+
+def _enabled_admin():
+    """Get the state of the admin interface, if enabled in this process."""
+    state = current_admin._get_current_object()
+    if not state.enabled:
+        raise click.UsageError("The admin interface is disabled (ADMIN_ENABLED).")
+    return state
+
+
+@click.group()
+def admin():
+    """Administration interface commands."""
+
+
+@admin.command("manifest")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Path of the manifest (default: ADMIN_ENTRY_POINTS_MANIFEST).",
+)
+@with_appcontext
+def manifest(output):
+    """Write the manifest of the admin views entry points."""
+    output = output or current_app.config["ADMIN_ENTRY_POINTS_MANIFEST"]
+    if not output:
+        raise click.UsageError(
+            "Provide --output or set ADMIN_ENTRY_POINTS_MANIFEST.",
+        )
+    result = write_manifest(output, _enabled_admin().entry_point_group)
+    click.secho(
+        "Wrote {0} entry points to {1}.".format(len(result["entry_points"]), output),
+        fg="green",
+    )
+
+
+@admin.command("warmup")
+@with_appcontext
+def warmup():
+    """Warm up the admin interface and report the memory used."""
+    report = _enabled_admin().warmup()
+    click.echo("Views: {0}".format(report["views"]))
+    click.echo("Templates: {0}".format(", ".join(report["templates"])))
+    if report["uss_before"] is not None:
+        click.echo(
+            "Unique memory: {0} -> {1} bytes".format(
+                report["uss_before"], report["uss_after"]
+            )
+        )
+
+
+@admin.command("assets")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(file_okay=False, writable=True),
+    help="Output folder (default: ADMIN_STATIC_ASSETS_FOLDER).",
+)
+@with_appcontext
+def assets(output):
+    """Build the fingerprinted and compressed admin static files."""
+    output = output or current_app.config["ADMIN_STATIC_ASSETS_FOLDER"]
+    if not output:
+        raise click.UsageError(
+            "Provide --output or set ADMIN_STATIC_ASSETS_FOLDER.",
+        )
+    result = build_assets(output, current_app.config["ADMIN_TEMPLATE_MODE"])
+    click.secho(
+        "Wrote {0} static files to {1}.".format(len(result), output), fg="green"
+    )
+
+
+@admin.command("templates")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(file_okay=False, writable=True),
+    help="Folder of the cache (default: ADMIN_TEMPLATE_BYTECODE_CACHE).",
+)
+@with_appcontext
+def templates(output):
+    """Precompile the admin templates into the bytecode cache."""
+    output = output or current_app.config["ADMIN_TEMPLATE_BYTECODE_CACHE"]
+    if not output:
+        raise click.UsageError(
+            "Provide --output or set ADMIN_TEMPLATE_BYTECODE_CACHE.",
+        )
+    state = _enabled_admin()
+    install_bytecode_cache(current_app, output)
+    names = state.precompile_templates()
+    click.secho(
+        "Compiled {0} templates into {1}.".format(len(names), output), fg="green"
+    )
+
+
+@admin.command("dashboard")
+@with_appcontext
+def dashboard():
+    """Refresh the statistics of the admin dashboard."""
+    stats = refresh_stats(_enabled_admin())
+    for panel in stats["panels"]:
+        click.echo(panel.title)
+        for stat in panel.stats:
+            click.echo(
+                "  {0}: {1}{2}".format(
+                    stat.label, "~" if stat.approximate else "", stat.value
+                )
+            )
+
+
+@admin.command("indexes")
+@with_appcontext
+def indexes():
+    """Report the view columns sorted, filtered or searched without index."""
+    findings = audit_views(_enabled_admin().admin._views)
+    for f in findings:
+        click.echo(
+            "{0}: {1} on {2}.{3} ({4} rows)".format(
+                f.endpoint,
+                f.usage,
+                f.table,
+                f.column,
+                "unknown" if f.rows is None else int(f.rows),
+            )
+        )
+    click.secho(
+        "{0} columns without index.".format(len(findings)),
+        fg="yellow" if findings else "green",
+    )
@@ -3,6 +3,13 @@
 
 """Configuration for Invenio-Admin."""
 
+ADMIN_ENABLED = True
+"""Build the admin interface in this process.
+
+Set it to ``False`` (e.g. with the ``INVENIO_ADMIN_ENABLED`` environment
+variable) in API-only and Celery processes: the admin views, their menu
+entries and the Flask-Admin application are then not created at all."""
+
 ADMIN_BASE_TEMPLATE = None
 """Admin panel base template.
 By default (``None``) uses the Flask-Admin template."""
@@ -22,3 +29,203 @@ ADMIN_TEMPLATE_MODE = "bootstrap3"
 
 ADMIN_PERMISSION_FACTORY = "invenio_admin.permissions.admin_permission_factory"
 """Permission factory for the admin views."""
+
+ADMIN_CONDITIONAL_REQUESTS = False
+"""Answer conditional requests on the detail and edit views of model views.
+
+The ETag and Last-Modified headers are computed from the ``version_id`` and
+``updated`` attributes of the displayed record. The edit forms carry the ETag
+in a hidden field, so saving an outdated version is rejected."""
+
+ADMIN_AUDIT_ENABLED = False
+"""Record the mutations of the protected model views in an audit trail.
+
+See :mod:`invenio_admin.audit`."""
+
+ADMIN_AUDIT_SINK = "invenio_admin.audit.file_sink_factory"
+"""Factory creating the sink of the audit events, called with the Flask
+application. Use :func:`invenio_admin.audit.database_sink_factory` to insert
+them into the table of ``ADMIN_AUDIT_MODEL``."""
+
+ADMIN_AUDIT_FILE = None
+"""File of the audit events (JSON lines).
+
+By default (``None``) ``admin_audit.jsonl`` in the instance folder."""
+
+ADMIN_AUDIT_MODEL = None
+"""Import path of the model storing the audit events in the database."""
+
+ADMIN_AUDIT_QUEUE_SIZE = 10000
+"""Maximum number of audit events waiting to be written."""
+
+ADMIN_AUDIT_BATCH_SIZE = 500
+"""Maximum number of audit events written at once."""
+
+ADMIN_AUDIT_FLUSH_INTERVAL = 1.0
+"""Maximum delay in seconds before an audit event is written."""
+
+ADMIN_AUDIT_PUT_TIMEOUT = 1.0
+"""Seconds a request waits for space in a full audit queue before dropping
+its event."""
+
+ADMIN_CACHE_BACKEND = "invenio_admin.cache.default_cache_factory"
+"""Factory creating the cache backend, called with the Flask application.
+
+By default Invenio-Cache (e.g. Redis) is used when it is installed, otherwise
+an in-process LRU cache (:func:`invenio_admin.cache.lru_cache_factory`).
+
+The in-process cache is not shared by the workers: cached entries are only
+invalidated in the process committing the changes, and other workers serve
+theirs until they expire. Use a shared backend with several workers."""
+
+ADMIN_CACHE_LRU_MAXSIZE = 1024
+"""Maximum number of entries of the in-process LRU cache."""
+
+ADMIN_CACHE_DEFAULT_TIMEOUT = 300
+"""Default expiration in seconds of the entries of the admin cache."""
+
+ADMIN_CACHE_TIMEOUTS = {}
+"""Expiration in seconds of the entries of the admin cache by namespace.
+
+For instance ``{'fragments': 600}`` for pages cached with
+:func:`invenio_admin.cache.cached_view`."""
+
+ADMIN_CACHE_KEY_PREFIX = "invenio_admin"
+"""Prefix of the keys of the admin cache in the backend."""
+
+ADMIN_ENTRY_POINTS_MANIFEST = None
+"""Path of the manifest of the admin views entry points.
+
+When set and up to date, the entry points are loaded from the manifest instead
+of scanning the metadata of all installed distributions. The manifest is
+written with ``invenio admin manifest``."""
+
+ADMIN_WARMUP = False
+"""Warm up the admin interface when the application is finalized.
+
+Useful with preforking servers loading the application before forking the
+workers (see :mod:`invenio_admin.warmup`)."""
+
+ADMIN_WARMUP_GC_FREEZE = False
+"""Freeze the garbage collector after warming up the admin interface.
+
+Affects the whole application: all objects allocated so far are never
+collected. Prefer calling :func:`gc.freeze` in the pre-fork hook of the
+server (see :mod:`invenio_admin.warmup`)."""
+
+ADMIN_WARMUP_REPORT = False
+"""Log the unique memory allocated by admin requests in each worker."""
+
+ADMIN_ENTRY_POINTS_ALLOWLIST = None
+"""Names of the admin views entry points loaded in this process.
+
+Shell-style patterns (e.g. ``['invenio_records*']``) matched against the
+entry point names. By default (``None``) all entry points are loaded."""
+
+ADMIN_ENTRY_POINTS_DENYLIST = []
+"""Names of the admin views entry points not loaded in this process.
+
+Shell-style patterns matched against the entry point names. The modules of
+the skipped entry points are not imported."""
+
+ADMIN_ENTRY_POINTS_WORKERS = None
+"""Number of threads importing the admin views entry points.
+
+By default (``None``) the entry points are loaded one after another. The views
+are always registered in the order of the entry points."""
+
+ADMIN_API_ENABLED = False
+"""Expose a read-only JSON API for each protected model view.
+
+See :mod:`invenio_admin.api`."""
+
+ADMIN_API_MAX_PAGE_SIZE = 1000
+"""Maximum number of records per page of the JSON API."""
+
+ADMIN_STREAM_TIMEOUT = 30
+"""Seconds after which live update streams are closed.
+
+Browsers automatically reconnect and resume from the last received record.
+Each open stream holds a server worker until it is closed, so keep it short
+with synchronous workers (see :mod:`invenio_admin.stream`)."""
+
+ADMIN_QUERY_INSPECTOR_ENABLED = False
+"""Enable the query inspector of the admin list views.
+
+See :mod:`invenio_admin.explain`."""
+
+ADMIN_QUERY_INSPECTOR_PERMISSION_FACTORY = (
+    "invenio_admin.permissions.superuser_permission_factory"
+)
+"""Permission factory restricting access to the query inspector."""
+
+ADMIN_FACETS_SAMPLE_THRESHOLD = 1000000
+"""Estimated number of rows above which facet counts are approximated.
+
+The counts are then computed on a sample of about this many rows (PostgreSQL
+only). ``None`` disables the approximation. See :mod:`invenio_admin.facets`."""
+
+ADMIN_INDEX_ADVISOR = False
+"""Log the sort, filter and search columns without an index on startup.
+
+See :mod:`invenio_admin.advisor`."""
+
+ADMIN_INDEX_ADVISOR_HIDE_SORTS_THRESHOLD = None
+"""Estimated number of rows above which unindexed sorts are removed.
+
+Disabled by default (``None``). Only PostgreSQL tables have estimates."""
+
+ADMIN_SLOW_REQUEST_THRESHOLD = None
+"""Log admin requests taking longer than this number of seconds.
+
+Disabled by default (``None``). See :mod:`invenio_admin.slowlog`."""
+
+ADMIN_SLOW_REQUEST_TOP_N = 5
+"""Number of slowest SQL statements reported per slow admin request."""
+
+ADMIN_STATIC_ASSETS_FOLDER = None
+"""Folder of the fingerprinted static files built by ``flask admin assets``.
+
+Disabled by default (``None``). The files are only served at
+``ADMIN_STATIC_ASSETS_URL`` if it is set when the extension is initialized.
+See :mod:`invenio_admin.assets`."""
+
+ADMIN_STATIC_ASSETS_URL = "/admin/assets"
+"""URL path serving the fingerprinted static files."""
+
+ADMIN_STATIC_ASSETS_MAX_AGE = 31536000
+"""Cache lifetime of the fingerprinted static files in seconds."""
+
+ADMIN_TEMPLATE_BYTECODE_CACHE = None
+"""Folder of the Jinja bytecode cache shared by the workers.
+
+Disabled by default (``None``). See :mod:`invenio_admin.bytecode`."""
+
+ADMIN_TEMPLATE_PRECOMPILE = False
+"""Compile the admin templates when the application is finalized."""
+
+ADMIN_DASHBOARD_PROVIDERS = [
+    "invenio_admin.dashboard.model_counts",
+    "invenio_admin.dashboard.recent_activity",
+    "invenio_admin.dashboard.queue_sizes",
+]
+"""Providers of the statistics of the dashboard index view.
+
+See :mod:`invenio_admin.dashboard`."""
+
+ADMIN_DASHBOARD_CACHE_TIMEOUT = 900
+"""Age in seconds after which the cached dashboard statistics are refreshed.
+
+Should be longer than the interval of the scheduled
+:func:`invenio_admin.tasks.refresh_dashboard` task. Outdated statistics are
+shown while they are refreshed in the background (see
+:func:`invenio_admin.dashboard.schedule_refresh`)."""
+
+ADMIN_DASHBOARD_ESTIMATE_THRESHOLD = 1000000
+"""Estimated number of rows above which the dashboard shows the estimate
+instead of counting the rows of a model.
+
+``None`` always counts the rows. Only PostgreSQL tables have estimates."""
+
+ADMIN_DASHBOARD_ACTIVITY_HOURS = 24
+"""Period in hours of the recent activity shown on the dashboard."""
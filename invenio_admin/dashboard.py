@@ -0,0 +1,267 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Dashboard index view of the admin interface.
+
+:class:`DashboardIndexView` shows statistics on the landing page of the
+admin interface:
+
+.. code-block:: python
+
+    from invenio_admin import InvenioAdmin
+    from invenio_admin.dashboard import DashboardIndexView
+
+    InvenioAdmin(app, index_view_class=DashboardIndexView)
+
+The statistics are computed by the providers listed in
+:data:`invenio_admin.config.ADMIN_DASHBOARD_PROVIDERS` and stored in the
+``dashboard`` namespace of the admin cache, so rendering the page does not
+query the database. They are refreshed in the background by the Celery task
+:func:`invenio_admin.tasks.refresh_dashboard`, e.g. every five minutes:
+
+.. code-block:: python
+
+    CELERY_BEAT_SCHEDULE = {
+        'admin-dashboard': {
+            'task': 'invenio_admin.tasks.refresh_dashboard',
+            'schedule': timedelta(minutes=5),
+        },
+    }
+
+or with ``flask admin dashboard``. Statistics older than
+:data:`invenio_admin.config.ADMIN_DASHBOARD_CACHE_TIMEOUT` seconds are still
+shown while they are refreshed in the background (see
+:func:`schedule_refresh`), so a page view only queries the database when no
+statistics were computed yet.
+
+On PostgreSQL, models estimated larger than
+:data:`invenio_admin.config.ADMIN_DASHBOARD_ESTIMATE_THRESHOLD` rows are not
+counted: the estimate of the database statistics is shown instead.
+
+.. note::
+
+    The task refreshes the statistics for the web workers only with a cache
+    backend shared across processes (e.g. Invenio-Cache, see
+    :data:`invenio_admin.config.ADMIN_CACHE_BACKEND`). With the in-process
+    cache, each web worker computes its own statistics in a thread.
+
+A provider is called with the :class:`invenio_admin.ext._AdminState` and
+returns a :class:`Panel` (or ``None`` to show nothing):
+
+.. code-block:: python
+
+    def open_orders(state):
+        return Panel('Orders', [Stat('Open', Order.query.count())])
+"""
+
+from __future__ import absolute_import, print_function
+
+import threading
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+from flask_admin import AdminIndexView, expose
+from invenio_db import db
+from invenio_i18n import lazy_gettext as _
+from sqlalchemy import func, select
+from werkzeug.utils import import_string
+
+from .facets import estimate_rows
+from .proxies import current_admin
+
+Panel = namedtuple("Panel", ("title", "stats"))
+"""Group of statistics shown on the dashboard."""
+
+Stat = namedtuple(
+    "Stat", ("label", "value", "endpoint", "approximate"), defaults=(None, False)
+)
+"""Statistic, linked to the admin view with the given endpoint if any."""
+
+
+def _model_views(state):
+    """Get the first registered view of each model."""
+    return [state.get_views_by_model(model)[0] for model in state.get_models()]
+
+
+def model_counts(state):
+    """Count the rows of each model with a registered view.
+
+    Tables estimated larger than
+    :data:`invenio_admin.config.ADMIN_DASHBOARD_ESTIMATE_THRESHOLD` rows are
+    not counted, their estimate is returned as an approximate statistic.
+
+    :param state: The :class:`invenio_admin.ext._AdminState`.
+    :returns: A :class:`Panel`.
+    """
+    threshold = state.app.config["ADMIN_DASHBOARD_ESTIMATE_THRESHOLD"]
+    stats = []
+    for view in _model_views(state):
+        table = view.model.__table__
+        estimate = estimate_rows(db.session, table) if threshold else None
+        if estimate is not None and estimate > threshold:
+            stats.append(Stat(str(view.name), int(estimate), view.endpoint, True))
+            continue
+        count = db.session.execute(select(func.count()).select_from(table)).scalar()
+        stats.append(Stat(str(view.name), count, view.endpoint))
+    return Panel(_("Records"), stats)
+
+
+def recent_activity(state):
+    """Count the rows of each model updated recently.
+
+    Only models with an ``updated`` column are counted, over the last
+    :data:`invenio_admin.config.ADMIN_DASHBOARD_ACTIVITY_HOURS`.
+
+    :param state: The :class:`invenio_admin.ext._AdminState`.
+    :returns: A :class:`Panel`.
+    """
+    hours = state.app.config["ADMIN_DASHBOARD_ACTIVITY_HOURS"]
+    since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=hours)
+    stats = []
+    for view in _model_views(state):
+        updated = getattr(view.model, "updated", None)
+        if updated is None:
+            continue
+        count = db.session.execute(
+            select(func.count()).select_from(view.model).where(updated >= since)
+        ).scalar()
+        stats.append(Stat(str(view.name), count, view.endpoint))
+    return Panel(_("Updated in the last %(hours)s hours", hours=hours), stats)
+
+
+def queue_sizes(state):
+    """Count the pending messages of the Celery queues.
+
+    :param state: The :class:`invenio_admin.ext._AdminState`.
+    :returns: A :class:`Panel`, or ``None`` without Invenio-Celery.
+    """
+    ext = state.app.extensions.get("invenio-celery")
+    if ext is None:
+        return None
+    celery = ext.celery
+    names = sorted(celery.amqp.queues) or [celery.conf.task_default_queue]
+    stats = []
+    with celery.connection_or_acquire() as conn:
+        channel = conn.default_channel
+        for name in names:
+            declared = channel.queue_declare(queue=name, passive=True)
+            stats.append(Stat(name, declared.message_count))
+    return Panel(_("Queues"), stats)
+
+
+def load_providers(app):
+    """Get the dashboard providers of an application.
+
+    :param app: The Flask application.
+    :returns: List of providers.
+    """
+    return [
+        import_string(p) if isinstance(p, str) else p
+        for p in app.config["ADMIN_DASHBOARD_PROVIDERS"]
+    ]
+
+
+def refresh_stats(state):
+    """Compute the dashboard statistics and store them in the cache.
+
+    A failing provider is logged and skipped.
+
+    :param state: The :class:`invenio_admin.ext._AdminState`.
+    :returns: Dictionary with the ``panels`` and the ``refreshed`` time.
+    """
+    panels = []
+    for provider in load_providers(state.app):
+        try:
+            panel = provider(state)
+        except Exception:
+            state.app.logger.exception("Admin dashboard provider %r failed.", provider)
+            db.session.rollback()
+            continue
+        if panel is not None:
+            panels.append(panel)
+    stats = {"panels": panels, "refreshed": datetime.now(timezone.utc)}
+    # Outdated statistics are still shown while they are refreshed.
+    state.cache.set("dashboard", "stats", stats, timeout=0)
+    state.cache.delete("dashboard", "scheduled")
+    return stats
+
+
+def _refresh_in_thread(state):
+    """Refresh the dashboard statistics in a background thread."""
+    with state.app.app_context():
+        refresh_stats(state)
+
+
+def schedule_refresh(state):
+    """Refresh the dashboard statistics in the background.
+
+    The :func:`invenio_admin.tasks.refresh_dashboard` task is queued with
+    Invenio-Celery and a cache backend shared with the Celery workers,
+    otherwise the statistics are refreshed in a thread of this process. A
+    refresh is scheduled at most once per
+    :data:`invenio_admin.config.ADMIN_DASHBOARD_CACHE_TIMEOUT`.
+
+    :param state: The :class:`invenio_admin.ext._AdminState`.
+    """
+    if state.cache.get("dashboard", "scheduled") is not None:
+        return
+    state.cache.set(
+        "dashboard",
+        "scheduled",
+        True,
+        timeout=state.app.config["ADMIN_DASHBOARD_CACHE_TIMEOUT"],
+    )
+    if "invenio-celery" in state.app.extensions and state.cache.shared:
+        from .tasks import refresh_dashboard
+
+        refresh_dashboard.delay()
+    else:
+        threading.Thread(target=_refresh_in_thread, args=(state,), daemon=True).start()
+
+
+def get_stats(state):
+    """Get the dashboard statistics.
+
+    Outdated statistics are returned while a refresh is scheduled with
+    :func:`schedule_refresh`. They are only computed immediately if there are
+    none yet.
+
+    :param state: The :class:`invenio_admin.ext._AdminState`.
+    :returns: Dictionary with the ``panels`` and the ``refreshed`` time.
+    """
+    stats = state.cache.get("dashboard", "stats")
+    if stats is None:
+        return refresh_stats(state)
+    timeout = timedelta(seconds=state.app.config["ADMIN_DASHBOARD_CACHE_TIMEOUT"])
+    if datetime.now(timezone.utc) - stats["refreshed"] > timeout:
+        schedule_refresh(state)
+    return stats
+
+
+class DashboardIndexView(AdminIndexView):
+    """Index view showing the cached dashboard statistics."""
+
+    def is_visible_stat(self, stat):
+        """Check if the current user can access the view of a statistic.
+
+        :param stat: The :class:`Stat`.
+        """
+        if stat.endpoint is None:
+            return True
+        view = current_admin.get_view(stat.endpoint)
+        return view is not None and view.is_accessible()
+
+    @expose("/")
+    def index(self):
+        """Dashboard page."""
+        stats = get_stats(current_app.extensions["invenio-admin"])
+        panels = [
+            Panel(p.title, [s for s in p.stats if self.is_visible_stat(s)])
+            for p in stats["panels"]
+        ]
+        return self.render(
+            "invenio_admin/dashboard.html",
+            panels=[p for p in panels if p.stats],
+            refreshed=stats["refreshed"],
+        )
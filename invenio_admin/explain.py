@@ -0,0 +1,282 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Query inspector of the admin list views.
+
+When :data:`invenio_admin.config.ADMIN_QUERY_INSPECTOR_ENABLED` is set,
+protected SQLAlchemy model views expose ``/admin/<endpoint>/explain/``,
+restricted by
+:data:`invenio_admin.config.ADMIN_QUERY_INSPECTOR_PERMISSION_FACTORY` (by
+default to superusers). Given the arguments of the list view (filters,
+search, sort and page), it shows the SQL query built by Flask-Admin, its
+execution plan (``EXPLAIN (ANALYZE, BUFFERS)`` on PostgreSQL) with estimated
+and actual rows, and the filters on columns without an index.
+"""
+
+from __future__ import absolute_import, print_function
+
+import json
+
+from flask import abort, current_app
+from flask_admin.base import expose
+from flask_admin.contrib.sqla import ModelView
+from flask_admin.contrib.sqla.filters import BaseSQLAFilter
+from sqlalchemy import UniqueConstraint
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from werkzeug.utils import import_string
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN`` statement of a query."""
+
+    inherit_cache = False
+
+    def __init__(self, statement, analyze=False):
+        """Initialize the statement.
+
+        :param statement: The statement to explain.
+        :param analyze: Execute the statement to get actual row counts.
+        """
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(Explain, "postgresql")
+def _explain_postgresql(element, compiler, **kwargs):
+    """Compile an ``EXPLAIN`` statement for PostgreSQL."""
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if element.analyze else "FORMAT JSON"
+    return "EXPLAIN ({0}) {1}".format(
+        options, compiler.process(element.statement, **kwargs)
+    )
+
+
+@compiles(Explain, "sqlite")
+def _explain_sqlite(element, compiler, **kwargs):
+    """Compile an ``EXPLAIN`` statement for SQLite."""
+    return "EXPLAIN QUERY PLAN " + compiler.process(element.statement, **kwargs)
+
+
+@compiles(Explain)
+def _explain_default(element, compiler, **kwargs):
+    """Compile an ``EXPLAIN`` statement for other databases."""
+    return "EXPLAIN " + compiler.process(element.statement, **kwargs)
+
+
+def indexed_columns(table):
+    """Get the names of the columns leading an index of a table.
+
+    Only the first column of an index can be used to filter or sort on a
+    single column.
+
+    :param table: SQLAlchemy table.
+    :returns: Set of column names.
+    """
+    names = set()
+    if table.primary_key.columns:
+        names.add(list(table.primary_key.columns)[0].name)
+    for index in table.indexes:
+        columns = list(index.columns)
+        if columns:
+            names.add(columns[0].name)
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and constraint.columns:
+            names.add(list(constraint.columns)[0].name)
+    for column in table.columns:
+        if column.index or column.unique:
+            names.add(column.name)
+    return names
+
+
+def is_indexed(column):
+    """Check if a column leads an index of its table.
+
+    :param column: SQLAlchemy column or instrumented attribute.
+    :returns: ``True`` if indexed, ``False`` if not and ``None`` if the column
+        is not a table column (e.g. an expression).
+    """
+    column = getattr(column, "expression", column)
+    table = getattr(column, "table", None)
+    if table is None or not hasattr(table, "indexes"):
+        return None
+    return column.name in indexed_columns(table)
+
+
+def plan_nodes(plan):
+    """Flatten an execution plan into a list of nodes.
+
+    :param plan: Result of :func:`explain`.
+    :returns: List of dictionaries with the node type, relation, index,
+        estimated and actual rows of each node, and whether it scans a whole
+        table to filter it.
+    """
+    nodes = []
+    if plan["format"] == "postgresql":
+
+        def walk(node, depth):
+            nodes.append(
+                {
+                    "depth": depth,
+                    "node": node.get("Node Type"),
+                    "relation": node.get("Relation Name"),
+                    "index": node.get("Index Name"),
+                    "estimated_rows": node.get("Plan Rows"),
+                    "actual_rows": node.get("Actual Rows"),
+                    "full_scan": node.get("Node Type") == "Seq Scan"
+                    and "Filter" in node,
+                    "detail": node.get("Filter"),
+                }
+            )
+            for child in node.get("Plans", []):
+                walk(child, depth + 1)
+
+        for entry in plan["plan"]:
+            walk(entry["Plan"], 0)
+    elif plan["format"] == "sqlite":
+        for row in plan["plan"]:
+            detail = row[-1]
+            nodes.append(
+                {
+                    "depth": 0,
+                    "node": detail.split(" ", 1)[0],
+                    "relation": None,
+                    "index": None,
+                    "estimated_rows": None,
+                    "actual_rows": None,
+                    "full_scan": detail.startswith("SCAN") and "INDEX" not in detail,
+                    "detail": detail,
+                }
+            )
+    else:
+        for row in plan["plan"]:
+            nodes.append({"depth": 0, "detail": " ".join(str(c) for c in row)})
+    return nodes
+
+
+def explain(session, query, analyze=True):
+    """Get the execution plan of a query.
+
+    The statement is explained on a separate connection of the engine of the
+    session, so the pending changes of the session are left untouched. It is
+    executed when analyzing it, within a transaction that is rolled back
+    afterwards.
+
+    :param session: SQLAlchemy session.
+    :param query: SQLAlchemy query object.
+    :param analyze: Execute the query to get actual row counts (PostgreSQL).
+    :returns: Dictionary with the database ``format`` and the raw ``plan``.
+    """
+    bind = session.get_bind()
+    engine = getattr(bind, "engine", bind)
+    dialect = engine.dialect.name
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            result = connection.execute(Explain(query.statement, analyze=analyze))
+            if dialect == "postgresql":
+                plan = result.scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+            else:
+                plan = [tuple(row) for row in result]
+        finally:
+            transaction.rollback()
+    return {"format": dialect, "plan": plan}
+
+
+def compile_sql(session, query):
+    """Compile a query into SQL for display.
+
+    :param session: SQLAlchemy session.
+    :param query: SQLAlchemy query object.
+    :returns: SQL string, with the parameters inlined when possible.
+    """
+    dialect = session.get_bind().dialect
+    try:
+        compiled = query.statement.compile(
+            dialect=dialect, compile_kwargs={"literal_binds": True}
+        )
+    except CompileError:
+        # Some types cannot be rendered as literals.
+        compiled = query.statement.compile(dialect=dialect)
+    return str(compiled)
+
+
+class ExplainMixin(object):
+    """Query inspector endpoint of a model view."""
+
+    def can_inspect_query(self):
+        """Check if the current user can use the query inspector."""
+        if not current_app.config.get("ADMIN_QUERY_INSPECTOR_ENABLED"):
+            return False
+        if not isinstance(self, ModelView):
+            return False
+        factory = import_string(
+            current_app.config["ADMIN_QUERY_INSPECTOR_PERMISSION_FACTORY"]
+        )
+        return factory(self).can()
+
+    def get_filter_report(self, filters, search):
+        """Report which active filters use indexed columns.
+
+        :param filters: List of active filter tuples.
+        :param search: Search query.
+        :returns: List of dictionaries with the ``name`` of the filter or
+            searched column, the ``operation`` and whether it is ``indexed``.
+        """
+        report = []
+        for idx, name, value in filters or []:
+            flt = self._filters[idx]
+            column = flt.column if isinstance(flt, BaseSQLAFilter) else None
+            report.append(
+                {
+                    "name": str(name),
+                    "operation": str(flt.operation()),
+                    "value": value,
+                    "indexed": is_indexed(column) if column is not None else None,
+                }
+            )
+        if search:
+            for field, _ in self._search_fields:
+                # Search casts columns and matches with ILIKE '%term%', which
+                # cannot use B-tree indexes.
+                report.append(
+                    {
+                        "name": str(field.key),
+                        "operation": "ILIKE",
+                        "value": search,
+                        "indexed": False,
+                    }
+                )
+        return report
+
+    @expose("/explain/")
+    def explain_view(self):
+        """Show the query of the list view and its execution plan."""
+        if not self.can_inspect_query():
+            abort(404)
+        view_args = self._get_list_extra_args()
+        sort_column = self._get_column_by_idx(view_args.sort)
+        if sort_column is not None:
+            sort_column = sort_column[0]
+        page_size = view_args.page_size or self.page_size
+        _, query = self.get_list(
+            view_args.page,
+            sort_column,
+            view_args.sort_desc,
+            view_args.search,
+            view_args.filters,
+            execute=False,
+            page_size=page_size,
+        )
+        plan = explain(self.session, query)
+        return self.render(
+            "invenio_admin/explain.html",
+            sql=compile_sql(self.session, query),
+            plan=plan,
+            plan_json=json.dumps(plan["plan"], indent=2, default=str),
+            nodes=plan_nodes(plan),
+            filters=self.get_filter_report(view_args.filters, view_args.search),
+            list_url=self._get_list_url(view_args),
+        )
@@ -8,24 +8,76 @@
 from __future__ import absolute_import, print_function
 
 import warnings
+from fnmatch import fnmatchcase
 
-from flask_admin import Admin, AdminIndexView
-from flask_login import current_user
-from flask_menu import current_menu
 from invenio_base.utils import entry_points
-from invenio_db import db
-from invenio_i18n import lazy_gettext as _
-from invenio_theme.proxies import current_theme_icons
-from werkzeug.utils import import_string
+from werkzeug.utils import cached_property, import_string
 
 from . import config
 from .proxies import current_admin
-from .views import protected_adminview_factory
+
+# NOTE: This module is imported through the ``invenio_base.apps`` entry point
+# by every Invenio process (Celery workers, CLI commands...). Flask-Admin,
+# Flask-Menu, Invenio-DB and the submodules depending on them are imported
+# only when the extension is initialized.
+
+
+class _ViewRecord(object):
+    """Registry record of an admin view."""
+
+    __slots__ = ("view", "endpoint", "model", "category")
+
+    def __init__(self, view):
+        """Initialize the record.
+
+        :param view: The admin view instance.
+        """
+        self.view = view
+        self.endpoint = view.endpoint
+        self.model = getattr(view, "model", None)
+        self.category = view.category
+
+
+class _DisabledAdminState(object):
+    """State for Invenio-Admin disabled with ``ADMIN_ENABLED``.
+
+    No admin interface is built: there are no views and no Flask-Admin
+    application.
+    """
+
+    enabled = False
+    admin = None
+    entry_point_group = None
+
+    def __init__(self, app):
+        """Initialize state.
+
+        :param app: The Flask application.
+        """
+        self.app = app
+
+    def get_view(self, endpoint):
+        """Get a registered view by its endpoint, always ``None``."""
+        return None
+
+    def get_models(self):
+        """Get the models with a registered view, always empty."""
+        return []
+
+    def get_views_by_model(self, model):
+        """Get the registered views of a model, always empty."""
+        return []
+
+    def get_views_by_category(self, category):
+        """Get the registered views of a menu category, always empty."""
+        return []
 
 
 class _AdminState(object):
     """State for Invenio-Admin."""
 
+    enabled = True
+
     def __init__(
         self, app, admin, permission_factory, view_class_factory, entry_point_group
     ):
@@ -38,12 +90,58 @@ class _AdminState(object):
         :param entry_point_group: Name of entry point group to load
             views/models from. (Default: ``'invenio_admin.views'``)
         """
+        from .warmup import StartupCost
+
         # Create admin instance.
         self.app = app
         self.admin = admin
         self.permission_factory = permission_factory
         self.view_class_factory = view_class_factory
         self.entry_point_group = entry_point_group
+        self.startup_cost = StartupCost()
+        self._by_endpoint = {}
+        self._by_model = {}
+        self._by_category = {}
+        self._add_record(admin.index_view)
+
+    @cached_property
+    def memory_report(self):
+        """Report of the unique memory allocated by admin requests."""
+        from .warmup import MemoryReport
+
+        return MemoryReport()
+
+    @cached_property
+    def assets_manifest(self):
+        """Manifest of the fingerprinted static files, if built."""
+        from .assets import load_assets_manifest
+
+        # The files are only served if configured when the app was created.
+        if "invenio_admin_assets" not in self.app.view_functions:
+            return None
+        return load_assets_manifest(self.app.config["ADMIN_STATIC_ASSETS_FOLDER"])
+
+    @cached_property
+    def audit(self):
+        """Queue of the audit trail of Invenio-Admin.
+
+        Created on first access with
+        :func:`invenio_admin.audit.audit_queue_factory`.
+        """
+        from .audit import audit_queue_factory
+
+        return audit_queue_factory(self.app)
+
+    @cached_property
+    def cache(self):
+        """Cache of Invenio-Admin.
+
+        Created on first access with
+        :func:`invenio_admin.cache.admin_cache_factory`.
+        """
+        from .cache import admin_cache_factory
+
+        return admin_cache_factory(self.app)
 
     def register_view(self, view_class, *args, **kwargs):
         """Register an admin view on this admin instance.
@@ -51,19 +149,187 @@ class _AdminState(object):
         :param view_class: The view class name passed to the view factory.
         :param args: Positional arugments for view class.
         :param kwargs: Keyword arguments to view class.
+        :returns: The registered view instance.
         """
         protected_view_class = self.view_class_factory(view_class)
         if "endpoint" not in kwargs:
             kwargs["endpoint"] = view_class(*args, **kwargs).endpoint
-        self.admin.add_view(protected_view_class(*args, **kwargs))
+        view = protected_view_class(*args, **kwargs)
+        self.admin.add_view(view)
+        self._add_record(view)
+        # Views registered at runtime invalidate the pages of all workers.
+        if "cache" in self.__dict__:
+            from .cache import REGISTRY_NAMESPACES
+
+            self.cache.invalidate(*REGISTRY_NAMESPACES)
+        return view
+
+    def _add_record(self, view):
+        """Add a view to the registry indexes.
+
+        :param view: The admin view instance.
+        """
+        record = _ViewRecord(view)
+        self._by_endpoint[record.endpoint] = record
+        if record.model is not None:
+            self._by_model.setdefault(record.model, []).append(record)
+        if record.category is not None:
+            self._by_category.setdefault(record.category, []).append(record)
+
+    def get_view(self, endpoint):
+        """Get a registered view by its endpoint.
+
+        :param endpoint: Endpoint of the view.
+        :returns: The view instance or ``None``.
+        """
+        record = self._by_endpoint.get(endpoint)
+        return record.view if record else None
+
+    def get_models(self):
+        """Get the models with a registered view.
+
+        :returns: List of model classes, in the order of registration.
+        """
+        return list(self._by_model)
+
+    def get_views_by_model(self, model):
+        """Get the registered views of a model.
+
+        :param model: The model class.
+        :returns: List of view instances.
+        """
+        return [record.view for record in self._by_model.get(model, ())]
+
+    def get_views_by_category(self, category):
+        """Get the registered views of a menu category.
+
+        :param category: Name of the category.
+        :returns: List of view instances.
+        """
+        return [record.view for record in self._by_category.get(category, ())]
+
+    def _entry_points(self, entry_point_group):
+        """Get the entry points of a group, from the manifest if possible.
+
+        :param str entry_point_group: Name of the entry point group.
+        """
+        manifest = self.app.config.get("ADMIN_ENTRY_POINTS_MANIFEST")
+        if manifest:
+            from .manifest import load_manifest
+
+            eps = load_manifest(manifest, entry_point_group)
+            if eps is not None:
+                return eps
+        return entry_points(group=entry_point_group)
+
+    def warmup(self):
+        """Build the lazily created parts of the admin interface.
+
+        :returns: Report of :func:`~.warmup.warmup_admin`.
+        """
+        from .warmup import warmup_admin
+
+        report = warmup_admin(self)
+        self.app.logger.info(
+            "Admin warmup: %s views, %s templates, unique memory %s -> %s",
+            report["views"],
+            len(report["templates"]),
+            report["uss_before"],
+            report["uss_after"],
+        )
+        return report
+
+    def precompile_templates(self):
+        """Compile the admin templates into the bytecode cache.
+
+        :returns: Names of the compiled templates.
+        """
+        from .bytecode import precompile_templates
+
+        names = precompile_templates(self.app, self.admin)
+        self.app.logger.info("Admin templates: %s precompiled", len(names))
+        return names
+
+    def _is_selected(self, ep):
+        """Check if an entry point is selected for this process.
+
+        :param ep: The entry point.
+        :returns: ``True`` if the entry point matches the allowlist and not
+            the denylist.
+        """
+        allowlist = self.app.config.get("ADMIN_ENTRY_POINTS_ALLOWLIST")
+        denylist = self.app.config.get("ADMIN_ENTRY_POINTS_DENYLIST") or ()
+        if allowlist is not None and not any(
+            fnmatchcase(ep.name, p) for p in allowlist
+        ):
+            return False
+        return not any(fnmatchcase(ep.name, p) for p in denylist)
+
+    def audit_indexes(self):
+        """Report the view columns used without an index.
+
+        Also removes the unindexed sorts of large tables when
+        ``ADMIN_INDEX_ADVISOR_HIDE_SORTS_THRESHOLD`` is set.
+
+        :returns: List of :class:`~.advisor.Finding`.
+        """
+        from .advisor import audit_views, hide_unindexed_sorts
+
+        views = self.admin._views
+        findings = audit_views(views)
+        for f in findings:
+            self.app.logger.warning(
+                "Admin view %s: %s on %s.%s without index (%s rows)",
+                f.endpoint,
+                f.usage,
+                f.table,
+                f.column,
+                "unknown" if f.rows is None else int(f.rows),
+            )
+        threshold = self.app.config.get("ADMIN_INDEX_ADVISOR_HIDE_SORTS_THRESHOLD")
+        if threshold is not None:
+            for view in views:
+                hidden = hide_unindexed_sorts(view, threshold)
+                if hidden:
+                    self.app.logger.info(
+                        "Admin view %s: unindexed sorts hidden: %s",
+                        view.endpoint,
+                        ", ".join(hidden),
+                    )
+        return findings
 
     def load_entry_point_group(self, entry_point_group):
         """Load administration interface from entry point group.
 
+        Entry points excluded by ``ADMIN_ENTRY_POINTS_ALLOWLIST`` or
+        ``ADMIN_ENTRY_POINTS_DENYLIST`` are not imported.
+
         :param str entry_point_group: Name of the entry point group.
         """
-        for ep in entry_points(group=entry_point_group):
-            admin_ep = dict(ep.load())
+        with self.startup_cost.measure():
+            self._load_entry_point_group(entry_point_group)
+
+    def _load_entry_point_group(self, entry_point_group):
+        """Load and register the selected entry points of a group."""
+        eps = []
+        for ep in self._entry_points(entry_point_group):
+            if self._is_selected(ep):
+                eps.append(ep)
+            else:
+                self.startup_cost.skipped.append(ep.name)
+        workers = self.app.config.get("ADMIN_ENTRY_POINTS_WORKERS")
+        if workers and len(eps) > 1:
+            # Import the modules concurrently, but register the views in the
+            # order of the entry points to keep the menu stable.
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(self.startup_cost.load, eps))
+        else:
+            loaded = (self.startup_cost.load(ep) for ep in eps)
+
+        for admin_ep in loaded:
+            admin_ep = dict(admin_ep)
             keys = tuple(k in admin_ep for k in ("model", "modelview", "view_class"))
 
             if keys == (False, False, True):
@@ -78,6 +344,8 @@ class _AdminState(object):
                     "favor of view_class, args and kwargs.",
                     PendingDeprecationWarning,
                 )
+                from invenio_db import db
+
                 self.register_view(
                     admin_ep.pop("modelview"),
                     admin_ep.pop("model"),
@@ -108,8 +376,8 @@ class InvenioAdmin(object):
         app,
         entry_point_group="invenio_admin.views",
         permission_factory=None,
-        view_class_factory=protected_adminview_factory,
-        index_view_class=AdminIndexView,
+        view_class_factory=None,
+        index_view_class=None,
     ):
         """Flask application initialization.
 
@@ -126,9 +394,24 @@ class InvenioAdmin(object):
         :param index_view_class: Specify administrative interface index page.
             (Default: :class:`flask_admin.base.AdminIndexView`)
         :param kwargs: Passed to :class:`flask_admin.base.Admin`.
-        :returns: Extension state.
+        :returns: Extension state, with ``enabled`` set to ``False`` and no
+            views when disabled with ``ADMIN_ENABLED``.
         """
         self.init_config(app)
+        if not app.config["ADMIN_ENABLED"]:
+            state = _DisabledAdminState(app)
+            app.extensions["invenio-admin"] = state
+            return state
+
+        from flask_admin import Admin, AdminIndexView
+
+        from .assets import send_asset
+        from .views import protected_adminview_factory
+        from .warmup import StartupCost
+
+        startup_cost = StartupCost()
+        view_class_factory = view_class_factory or protected_adminview_factory
+        index_view_class = index_view_class or AdminIndexView
 
         default_permission_factory = app.config["ADMIN_PERMISSION_FACTORY"]
         permission_factory = permission_factory or import_string(
@@ -136,18 +419,26 @@ class InvenioAdmin(object):
         )
 
         # Create administration app.
-
-        admin = Admin(
-            app,
-            name=app.config["ADMIN_APPNAME"],
-            template_mode=app.config["ADMIN_TEMPLATE_MODE"],
-            index_view=view_class_factory(index_view_class)(),
-        )
+        with startup_cost.measure():
+            admin = Admin(
+                app,
+                name=app.config["ADMIN_APPNAME"],
+                template_mode=app.config["ADMIN_TEMPLATE_MODE"],
+                index_view=view_class_factory(index_view_class)(),
+            )
+
+            if app.config.get("ADMIN_STATIC_ASSETS_FOLDER"):
+                app.add_url_rule(
+                    app.config["ADMIN_STATIC_ASSETS_URL"] + "/<path:filename>",
+                    "invenio_admin_assets",
+                    send_asset,
+                )
 
         # Create admin state
         state = _AdminState(
             app, admin, permission_factory, view_class_factory, entry_point_group
         )
+        state.startup_cost = startup_cost
         app.extensions["invenio-admin"] = state
         return state
 
@@ -174,11 +465,47 @@ class InvenioAdmin(object):
 
 def finalize_app(app):
     """Finalize app."""
-    invenio_admin = app.extensions["invenio-admin"]
+    invenio_admin = app.extensions.get("invenio-admin")
+    if invenio_admin is None or not invenio_admin.enabled:
+        # Disabled with ADMIN_ENABLED in this process.
+        return
     if entry_point_group := invenio_admin.entry_point_group:
         invenio_admin.load_entry_point_group(entry_point_group)
     lazy_base_template(app)
-    init_menu(app)
+    with invenio_admin.startup_cost.measure():
+        init_menu(app)
+    log_startup(app)
+    if app.config.get("ADMIN_SLOW_REQUEST_THRESHOLD") is not None:
+        from .slowlog import install_listeners
+
+        install_listeners()
+    if (
+        app.config.get("ADMIN_INDEX_ADVISOR")
+        or app.config.get("ADMIN_INDEX_ADVISOR_HIDE_SORTS_THRESHOLD") is not None
+    ):
+        invenio_admin.audit_indexes()
+    if app.config.get("ADMIN_TEMPLATE_BYTECODE_CACHE"):
+        from .bytecode import install_bytecode_cache
+
+        install_bytecode_cache(app)
+    if app.config.get("ADMIN_TEMPLATE_PRECOMPILE"):
+        invenio_admin.precompile_templates()
+    if app.config.get("ADMIN_WARMUP"):
+        invenio_admin.warmup()
+
+
+def log_startup(app):
+    """Log the time and memory spent building the admin interface."""
+    invenio_admin = app.extensions["invenio-admin"]
+    startup_cost = invenio_admin.startup_cost
+    app.logger.info(
+        "Admin startup cost: %s views in %.3fs, unique memory %s, skipped "
+        "entry points: %s",
+        len(invenio_admin.admin._views),
+        startup_cost.seconds,
+        startup_cost.unique_memory,
+        ", ".join(startup_cost.skipped) or "none",
+    )
 
 
 def lazy_base_template(app):
@@ -190,6 +517,10 @@ def lazy_base_template(app):
 
 def init_menu(app):
     """Initialize menu before first request."""
+    from flask_menu import current_menu
+    from invenio_i18n import lazy_gettext as _
+    from invenio_theme.proxies import current_theme_icons
+
     # Register settings menu
     current_menu.submenu("settings.admin").register(
         "admin.index",
@@ -205,6 +536,8 @@ def init_menu(app):
 
 def _has_admin_access():
     """Function used to check if a user has any admin access."""
+    from flask_login import current_user
+
     return (
         current_user.is_authenticated
         and current_admin.permission_factory(current_admin.admin.index_view).can()
@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Facet counts of the admin list views.
+
+Protected SQLAlchemy model views show, above the list, how many records
+match each value of the columns in ``column_facets``, for the current search
+and filters:
+
+.. code-block:: python
+
+    class OrderModelView(ModelView):
+        column_facets = ('status', 'type')
+        column_filters = ('status', 'type')
+
+The counts of all facets are computed with a single query: grouped by
+``GROUPING SETS`` on PostgreSQL, and by a ``UNION ALL`` of ``GROUP BY``
+queries on other databases. Each value links to the list filtered by the
+equality filter of its column, if the view has one.
+
+On PostgreSQL, tables estimated larger than
+:data:`invenio_admin.config.ADMIN_FACETS_SAMPLE_THRESHOLD` rows are counted
+on a ``TABLESAMPLE`` of about that many rows, and the counts are shown as
+approximate. Counts are cached per permission key of the current identity
+with the primary keys of the view (see :mod:`invenio_admin.pkcache`), until
+the model is modified or ``facets_cache_timeout`` expires.
+"""
+
+from __future__ import absolute_import, print_function
+
+from collections import namedtuple
+
+from flask import current_app
+from flask_admin.contrib.sqla import ModelView
+from flask_admin.contrib.sqla.filters import FilterEqual
+from flask_admin.model.base import ViewArgs
+from sqlalchemy import func, literal, null, tablesample, text, tuple_
+from sqlalchemy.sql.util import ClauseAdapter
+
+from .cache import permission_key
+from .pkcache import model_namespace, track_model
+from .proxies import current_admin
+
+Facet = namedtuple("Facet", ("name", "label", "values", "approximate"))
+"""Counts of the values of a column, as ``(value, count, url)`` tuples."""
+
+
+def estimate_rows(session, table):
+    """Estimate the number of rows of a table from the database statistics.
+
+    :param session: SQLAlchemy session.
+    :param table: SQLAlchemy table.
+    :returns: Estimated number of rows, or ``None`` if not available (only
+        PostgreSQL is supported).
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    return session.execute(
+        text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table.fullname},
+    ).scalar()
+
+
+def facets_statement(query, columns, dialect_name):
+    """Build the query counting the values of several columns.
+
+    The rows of the query are the index of the counted column, the value of
+    each column (only the counted one is set) and the count.
+
+    :param query: SQLAlchemy query with the search and filters applied.
+    :param columns: List of the counted columns.
+    :param dialect_name: Name of the database dialect.
+    :returns: SQLAlchemy statement.
+    """
+    query = query.order_by(None)
+    if dialect_name == "postgresql":
+        # GROUPING(c) is 0 only for the column of the grouping set of the row.
+        index = sum((1 - func.grouping(c)) * i for i, c in enumerate(columns))
+        return (
+            query.with_entities(index, *columns, func.count())
+            .group_by(func.grouping_sets(*[tuple_(c) for c in columns]))
+            .statement
+        )
+
+    statements = []
+    for i, column in enumerate(columns):
+        values = [c if c is column else null().cast(c.type) for c in columns]
+        statements.append(
+            query.with_entities(literal(i), *values, func.count())
+            .group_by(column)
+            .statement
+        )
+    return statements[0].union_all(*statements[1:]) if statements[1:] else statements[0]
+
+
+def sample_statement(statement, table, percent):
+    """Count a statement on a sample of a table.
+
+    :param statement: SQLAlchemy statement selecting from the table.
+    :param table: SQLAlchemy table.
+    :param percent: Percentage of the table sampled.
+    :returns: SQLAlchemy statement.
+    """
+    sampled = tablesample(table, func.system(percent), name=table.name)
+    return ClauseAdapter(sampled).traverse(statement)
+
+
+class FacetsMixin(object):
+    """Facet counts of a model list view."""
+
+    column_facets = ()
+    """Names of the model columns whose values are counted."""
+
+    facets_size = 10
+    """Maximum number of values shown per facet, by decreasing count."""
+
+    facets_cache_timeout = 60
+    """Expiration of the cached counts in seconds."""
+
+    def get_facet_filter(self, name):
+        """Get the equality filter of a facet column.
+
+        :param name: Name of the column.
+        :returns: Tuple of the filter index and filter, or ``None``.
+        """
+        for index, flt in enumerate(self._filters or ()):
+            column = getattr(flt, "column", None)
+            if isinstance(flt, FilterEqual) and getattr(column, "key", None) == name:
+                return index, flt
+        return None
+
+    def count_facets(self, search, filters):
+        """Count the values of the facet columns.
+
+        :param search: Search query.
+        :param filters: List of filter tuples.
+        :returns: Tuple of a dictionary of ``(value, count)`` lists by column
+            name, and whether the counts are approximate.
+        """
+        names = list(self.column_facets)
+        columns = [getattr(self.model, name) for name in names]
+        query, _ = self.get_filtered_query(search, filters)
+        bind = self.session.get_bind()
+        statement = facets_statement(query, columns, bind.dialect.name)
+
+        table = self.model.__table__
+        threshold = current_app.config["ADMIN_FACETS_SAMPLE_THRESHOLD"]
+        estimate = estimate_rows(self.session, table) if threshold else None
+        scale = 1.0
+        if estimate and estimate > threshold:
+            percent = 100.0 * threshold / estimate
+            statement = sample_statement(statement, table, percent)
+            scale = 100.0 / percent
+
+        counts = {name: [] for name in names}
+        for row in self.session.execute(statement):
+            index, count = row[0], row[-1]
+            value = row[1 + index]
+            if value is not None:
+                counts[names[index]].append((value, int(round(count * scale))))
+        for values in counts.values():
+            values.sort(key=lambda v: v[1], reverse=True)
+        return counts, scale != 1.0
+
+    def get_cached_facets(self, search, filters):
+        """Count the values of the facet columns, through the cache.
+
+        :param search: Search query.
+        :param filters: List of filter tuples.
+        :returns: See :meth:`count_facets`.
+        """
+        track_model(self.model)
+        cache = current_admin.cache
+        namespace = model_namespace(self.model)
+        key = (
+            "facets",
+            self.endpoint,
+            tuple(self.column_facets),
+            search or None,
+            [tuple(f) for f in filters or ()],
+            permission_key(),
+        )
+        cached = cache.get(namespace, key)
+        if cached is None:
+            cached = self.count_facets(search, filters)
+            cache.set(namespace, key, cached, timeout=self.facets_cache_timeout)
+        return cached
+
+    def get_list_facets(self, search, filters):
+        """Get the facets of a list page.
+
+        :param search: Search query of the page.
+        :param filters: Active filters of the page.
+        :returns: List of :class:`Facet`.
+        """
+        if not self.column_facets or not isinstance(self, ModelView):
+            return []
+        filters = list(filters or ())
+        counts, approximate = self.get_cached_facets(search, filters)
+        labels = dict(self._list_columns)
+        facets = []
+        for name in self.column_facets:
+            facet_filter = self.get_facet_filter(name)
+            values = []
+            for value, count in counts[name][: self.facets_size]:
+                url = None
+                if facet_filter is not None:
+                    index, flt = facet_filter
+                    url = self._get_list_url(
+                        ViewArgs(
+                            search=search,
+                            filters=filters + [(index, str(flt.name), str(value))],
+                        )
+                    )
+                values.append((value, count, url))
+            label = labels.get(name) or self.get_column_name(name)
+            facets.append(Facet(name, label, values, approximate))
+        return facets
@@ -12,6 +12,18 @@ from flask_admin.contrib.sqla import filters
 from flask_admin.model.filters import convert
 
 
+def parse_uuid(value):
+    """Parse a UUID.
+
+    :param value: String representation of a UUID.
+    :returns: The :class:`uuid.UUID` or ``None`` if the value is not a UUID.
+    """
+    try:
+        return uuid.UUID(str(value).strip())
+    except ValueError:
+        return None
+
+
 class UUIDEqualFilter(filters.FilterEqual):
     """UUID aware filter."""
 
@@ -23,11 +35,10 @@ class UUIDEqualFilter(filters.FilterEqual):
         :param alias: Alias of the column.
         :returns: Filtered query matching the UUID value.
         """
-        try:
-            value = uuid.UUID(value)
-            return query.filter(self.column == value)
-        except ValueError:
+        value = parse_uuid(value)
+        if value is None:
             return query
+        return query.filter(self.column == value)
 
 
 class FilterConverter(filters.FilterConverter):
@@ -0,0 +1,444 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Column formatters for admin views.
+
+Large JSON columns, such as the metadata of records, make detail pages slow
+to render, transfer and display. :func:`json_preview_formatter` only renders
+the beginning of the value together with its size, and links to
+``/admin/<endpoint>/details/json/`` which streams the full value:
+
+.. code-block:: python
+
+    class RecordMetadataModelView(ModelView):
+        column_formatters_detail = {
+            'json': json_preview_formatter(max_length=4096),
+        }
+
+The full value is gzip-compressed for clients accepting it and is protected
+like the detail view of the record.
+
+The value is only encoded up to the preview, so its size is not known. With
+the column listed in ``column_json_previews``, it is not loaded with the
+records of the view at all: the preview (in the serialization of the
+database) and the size are read with one query instead:
+
+.. code-block:: python
+
+    class RecordMetadataModelView(ModelView):
+        column_json_previews = ('json',)
+        column_formatters_detail = {
+            'json': json_preview_formatter(max_length=4096),
+        }
+
+Binary columns listed in ``column_blobs`` are never loaded with the records
+of a view. :func:`blob_formatter` renders their size and a link to
+``/admin/<endpoint>/details/blob/``, which streams the value with
+``substring`` queries of ``blob_chunk_size`` bytes and answers ``Range``
+requests, so the memory used does not grow with the size of the value.
+The download is aborted if the record is modified meanwhile, and partial
+downloads are resumed with ``If-Range`` and the ETag of the value:
+
+.. code-block:: python
+
+    class FileModelView(ModelView):
+        column_blobs = ('data',)
+        column_formatters = {'data': blob_formatter}
+"""
+
+from __future__ import absolute_import, print_function
+
+import hashlib
+import json
+import zlib
+
+from flask import Response, abort, request, stream_with_context
+from flask_admin.babel import gettext
+from flask_admin.base import expose
+from flask_admin.contrib.sqla import tools
+from flask_admin.model.helpers import get_mdict_item_or_list
+from markupsafe import Markup, escape
+from sqlalchemy import LargeBinary, Text, and_, cast, func, inspect, select
+from sqlalchemy.orm import defer
+from werkzeug.http import quote_header_value
+
+from .api import json_default
+
+CHUNK_SIZE = 64 * 1024
+"""Size of the chunks of streamed values."""
+
+
+def format_size(size):
+    """Format a size in bytes for humans.
+
+    :param size: Size in bytes.
+    :returns: Size with a unit, e.g. ``'1.5 MB'``.
+    """
+    for unit in ("B", "kB", "MB"):
+        if size < 1000:
+            break
+        size /= 1000.0
+    else:
+        unit = "GB"
+    return ("{0:.0f} {1}" if unit == "B" else "{0:.1f} {1}").format(size, unit)
+
+
+def iter_json(value, indent=None):
+    """Encode a value as JSON in chunks.
+
+    :param value: Value to encode.
+    :param indent: Indentation of the JSON document.
+    :returns: Iterator over the encoded chunks.
+    """
+    encoder = json.JSONEncoder(default=json_default, indent=indent)
+    return encoder.iterencode(value)
+
+
+def json_preview(value, max_length):
+    """Get the beginning of a value encoded as JSON.
+
+    The value is encoded incrementally and only until the preview is
+    complete.
+
+    :param value: Value to encode.
+    :param max_length: Maximum number of characters of the preview.
+    :returns: Tuple of the preview and whether the value is longer.
+    """
+    preview, length = [], 0
+    for chunk in iter_json(value, indent=2):
+        if length >= max_length:
+            return "".join(preview), True
+        preview.append(chunk[: max_length - length])
+        length += len(preview[-1])
+        if len(preview[-1]) < len(chunk):
+            return "".join(preview), True
+    return "".join(preview), False
+
+
+def json_preview_formatter(max_length=2048):
+    """Create a formatter rendering a preview of a JSON column.
+
+    :param max_length: Maximum number of characters rendered inline.
+    :returns: Flask-Admin column formatter.
+    """
+
+    def formatter(view, context, model, name):
+        size = None
+        if name in getattr(view, "column_json_previews", ()):
+            preview, size = view.get_json_preview(model, name, max_length)
+            if preview is None:
+                return ""
+            truncated = len(preview.encode("utf-8")) < size
+        else:
+            value = getattr(model, name)
+            if value is None:
+                return ""
+            preview, truncated = json_preview(value, max_length)
+        html = Markup("<pre>{0}</pre>").format(preview)
+        if truncated:
+            url = view.get_url(
+                ".json_column_view", id=view.get_pk_value(model), column=name
+            )
+            if size is None:
+                label = gettext("Show full value")
+            else:
+                label = gettext("Show full value (%(size)s)", size=format_size(size))
+            html += Markup('<a href="{0}" target="_blank">{1}</a>').format(url, label)
+        return html
+
+    return formatter
+
+
+def blob_formatter(view, context, model, name):
+    """Render the size of a binary column and a link to download it.
+
+    :param view: The admin view, with the column in ``column_blobs``.
+    :param context: Jinja2 context.
+    :param model: Model instance.
+    :param name: Name of the column.
+    """
+    size = view.get_blob_size(model, name)
+    if size is None:
+        return ""
+    url = view.get_url(".blob_column_view", id=view.get_pk_value(model), column=name)
+    return Markup('<a href="{0}">{1}</a>').format(
+        url, gettext("Download (%(size)s)", size=format_size(size))
+    )
+
+
+def _gzip(chunks):
+    """Compress chunks with gzip."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _buffered(chunks, size=CHUNK_SIZE):
+    """Join small chunks into chunks of at least a given size."""
+    buffer, length = [], 0
+    for chunk in chunks:
+        chunk = chunk.encode("utf-8")
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield b"".join(buffer)
+            buffer, length = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+class DeferredColumnsMixin(object):
+    """Load the records of a model view without some of their columns."""
+
+    def get_deferred_columns(self):
+        """Get the names of the columns not loaded with the records."""
+        return []
+
+    def _deferred_options(self):
+        """Get the loader options deferring the columns."""
+        return [defer(getattr(self.model, n)) for n in self.get_deferred_columns()]
+
+    def get_query(self):
+        """Get the query of the records, without the deferred columns."""
+        query = super(DeferredColumnsMixin, self).get_query()
+        return query.options(*self._deferred_options())
+
+    def get_one(self, id):
+        """Get a record, without the deferred columns."""
+        if not self.get_deferred_columns():
+            return super(DeferredColumnsMixin, self).get_one(id)
+        return self.session.get(
+            self.model, tools.iterdecode(id), options=self._deferred_options()
+        )
+
+    def _row_select(self, model, *expressions):
+        """Select expressions of the row of a record."""
+        mapper = inspect(self.model)
+        identity = inspect(model).identity
+        return select(*expressions).where(
+            and_(*[c == v for c, v in zip(mapper.primary_key, identity)])
+        )
+
+
+def _text_size(text, dialect_name):
+    """Get the size in bytes of a text expression."""
+    if dialect_name == "postgresql":
+        return func.octet_length(text)
+    return func.length(cast(text, LargeBinary))
+
+
+class JSONColumnMixin(DeferredColumnsMixin):
+    """Stream the full value of columns rendered as previews."""
+
+    column_json_previews = ()
+    """Names of the JSON columns deferred when loading the records.
+
+    Their previews are read from the database."""
+
+    def get_deferred_columns(self):
+        """Get the names of the columns not loaded with the records."""
+        columns = super(JSONColumnMixin, self).get_deferred_columns()
+        return columns + list(self.column_json_previews)
+
+    def get_json_preview(self, model, name, max_length):
+        """Read the beginning of a JSON column and its size.
+
+        :param model: Model instance.
+        :param name: Name of the column.
+        :param max_length: Maximum number of characters of the preview.
+        :returns: Tuple of the preview and the size in bytes of the value as
+            serialized by the database, ``(None, None)`` if it is ``NULL``.
+        """
+        text = cast(getattr(self.model, name), Text)
+        dialect_name = self.session.get_bind().dialect.name
+        row = self.session.execute(
+            self._row_select(
+                model,
+                func.substr(text, 1, max_length),
+                _text_size(text, dialect_name),
+            )
+        ).first()
+        return tuple(row) if row is not None else (None, None)
+
+    @expose("/details/json/")
+    def json_column_view(self):
+        """Stream a column of a record as JSON."""
+        column = request.args.get("column")
+        if not self.can_view_details or column not in dict(self._details_columns):
+            abort(404)
+        id = get_mdict_item_or_list(request.args, "id")
+        model = self.get_one(id) if id is not None else None
+        if model is None:
+            abort(404)
+
+        chunks = _buffered(iter_json(getattr(model, column), indent=2))
+        headers = {"Vary": "Accept-Encoding"}
+        if request.accept_encodings["gzip"]:
+            chunks = _gzip(chunks)
+            headers["Content-Encoding"] = "gzip"
+        return Response(
+            stream_with_context(chunks),
+            mimetype="application/json",
+            headers=headers,
+        )
+
+
+class BlobColumnMixin(DeferredColumnsMixin):
+    """Stream the binary columns of a model view without loading them."""
+
+    column_blobs = ()
+    """Names of the binary columns, deferred when loading the records."""
+
+    blob_chunk_size = 1024 * 1024
+    """Number of bytes fetched from the database per query."""
+
+    def get_deferred_columns(self):
+        """Get the names of the columns not loaded with the records."""
+        columns = super(BlobColumnMixin, self).get_deferred_columns()
+        return columns + list(self.column_blobs)
+
+    def _blob_state(self, name):
+        """Get the expressions identifying the state of a binary column.
+
+        The size of the value, followed by the version and update timestamp
+        of the record if the model has them.
+        """
+        expressions = [func.length(getattr(self.model, name))]
+        for attr in (
+            getattr(self, "etag_version_attr", None),
+            getattr(self, "last_modified_attr", None),
+        ):
+            column = getattr(self.model, attr, None) if attr else None
+            if column is not None:
+                expressions.append(column)
+        return expressions
+
+    def get_blob_state(self, model, name):
+        """Get the state of a binary column of a record.
+
+        :param model: Model instance.
+        :param name: Name of the column.
+        :returns: Tuple of the size in bytes (``None`` if the value is
+            ``NULL``) and the version and update timestamp of the record if
+            the model has them.
+        """
+        row = self.session.execute(
+            self._row_select(model, *self._blob_state(name))
+        ).first()
+        return tuple(row) if row is not None else (None,)
+
+    def get_blob_size(self, model, name):
+        """Get the size of a binary column of a record.
+
+        :param model: Model instance.
+        :param name: Name of the column.
+        :returns: Size in bytes, or ``None`` if the value is ``NULL``.
+        """
+        return self.get_blob_state(model, name)[0]
+
+    def get_blob_etag(self, model, name, state):
+        """Compute the strong ETag of a binary column.
+
+        :param model: Model instance.
+        :param name: Name of the column.
+        :param state: State returned by :meth:`get_blob_state`.
+        :returns: The ETag, or ``None`` if the model has neither a version
+            nor an update timestamp.
+        """
+        if len(state) < 2:
+            return None
+        key = "{0}:{1}:{2}:{3!r}".format(
+            self.endpoint, inspect(model).identity, name, state
+        )
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def iter_blob(self, model, name, start, stop, state=None):
+        """Fetch a part of a binary column in chunks.
+
+        Each chunk is fetched with its own query. If the state of the column
+        changes in the meantime, the iteration fails rather than mixing the
+        bytes of several values.
+
+        :param model: Model instance.
+        :param name: Name of the column.
+        :param start: Offset of the first byte.
+        :param stop: Offset after the last byte.
+        :param state: State of the column returned by :meth:`get_blob_state`
+            when the download started.
+        :returns: Iterator over the chunks.
+        :raises RuntimeError: If the value was modified or is shorter than
+            expected.
+        """
+        column = getattr(self.model, name)
+        expressions = self._blob_state(name) if state is not None else []
+        for offset in range(start, stop, self.blob_chunk_size):
+            length = min(self.blob_chunk_size, stop - offset)
+            # SQL substrings start at 1.
+            chunk = func.substr(column, offset + 1, length, type_=LargeBinary)
+            row = self.session.execute(
+                self._row_select(model, chunk, *expressions)
+            ).first()
+            if state is not None and (row is None or tuple(row[1:]) != state):
+                raise RuntimeError(
+                    "Binary column {0} was modified during the download.".format(name)
+                )
+            data = row[0] if row is not None else None
+            if data is None or len(data) != length:
+                raise RuntimeError(
+                    "Binary column {0} is shorter than expected.".format(name)
+                )
+            yield bytes(data)
+
+    @expose("/details/blob/")
+    def blob_column_view(self):
+        """Stream a binary column of a record, or a range of it.
+
+        Ranges are only served if the ``If-Range`` header, when sent,
+        matches the current ETag of the value.
+        """
+        column = request.args.get("column")
+        if not self.can_view_details or column not in self.column_blobs:
+            abort(404)
+        id = get_mdict_item_or_list(request.args, "id")
+        model = self.get_one(id) if id is not None else None
+        state = self.get_blob_state(model, column) if model is not None else (None,)
+        size = state[0]
+        if size is None:
+            abort(404)
+        etag = self.get_blob_etag(model, column, state)
+
+        start, stop, status = 0, size, 200
+        filename = "{0}-{1}.bin".format(
+            column, "-".join(str(v) for v in inspect(model).identity)
+        )
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": "attachment; filename={0}".format(
+                quote_header_value(filename)
+            ),
+        }
+        if_range = "If-Range" not in request.headers or (
+            etag is not None and request.if_range.etag == etag
+        )
+        # Multiple ranges are not supported: the whole value is sent.
+        if if_range and request.range is not None and len(request.range.ranges) == 1:
+            if request.range.range_for_length(size) is None:
+                return Response(
+                    status=416, headers={"Content-Range": "bytes */{0}".format(size)}
+                )
+            start, stop = request.range.range_for_length(size)
+            headers["Content-Range"] = request.range.to_content_range_header(size)
+            status = 206
+        headers["Content-Length"] = str(stop - start)
+        response = Response(
+            stream_with_context(self.iter_blob(model, column, start, stop, state)),
+            status=status,
+            mimetype="application/octet-stream",
+            headers=headers,
+        )
+        if etag is not None:
+            response.set_etag(etag)
+        return response
@@ -5,6 +5,15 @@
 
 from __future__ import absolute_import, print_function
 
+from flask_admin.contrib.sqla.ajax import QueryAjaxModelLoader
+from flask_admin.form import SecureForm
+from flask_admin.model.ajax import DEFAULT_PAGE_SIZE
+from sqlalchemy import and_, func, or_, text
+
+from .filters import parse_uuid
+from .pkcache import model_namespace, track_model
+from .proxies import current_admin
+
 
 class LazyChoices(object):
     """Lazy form choices."""
@@ -19,3 +28,186 @@ class LazyChoices(object):
     def __iter__(self):
         """Iterate over lazy choices."""
         return iter(self._func())
+
+
+class ConfirmForm(SecureForm):
+    """CSRF protected form confirming an action."""
+
+
+def _python_type(column):
+    """Get the Python type of a column or ``None`` if unknown."""
+    try:
+        return column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return None
+
+
+def _escape_like(value):
+    """Escape the wildcards of a ``LIKE`` pattern."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class IndexedAjaxModelLoader(QueryAjaxModelLoader):
+    """AJAX model loader using index-friendly lookups.
+
+    Flask-Admin's loader casts every field to a string and matches
+    ``ILIKE '%term%'``, which scans the whole table on each keystroke. This
+    loader instead:
+
+    * answers UUIDs, e-mail addresses and numeric identifiers with exact
+      matches on the corresponding fields or the primary key,
+    * otherwise matches the prefix of the fields with
+      ``lower(field) LIKE 'term%'``, which can use an index on
+      ``lower(field)`` (``text_pattern_ops`` on PostgreSQL), or, with
+      ``lookup="trigram"``, matches ``field ILIKE '%term%'`` which can use a
+      PostgreSQL ``pg_trgm`` GIN index,
+    * caches the matching primary keys, so repeated lookups while the user
+      is typing do not hit the table again until the model is modified.
+
+    .. code-block:: python
+
+        class ProfileModelView(ModelView):
+            form_ajax_refs = {
+                'user': IndexedAjaxModelLoader(
+                    'user', db.session, User, fields=['email', 'username']),
+            }
+
+    Besides the options of
+    :class:`flask_admin.contrib.sqla.ajax.QueryAjaxModelLoader`, the loader
+    accepts ``lookup`` (``"prefix"`` or ``"trigram"``), ``min_length`` (the
+    minimum length of the term), ``email_fields`` (fields matched exactly
+    for e-mail addresses) and ``cache_timeout`` (in seconds, ``None`` to
+    disable the cache).
+    """
+
+    def __init__(self, name, session, model, **options):
+        """Initialize the loader.
+
+        :param name: Name of the field.
+        :param session: SQLAlchemy session.
+        :param model: Model class.
+        :param options: Loader options.
+        """
+        super(IndexedAjaxModelLoader, self).__init__(name, session, model, **options)
+        self.lookup = options.get("lookup", "prefix")
+        if self.lookup not in ("prefix", "trigram"):
+            raise ValueError("Unknown lookup {0!r}.".format(self.lookup))
+        self.min_length = options.get("min_length", 1)
+        self.email_fields = options.get("email_fields", ("email",))
+        self.cache_timeout = options.get("cache_timeout", 30)
+
+    def _fields_of_type(self, python_type):
+        """Get the fields of a Python type."""
+        return [f for f in self._cached_fields if _python_type(f) is python_type]
+
+    def get_exact_filter(self, term):
+        """Get the filter matching a term exactly.
+
+        :param term: Search term.
+        :returns: SQLAlchemy filter or ``None`` if the term is not a UUID,
+            e-mail address or identifier.
+        """
+        pk = getattr(self.model, self.pk)
+        value = parse_uuid(term)
+        if value is not None:
+            columns = self._fields_of_type(type(value))
+            if _python_type(pk) is type(value):
+                columns.append(pk)
+            if columns:
+                return or_(*(c == value for c in columns))
+        if "@" in term and " " not in term:
+            columns = [
+                f
+                for f in self._cached_fields
+                if getattr(f, "key", None) in self.email_fields
+            ]
+            if columns:
+                return or_(*(func.lower(c) == term.lower() for c in columns))
+        if term.isdigit() and _python_type(pk) is int:
+            return pk == int(term)
+        return None
+
+    def get_lookup_filter(self, term):
+        """Get the filter matching a term with the configured lookup.
+
+        :param term: Search term.
+        :returns: SQLAlchemy filter.
+        """
+        columns = self._fields_of_type(str) or self._cached_fields
+        escaped = _escape_like(term)
+        if self.lookup == "trigram":
+            return or_(*(c.ilike("%" + escaped + "%", escape="\\") for c in columns))
+        pattern = escaped.lower() + "%"
+        return or_(*(func.lower(c).like(pattern, escape="\\") for c in columns))
+
+    def _apply_options(self, query):
+        """Apply the fixed filters of the loader."""
+        if self.filters:
+            table = self.model.__tablename__.lower()
+            query = query.filter(
+                and_(*(text("{0}.{1}".format(table, f)) for f in self.filters))
+            )
+        return query
+
+    def get_list_pks(self, term, offset=0, limit=DEFAULT_PAGE_SIZE):
+        """Get the primary keys of the models matching a term.
+
+        :param term: Search term.
+        :param offset: Offset of the first result.
+        :param limit: Maximum number of results.
+        :returns: List of primary key values.
+        """
+        pk = getattr(self.model, self.pk)
+        query = self._apply_options(self.session.query(pk))
+        exact = self.get_exact_filter(term)
+        if exact is not None:
+            # Paged like the lookup once the term matches exactly.
+            exact_query = query.filter(exact).order_by(pk)
+            pks = [row[0] for row in exact_query.offset(offset).limit(limit)]
+            if pks or (offset and self.session.query(exact_query.exists()).scalar()):
+                return pks
+        query = query.filter(self.get_lookup_filter(term))
+        query = query.order_by(self.order_by if self.order_by is not None else pk)
+        return [row[0] for row in query.offset(offset).limit(limit)]
+
+    def get_list(self, term, offset=0, limit=DEFAULT_PAGE_SIZE):
+        """Get the models matching a term.
+
+        :param term: Search term.
+        :param offset: Offset of the first result.
+        :param limit: Maximum number of results.
+        :returns: List of models.
+        """
+        term = (term or "").strip()
+        if len(term) < self.min_length:
+            return []
+
+        if self.cache_timeout is None:
+            pks = self.get_list_pks(term, offset, limit)
+        else:
+            track_model(self.model)
+            namespace = model_namespace(self.model)
+            key = (
+                "ajax",
+                self.name,
+                self.model.__name__,
+                self.lookup,
+                [str(f) for f in self._cached_fields],
+                list(self.filters or ()),
+                str(self.order_by),
+                term,
+                offset,
+                limit,
+            )
+            pks = current_admin.cache.get(namespace, key)
+            if pks is None:
+                pks = self.get_list_pks(term, offset, limit)
+                current_admin.cache.set(namespace, key, pks, timeout=self.cache_timeout)
+        if not pks:
+            return []
+
+        pk = getattr(self.model, self.pk)
+        position = {value: i for i, value in enumerate(pks)}
+        # The filters exclude the rows modified since the keys were cached.
+        models = self._apply_options(self.get_query()).filter(pk.in_(pks)).all()
+        return sorted(models, key=lambda m: position[getattr(m, self.pk)])
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Precomputed manifest of the admin views entry points.
+
+Discovering the ``invenio_admin.views`` entry points requires reading the
+metadata of every installed distribution. The manifest stores the entry
+points of the group in a single file, so the application can load them
+without scanning the distributions. It is generated with:
+
+.. code-block:: console
+
+    $ invenio admin manifest
+
+and enabled with :data:`invenio_admin.config.ADMIN_ENTRY_POINTS_MANIFEST`.
+The manifest is ignored when it is outdated, i.e. when the versions of the
+distributions providing the entry points changed or when distributions were
+installed or removed in a ``site-packages`` directory. Other import paths
+(e.g. the working directory added by gunicorn) may differ between the process
+writing the manifest and the processes loading it.
+"""
+
+from __future__ import absolute_import, print_function
+
+import importlib.metadata
+import json
+import os
+import sys
+
+from flask import current_app
+from invenio_base.utils import entry_points
+
+MANIFEST_VERSION = 1
+"""Version of the manifest format."""
+
+
+SITE_DIRECTORIES = ("site-packages", "dist-packages")
+"""Names of the directories distributions are installed in."""
+
+
+def _path_mtimes():
+    """Get modification times of the ``site-packages`` import paths.
+
+    Installing or removing a distribution modifies the directory it is
+    installed in.
+    """
+    mtimes = {}
+    for path in sys.path:
+        if os.path.basename(os.path.normpath(path)) not in SITE_DIRECTORIES:
+            continue
+        try:
+            mtimes[path] = os.stat(path).st_mtime
+        except OSError:
+            continue
+    return mtimes
+
+
+def build_manifest(group):
+    """Build the manifest of an entry point group.
+
+    :param group: Name of the entry point group.
+    :returns: The manifest as a dictionary.
+    """
+    eps, distributions = [], {}
+    for ep in entry_points(group=group):
+        dist = getattr(ep, "dist", None)
+        dist_name = dist.metadata["Name"] if dist else None
+        if dist_name:
+            distributions[dist_name] = dist.version
+        eps.append({"name": ep.name, "value": ep.value, "dist": dist_name})
+    return {
+        "version": MANIFEST_VERSION,
+        "group": group,
+        "distributions": distributions,
+        "paths": _path_mtimes(),
+        "entry_points": eps,
+    }
+
+
+def write_manifest(path, group):
+    """Write the manifest of an entry point group to a file.
+
+    :param path: Path of the manifest file.
+    :param group: Name of the entry point group.
+    :returns: The manifest as a dictionary.
+    """
+    manifest = build_manifest(group)
+    tmp_path = "{0}.tmp".format(path)
+    with open(tmp_path, "w") as fp:
+        json.dump(manifest, fp, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+    return manifest
+
+
+def is_valid(manifest, group):
+    """Check if a manifest is valid for the installed distributions.
+
+    :param manifest: The manifest as a dictionary.
+    :param group: Name of the entry point group.
+    :returns: ``True`` if the manifest can be used instead of discovering the
+        entry points.
+    """
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("group") != group:
+        return False
+    # Only the directories in the import paths of both processes are compared.
+    mtimes = _path_mtimes()
+    for path, mtime in manifest.get("paths", {}).items():
+        if path in mtimes and mtimes[path] != mtime:
+            return False
+    for name, version in manifest.get("distributions", {}).items():
+        try:
+            if importlib.metadata.version(name) != version:
+                return False
+        except importlib.metadata.PackageNotFoundError:
+            return False
+    return True
+
+
+def load_manifest(path, group):
+    """Load the entry points of a group from a manifest file.
+
+    :param path: Path of the manifest file.
+    :param group: Name of the entry point group.
+    :returns: List of entry points, or ``None`` if the manifest is missing or
+        outdated.
+    """
+    try:
+        with open(path) as fp:
+            manifest = json.load(fp)
+    except (OSError, ValueError):
+        current_app.logger.warning("Cannot read admin manifest %s.", path)
+        return None
+
+    if not is_valid(manifest, group):
+        current_app.logger.warning("Admin manifest %s is outdated.", path)
+        return None
+
+    return [
+        importlib.metadata.EntryPoint(name=ep["name"], value=ep["value"], group=group)
+        for ep in manifest["entry_points"]
+    ]
@@ -11,11 +11,14 @@ from flask_principal import ActionNeed
 action_admin_access = ActionNeed("admin-access")
 """Define the action needed by the default permission factory."""
 
+superuser_access = ActionNeed("superuser-access")
+"""Action of superusers (as defined by Invenio-Access)."""
+
 
 def admin_permission_factory(admin_view):
     """Default factory for creating a permission for an admin.
 
-    It tries to load a :class:`invenio_access.permissions.Permission`
+    It tries to load a :class:`invenio_admin.access.AdminPermission`
     instance if `invenio_access` is installed.
     Otherwise, it loads a :class:`flask_principal.Permission` instance.
 
@@ -25,8 +28,26 @@ def admin_permission_factory(admin_view):
     """
     try:
         importlib.metadata.version("invenio-access")
-        from invenio_access import Permission
+        from .access import AdminPermission as Permission
     except importlib.metadata.PackageNotFoundError:
         from flask_principal import Permission
 
     return Permission(action_admin_access)
+
+
+def superuser_permission_factory(admin_view):
+    """Factory for creating a permission restricted to superusers.
+
+    Used by default for the query inspector of the admin list views.
+
+    :param admin_view: Instance of administration view which is currently being
+        protected.
+    :returns: Permission instance.
+    """
+    try:
+        importlib.metadata.version("invenio-access")
+        from .access import AdminPermission as Permission
+    except importlib.metadata.PackageNotFoundError:
+        from flask_principal import Permission
+
+    return Permission(superuser_access)
@@ -0,0 +1,202 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Cached primary keys of filtered admin lists.
+
+Paging through a filtered list normally runs the filtered query and its count
+again for every page. Model views with ``pk_cache_enabled = True`` instead
+store the sorted primary keys matching the filters, search and sort in the
+admin cache (see :mod:`invenio_admin.cache`) the first time the list is
+displayed. Further pages only fetch their records with ``WHERE pk IN (...)``:
+
+.. code-block:: python
+
+    class HarvestJobModelView(ModelView):
+        pk_cache_enabled = True
+        pk_cache_timeout = 60
+
+The keys are cached per permission key of the current identity (see
+:func:`~invenio_admin.cache.permission_key`), so views whose
+``get_query`` depends on the user never share their lists across users with
+different permissions.
+
+The cached keys of a model are invalidated whenever a session commits
+changes to instances of the model. The invalidation is seen by the processes
+sharing the cache backend: with the default in-process cache (without
+Invenio-Cache, see :data:`invenio_admin.config.ADMIN_CACHE_BACKEND`), other
+workers keep serving their keys until they expire after
+``pk_cache_timeout``. Bulk updates and deletes executed without the ORM unit
+of work are only reflected when the cache entry expires.
+"""
+
+from __future__ import absolute_import, print_function
+
+from flask import current_app, has_app_context
+from flask_admin.contrib.sqla import ModelView
+from sqlalchemy import event
+from sqlalchemy.orm import Session, joinedload
+
+from .cache import permission_key
+from .proxies import current_admin
+
+_tracked_models = set()
+
+
+def model_namespace(model):
+    """Get the admin cache namespace of the entries derived from a model.
+
+    The namespace is invalidated whenever instances of the model are
+    committed, see :func:`track_model`.
+
+    :param model: The model class.
+    :returns: Name of the namespace.
+    """
+    return "models:{0}".format(model.__table__.name)
+
+
+def invalidate_model(model):
+    """Invalidate the cached entries derived from a model.
+
+    :param model: The model class.
+    """
+    current_admin.cache.invalidate(model_namespace(model))
+
+
+def _after_flush(session, flush_context):
+    """Collect the tracked models modified by a flush."""
+    changed = session.info.setdefault("invenio_admin_changed", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if type(obj) in _tracked_models:
+            changed.add(type(obj))
+
+
+def _after_commit(session):
+    """Invalidate the cached primary keys of the committed models.
+
+    Nothing is done in applications without an enabled admin interface
+    (e.g. Celery workers sharing the models).
+    """
+    changed = session.info.pop("invenio_admin_changed", None)
+    if not changed or not has_app_context():
+        return
+    state = current_app.extensions.get("invenio-admin")
+    if state is None or not state.enabled:
+        return
+    for model in changed:
+        state.cache.invalidate(model_namespace(model))
+
+
+def _after_rollback(session, previous_transaction):
+    """Forget the models modified by a rolled back transaction."""
+    session.info.pop("invenio_admin_changed", None)
+
+
+def track_model(model):
+    """Invalidate the cached primary keys when a model is committed.
+
+    :param model: The model class.
+    """
+    _tracked_models.add(model)
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "after_commit", _after_commit)
+        event.listen(Session, "after_soft_rollback", _after_rollback)
+
+
+class PKCacheMixin(object):
+    """Page filtered lists through cached primary keys."""
+
+    pk_cache_enabled = False
+    """Cache the primary keys of filtered lists."""
+
+    pk_cache_timeout = 60
+    """Expiration of the cached primary keys in seconds."""
+
+    pk_cache_max_size = 10000
+    """Lists with more records than this are not cached."""
+
+    def _pk_cache_key(self, sort_column, sort_desc, search, filters):
+        """Get the cache key of the primary keys of a list."""
+        return (
+            "pks",
+            self.endpoint,
+            sort_column,
+            bool(sort_desc),
+            search or None,
+            [tuple(f) for f in filters or ()],
+            permission_key(),
+        )
+
+    def get_cached_pks(self, sort_column, sort_desc, search, filters):
+        """Get the sorted primary keys of the records of a list.
+
+        :param sort_column: Sort column name.
+        :param sort_desc: Descending or ascending sort.
+        :param search: Search query.
+        :param filters: List of filter tuples.
+        :returns: List of primary key values, or ``None`` if the list is too
+            large to be cached.
+        """
+        track_model(self.model)
+        cache = current_admin.cache
+        namespace = model_namespace(self.model)
+        key = self._pk_cache_key(sort_column, sort_desc, search, filters)
+        pks = cache.get(namespace, key)
+        if pks is None:
+            query, joins = self.get_filtered_query(search, filters)
+            query, joins = self._apply_sorting(query, joins, sort_column, sort_desc)
+            pk_column = getattr(self.model, self._primary_key)
+            rows = query.with_entities(pk_column).limit(self.pk_cache_max_size + 1)
+            pks = [row[0] for row in rows]
+            if len(pks) > self.pk_cache_max_size:
+                return None
+            cache.set(namespace, key, pks, timeout=self.pk_cache_timeout)
+        return pks
+
+    def get_list(
+        self,
+        page,
+        sort_column,
+        sort_desc,
+        search,
+        filters,
+        execute=True,
+        page_size=None,
+    ):
+        """Get a page of records through the cached primary keys."""
+        get_list = super(PKCacheMixin, self).get_list
+        if (
+            not self.pk_cache_enabled
+            or not execute
+            or not isinstance(self, ModelView)
+            or isinstance(self._primary_key, tuple)
+        ):
+            return get_list(
+                page, sort_column, sort_desc, search, filters, execute, page_size
+            )
+
+        pks = self.get_cached_pks(sort_column, sort_desc, search, filters)
+        if pks is None:
+            return get_list(
+                page, sort_column, sort_desc, search, filters, execute, page_size
+            )
+
+        if page_size is None:
+            page_size = self.page_size
+        if page_size:
+            page = page or 0
+            page_pks = pks[page * page_size : (page + 1) * page_size]
+        else:
+            page_pks = pks
+        if not page_pks:
+            return len(pks), []
+
+        pk_column = getattr(self.model, self._primary_key)
+        query = self.get_query().filter(pk_column.in_(page_pks))
+        for j in self._auto_joins:
+            query = query.options(joinedload(j))
+        position = {pk: i for i, pk in enumerate(page_pks)}
+        records = sorted(
+            query.all(), key=lambda m: position[getattr(m, self._primary_key)]
+        )
+        return len(pks), records
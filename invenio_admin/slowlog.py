@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Log of slow admin requests with SQL query attribution.
+
+When :data:`invenio_admin.config.ADMIN_SLOW_REQUEST_THRESHOLD` is set, the
+SQL statements executed while a protected admin view handles a request are
+timed. Requests slower than the threshold are logged as a JSON object with
+the view endpoint, the user id, the query arguments (filters, search, sort
+and page), the number and total time of SQL statements and the slowest
+statements:
+
+.. code-block:: json
+
+    {"event": "slow_admin_request", "endpoint": "user.index_view",
+     "user_id": "1", "args": {"flt0_0": ["..."]}, "duration_ms": 1530.2,
+     "sql_count": 3, "sql_time_ms": 1490.7,
+     "slowest_sql": [{"statement": "SELECT ...", "duration_ms": 1400.1}]}
+"""
+
+from __future__ import absolute_import, print_function
+
+import json
+import time
+
+from flask import current_app, g, has_app_context, request
+from flask_login import current_user
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class RequestProfile(object):
+    """SQL statements executed during an admin request."""
+
+    def __init__(self):
+        """Initialize the profile."""
+        self.start = time.perf_counter()
+        self.statements = []
+
+    def add(self, statement, duration):
+        """Record an executed statement.
+
+        :param statement: SQL statement.
+        :param duration: Execution time in seconds.
+        """
+        self.statements.append((duration, statement))
+
+    def report(self, top_n):
+        """Create the log entry of the request.
+
+        :param top_n: Number of slowest statements to report.
+        :returns: Dictionary with the request duration and its SQL statements.
+        """
+        slowest = sorted(self.statements, key=lambda s: s[0], reverse=True)[:top_n]
+        return {
+            "event": "slow_admin_request",
+            "endpoint": request.endpoint,
+            "method": request.method,
+            "user_id": current_user.get_id(),
+            "args": request.args.to_dict(flat=False),
+            "duration_ms": round((time.perf_counter() - self.start) * 1000, 3),
+            "sql_count": len(self.statements),
+            "sql_time_ms": round(sum(s[0] for s in self.statements) * 1000, 3),
+            "slowest_sql": [
+                {"statement": statement, "duration_ms": round(duration * 1000, 3)}
+                for duration, statement in slowest
+            ],
+        }
+
+
+def _current_profile():
+    """Get the profile of the current admin request, if any."""
+    if has_app_context():
+        return g.get("invenio_admin_profile")
+    return None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Start timing a statement."""
+    if _current_profile() is not None:
+        conn.info.setdefault("invenio_admin_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Record the duration of a statement."""
+    profile = _current_profile()
+    starts = conn.info.get("invenio_admin_start")
+    if profile is not None and starts:
+        profile.add(statement, time.perf_counter() - starts.pop())
+
+
+def install_listeners():
+    """Listen to the execution of SQL statements on all engines."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def start_profile():
+    """Start profiling the current admin request."""
+    if current_app.config.get("ADMIN_SLOW_REQUEST_THRESHOLD") is not None:
+        g.invenio_admin_profile = RequestProfile()
+
+
+def finish_profile():
+    """Log the current admin request if it was slower than the threshold."""
+    profile = g.pop("invenio_admin_profile", None)
+    if profile is None:
+        return
+    threshold = current_app.config["ADMIN_SLOW_REQUEST_THRESHOLD"]
+    if time.perf_counter() - profile.start >= threshold:
+        current_app.logger.warning(
+            json.dumps(
+                profile.report(current_app.config["ADMIN_SLOW_REQUEST_TOP_N"]),
+                default=str,
+            )
+        )
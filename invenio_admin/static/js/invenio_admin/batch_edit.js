@@ -0,0 +1,85 @@
+// SPDX-FileCopyrightText: 2026 CERN.
+// SPDX-License-Identifier: MIT
+
+// Queue inline edits of the list view and save them in one request.
+(function ($) {
+  "use strict";
+
+  $(function () {
+    var $panel = $("#invenio-admin-batch-edit");
+    if (!$panel.length) {
+      return;
+    }
+    var url = $panel.data("url");
+    var versions = $panel.data("versions") || {};
+    // Row classes of the Bootstrap version of the templates.
+    var queuedClass = $panel.data("queued-class");
+    var failedClass = $panel.data("failed-class");
+    var $button = $panel.find("button");
+    var queue = {};
+    var csrfToken = null;
+
+    function rows(pk) {
+      return $('[data-role^="x-editable"][data-pk="' + pk + '"]').closest("tr");
+    }
+
+    function refresh() {
+      var count = Object.keys(queue).length;
+      $button.find(".count").text(count);
+      $panel.toggle(count > 0);
+    }
+
+    // Queue the edit instead of posting it (x-editable calls ``url`` with
+    // the form data built by Flask-Admin).
+    function enqueue(params) {
+      var pk = String(params.list_form_pk);
+      var edit = queue[pk] || { pk: pk, version: versions[pk], data: {} };
+      $.each(params, function (name, value) {
+        if (name === "csrf_token") {
+          csrfToken = value;
+        } else if (name !== "list_form_pk") {
+          edit.data[name] = value;
+        }
+      });
+      queue[pk] = edit;
+      rows(pk).removeClass(failedClass).addClass(queuedClass);
+      refresh();
+      return $.Deferred().resolve().promise();
+    }
+
+    $('[data-role^="x-editable"]').editable("option", "url", enqueue);
+
+    $button.on("click", function () {
+      var edits = $.map(queue, function (edit) {
+        return edit;
+      });
+      $button.prop("disabled", true);
+      $.ajax({
+        url: url,
+        method: "POST",
+        contentType: "application/json",
+        dataType: "json",
+        data: JSON.stringify({ csrf_token: csrfToken, edits: edits }),
+      })
+        .always(function (data, status, xhr) {
+          var result = data && data.responseJSON ? data.responseJSON : data;
+          if (!result || !result.updated) {
+            return;
+          }
+          $.each(result.updated, function (pk, version) {
+            versions[pk] = version;
+            delete queue[pk];
+            rows(pk).removeClass(queuedClass + " " + failedClass);
+          });
+          $.each(result.errors, function (pk, message) {
+            rows(pk).removeClass(queuedClass).addClass(failedClass)
+              .attr("title", message);
+          });
+        })
+        .always(function () {
+          $button.prop("disabled", false);
+          refresh();
+        });
+    });
+  });
+})(jQuery);
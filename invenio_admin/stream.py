@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Live updates of admin list views over Server-Sent Events.
+
+Model views with ``can_stream = True`` expose ``/admin/<endpoint>/stream/``,
+an event stream pushing the records changed since a cursor. Records are
+detected as changed using ``stream_cursor_column`` (e.g. an ``updated``
+timestamp), or the primary key by default, which only detects new records:
+
+.. code-block:: python
+
+    class HarvestJobModelView(ModelView):
+        can_stream = True
+        stream_cursor_column = 'updated'
+
+The clients of a view with the same permission key (see
+:func:`invenio_admin.cache.permission_key`) share one :class:`ChangePoller`,
+so the database is queried at most once per ``stream_interval`` seconds for
+each set of permissions regardless of the number of open pages, and records
+of a ``get_query`` restricted by user are never pushed to other users. The cursor is sent as the event id, so browsers resume from
+the last received record when reconnecting.
+
+The search and filters of the list (``search`` and ``flt*`` arguments, as in
+the list URL) are applied to the streamed records: these clients query their
+changes only when the shared poller detected new ones.
+
+Each open stream occupies a worker of the server until
+:data:`invenio_admin.config.ADMIN_STREAM_TIMEOUT`, mostly waiting between
+two polls. Streams are therefore disabled by default and should only be
+enabled with a server handling many concurrent connections (e.g. gunicorn
+with gevent workers, or an asynchronous server); a few open pages are enough
+to exhaust a pool of synchronous workers.
+
+.. note::
+
+    Records committed with a cursor value lower than the one of an already
+    seen record (e.g. long transactions setting ``updated``) are not
+    detected.
+"""
+
+from __future__ import absolute_import, print_function
+
+import datetime
+import json
+import threading
+import time
+from collections import deque
+
+from flask import Response, abort, current_app, request, stream_with_context
+from flask_admin.base import expose
+from sqlalchemy import func
+
+from .api import decode_cursor, encode_cursor, json_default
+from .cache import permission_key
+
+
+class ChangePoller(object):
+    """Poll the changed records of a view on behalf of all its clients."""
+
+    def __init__(self, view, interval, maxsize=1000):
+        """Initialize the poller.
+
+        :param view: The model view to poll.
+        :param interval: Minimum number of seconds between two queries.
+        :param maxsize: Number of changes kept in memory.
+        """
+        self.view = view
+        self.interval = interval
+        self.changes = deque(maxlen=maxsize)
+        self.initialized = False
+        self.horizon = None
+        self.high_water = None
+        self.last_poll = None
+        self._lock = threading.Lock()
+
+    def poll(self):
+        """Fetch new changes if the last query is older than the interval.
+
+        Only one client queries at a time; the others use the changes fetched
+        so far.
+        """
+        now = time.monotonic()
+        if self.last_poll is not None and now - self.last_poll < self.interval:
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self.last_poll = now
+            if not self.initialized:
+                # Changes are tracked from the current state onwards.
+                self.horizon = self.high_water = self.view.get_stream_high_water()
+                self.initialized = True
+                return
+            for cursor, record in self.view.get_stream_changes(
+                self.high_water, self.changes.maxlen
+            ):
+                if len(self.changes) == self.changes.maxlen:
+                    # The oldest change is dropped from memory.
+                    self.horizon = self.changes[0][0]
+                self.changes.append((cursor, record))
+                self.high_water = cursor
+        finally:
+            self._lock.release()
+
+    def since(self, cursor):
+        """Get the changes after a cursor.
+
+        :param cursor: Cursor value of the last change seen by the client.
+        :returns: List of ``(cursor, record)`` tuples, or ``None`` if the
+            changes after the cursor are not in memory.
+        """
+        if not self.initialized:
+            return None
+        horizon = self.horizon
+        if horizon is not None and (cursor is None or cursor < horizon):
+            return None
+        return [c for c in list(self.changes) if cursor is None or c[0] > cursor]
+
+
+class StreamMixin(object):
+    """Server-Sent Events endpoint of a model view."""
+
+    can_stream = False
+    """Expose the live updates stream of the list view."""
+
+    stream_cursor_column = None
+    """Column detecting changed records (default: the primary key)."""
+
+    stream_interval = 5
+    """Seconds between two database queries of the stream."""
+
+    _stream_pollers = None
+
+    def _stream_column(self):
+        """Get the cursor column of the stream."""
+        if self.stream_cursor_column:
+            return getattr(self.model, self.stream_cursor_column)
+        return getattr(self.model, self._primary_key_attrs()[0])
+
+    def _stream_cursor_value(self, cursor):
+        """Decode a stream cursor into a value of the cursor column."""
+        values = decode_cursor(cursor)
+        if len(values) != 1:
+            abort(400)
+        column = self._stream_column()
+        try:
+            if issubclass(column.type.python_type, datetime.datetime):
+                return datetime.datetime.fromisoformat(values[0])
+        except (NotImplementedError, TypeError, ValueError):
+            abort(400)
+        return values[0]
+
+    def get_stream_high_water(self):
+        """Get the current maximum of the cursor column.
+
+        :returns: Value of the cursor column.
+        """
+        column = self._stream_column()
+        value = self.session.query(func.max(column)).scalar()
+        self.session.rollback()
+        return value
+
+    def get_stream_changes(self, after, limit, search=None, filters=None):
+        """Get the records changed after a cursor value.
+
+        :param after: Value of the cursor column.
+        :param limit: Maximum number of records.
+        :param search: Search query of the list.
+        :param filters: Active filters of the list.
+        :returns: List of ``(cursor, record)`` tuples ordered by cursor.
+        """
+        column = self._stream_column()
+        query, _ = self.get_filtered_query(search, filters)
+        if after is not None:
+            query = query.filter(column > after)
+        query = query.order_by(None).order_by(column).limit(limit)
+        attr = column.key
+        changes = [
+            (getattr(m, attr), self.serialize_api_record(m, self._list_columns))
+            for m in query
+        ]
+        self.session.rollback()
+        return changes
+
+    def get_stream_poller(self):
+        """Get the change poller of the current identity's permissions.
+
+        It is shared by all clients with the same permission key.
+
+        :returns: A :class:`ChangePoller`.
+        """
+        if self._stream_pollers is None:
+            self._stream_pollers = {}
+        key = permission_key()
+        poller = self._stream_pollers.get(key)
+        if poller is None:
+            poller = self._stream_pollers.setdefault(
+                key, ChangePoller(self, self.stream_interval)
+            )
+        return poller
+
+    @expose("/stream/")
+    def stream_view(self):
+        """Stream the changed records."""
+        if not self.can_stream:
+            abort(404)
+        cursor = request.headers.get("Last-Event-ID") or request.args.get("cursor")
+        after = self._stream_cursor_value(cursor) if cursor else None
+        poller = self.get_stream_poller()
+        timeout = current_app.config["ADMIN_STREAM_TIMEOUT"]
+        view_args = self._get_list_extra_args()
+        search, filters = view_args.search, view_args.filters
+        filtered = bool(search or filters)
+
+        def generate():
+            nonlocal after
+            # Browsers reconnect after the stream times out.
+            yield "retry: {0}\n\n".format(int(self.stream_interval * 1000))
+            poller.poll()
+            if after is None:
+                after = poller.high_water
+            deadline = time.monotonic() + timeout
+            checked = None
+            while True:
+                poller.poll()
+                limit = poller.changes.maxlen or 1000
+                if filtered:
+                    changes = []
+                    if checked is None or poller.high_water != checked:
+                        checked = poller.high_water
+                        changes = self.get_stream_changes(after, limit, search, filters)
+                else:
+                    changes = poller.since(after)
+                    if changes is None:
+                        changes = self.get_stream_changes(after, limit)
+                for cursor, record in changes:
+                    after = cursor
+                    yield "id: {0}\nevent: change\ndata: {1}\n\n".format(
+                        encode_cursor([cursor]),
+                        json.dumps(record, default=json_default),
+                    )
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(self.stream_interval)
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
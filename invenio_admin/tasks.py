@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Celery tasks of Invenio-Admin.
+
+The module is loaded by every Celery worker of Invenio-Celery, so the admin
+interface is only imported when a task runs.
+"""
+
+from __future__ import absolute_import, print_function
+
+from celery import shared_task
+from flask import current_app
+
+
+@shared_task(ignore_result=True)
+def refresh_dashboard():
+    """Refresh the statistics of the admin dashboard."""
+    state = current_app.extensions.get("invenio-admin")
+    if state is not None and state.enabled:
+        from .dashboard import refresh_stats
+
+        refresh_stats(state)
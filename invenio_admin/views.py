@@ -7,17 +7,240 @@
 
 from __future__ import absolute_import, print_function
 
-from flask import Blueprint, current_app, redirect, request, url_for
+import hashlib
+from datetime import timezone
+
+from flask import (
+    Blueprint,
+    abort,
+    current_app,
+    flash,
+    g,
+    make_response,
+    redirect,
+    request,
+    session,
+    url_for,
+)
+from flask_admin.babel import gettext
+from flask_admin.model import BaseModelView
+from flask_admin.model.helpers import get_mdict_item_or_list
 from flask_login import current_user
+from wtforms import HiddenField
 
+from .api import APIMixin
+from .assets import asset_url
+from .audit import AuditMixin
+from .batch import BatchEditMixin
+from .explain import ExplainMixin
+from .facets import FacetsMixin
+from .formatters import BlobColumnMixin, JSONColumnMixin
+from .pkcache import PKCacheMixin
 from .proxies import current_admin
+from .slowlog import finish_profile, start_profile
+from .stream import StreamMixin
 
 blueprint = Blueprint(
     "invenio_admin",
     __name__,
+    template_folder="templates",
+    static_folder="static",
+    static_url_path="/invenio_admin/static",
 )
 
 
+class ProtectedModelViewMixin(
+    PKCacheMixin,
+    AuditMixin,
+    APIMixin,
+    BlobColumnMixin,
+    BatchEditMixin,
+    ExplainMixin,
+    FacetsMixin,
+    JSONColumnMixin,
+    StreamMixin,
+):
+    """Additional behaviour for protected model views.
+
+    The mixin is added automatically by :func:`protected_adminview_factory`
+    when the protected class is a Flask-Admin model view.
+    """
+
+    etag_version_attr = "version_id"
+    """Model attribute used to compute the ETag of a record."""
+
+    last_modified_attr = "updated"
+    """Model attribute used as the Last-Modified date of a record."""
+
+    conditional_views = ("details_view", "edit_view")
+    """View functions answering conditional requests."""
+
+    etag_form_field = "invenio_admin_etag"
+    """Name of the hidden field of the edit form holding the ETag."""
+
+    def render(self, template, **kwargs):
+        """Render the default list template with Invenio-Admin's extensions.
+
+        Views with a custom ``list_template`` are left untouched.
+        """
+        if (
+            template == BaseModelView.list_template
+            and blueprint.name in current_app.blueprints
+        ):
+            template = "invenio_admin/model/list.html"
+        return super(ProtectedModelViewMixin, self).render(template, **kwargs)
+
+    def get_validators(self, model):
+        """Get the HTTP cache validators of a model.
+
+        :param model: Model instance.
+        :returns: Tuple of ETag and Last-Modified date, or ``None`` if the
+            model has neither a version nor an update timestamp.
+        """
+        version = getattr(model, self.etag_version_attr, None)
+        updated = getattr(model, self.last_modified_attr, None)
+        if version is None and updated is None:
+            return None
+        if updated is not None:
+            if updated.tzinfo is None:
+                updated = updated.replace(tzinfo=timezone.utc)
+            # HTTP dates only have a resolution of seconds.
+            updated = updated.replace(microsecond=0)
+        # Rendered pages depend on the user (e.g. menus, CSRF tokens).
+        key = "{0}:{1}:{2}:{3}:{4}".format(
+            self.endpoint,
+            self.get_pk_value(model),
+            version,
+            updated.isoformat() if updated else "",
+            current_user.get_id(),
+        )
+        return hashlib.sha1(key.encode("utf-8")).hexdigest(), updated
+
+    def get_one(self, id):
+        """Get a record, reusing the one loaded for the conditional request."""
+        record = g.pop("invenio_admin_record", None)
+        if record is not None and record[:2] == (self.endpoint, id):
+            return record[2]
+        return super(ProtectedModelViewMixin, self).get_one(id)
+
+    def get_edit_form(self):
+        """Add the hidden ETag field to the edit form."""
+        form_class = super(ProtectedModelViewMixin, self).get_edit_form()
+        return type(
+            form_class.__name__,
+            (form_class,),
+            {self.etag_form_field: ETagField()},
+        )
+
+    def edit_form(self, obj=None):
+        """Fill the ETag field with the version of the edited record."""
+        form = super(ProtectedModelViewMixin, self).edit_form(obj=obj)
+        field = getattr(form, self.etag_form_field, None)
+        if (
+            field is not None
+            and obj is not None
+            and request.method == "GET"
+            and current_app.config.get("ADMIN_CONDITIONAL_REQUESTS")
+        ):
+            validators = self.get_validators(obj)
+            field.data = validators[0] if validators else None
+        return form
+
+    def _get_ruleset_missing_fields(self, ruleset, form):
+        """Keep the ETag field in edit forms with rules."""
+        missing_fields = super(
+            ProtectedModelViewMixin, self
+        )._get_ruleset_missing_fields(ruleset, form)
+        return [name for name in missing_fields if name != self.etag_form_field]
+
+    def _run_view(self, fn, *args, **kwargs):
+        """Answer conditional requests on detail and edit views.
+
+        ``GET`` requests matching ``If-None-Match`` or ``If-Modified-Since``
+        are answered with ``304 Not Modified`` without rendering the template,
+        while ``POST`` requests not matching ``If-Match`` or
+        ``If-Unmodified-Since`` are rejected with ``412 Precondition Failed``.
+        Edit forms submitted with the ETag of an outdated version are
+        redirected back to the latest version with a flashed error.
+        """
+        run_view = super(ProtectedModelViewMixin, self)._run_view
+        if fn.__name__ not in self.conditional_views or not current_app.config.get(
+            "ADMIN_CONDITIONAL_REQUESTS"
+        ):
+            return run_view(fn, *args, **kwargs)
+
+        id = get_mdict_item_or_list(request.args, "id")
+        model = self.get_one(id) if id is not None else None
+        validators = self.get_validators(model) if model is not None else None
+        if validators is None:
+            return run_view(fn, *args, **kwargs)
+        etag, last_modified = validators
+
+        if request.method in ("GET", "HEAD"):
+            # Pending flashed messages must be rendered.
+            if "_flashes" not in session and _is_not_modified(etag, last_modified):
+                return _set_validators(
+                    current_app.response_class(status=304), etag, last_modified
+                )
+        elif not _is_precondition_met(etag, last_modified):
+            abort(412)
+        elif request.form.get(self.etag_form_field, etag) not in ("", etag):
+            flash(
+                gettext(
+                    "The record was modified by someone else. "
+                    "Review its latest version before saving your changes."
+                ),
+                "error",
+            )
+            return redirect(request.url)
+
+        # The view gets the record from get_one() instead of loading it again.
+        g.invenio_admin_record = (self.endpoint, id, model)
+        try:
+            response = make_response(run_view(fn, *args, **kwargs))
+        finally:
+            g.pop("invenio_admin_record", None)
+        if request.method in ("GET", "HEAD") and response.status_code == 200:
+            _set_validators(response, etag, last_modified)
+        return response
+
+
+class ETagField(HiddenField):
+    """Hidden field holding the ETag of the edited record."""
+
+    def populate_obj(self, obj, name):
+        """Never store the ETag in the record."""
+
+
+def _is_not_modified(etag, last_modified):
+    """Check if the client's cached copy is still fresh."""
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def _is_precondition_met(etag, last_modified):
+    """Check if a modification request was made against the latest version."""
+    if request.if_match and not request.if_match.contains(etag):
+        return False
+    if request.if_unmodified_since and last_modified:
+        return last_modified <= request.if_unmodified_since
+    return True
+
+
+def _set_validators(response, etag, last_modified):
+    """Set cache validators on a response."""
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    # Browsers must revalidate the page on every access.
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
 def protected_adminview_factory(base_class):
     """Factory for creating protected admin view classes.
 
@@ -29,12 +252,18 @@ def protected_adminview_factory(base_class):
     methods. Super is called for both methods, so the base class can implement
     further restrictions if needed.
 
+    Model views are additionally extended with
+    :class:`ProtectedModelViewMixin`.
+
     :param base_class: Class to use as base class.
     :type base_class: :class:`flask_admin.base.BaseView`
     :returns: Admin view class which provides authentication and authorization.
     """
+    bases = (base_class,)
+    if issubclass(base_class, BaseModelView):
+        bases = (ProtectedModelViewMixin, base_class)
 
-    class ProtectedAdminView(base_class):
+    class ProtectedAdminView(*bases):
         """Admin view class protected by authentication."""
 
         def _handle_view(self, name, **kwargs):
@@ -58,8 +287,29 @@ def protected_adminview_factory(base_class):
                         "content_security_policy",
                         None,
                     )
+            start_profile()
             return super(ProtectedAdminView, self)._handle_view(name, **kwargs)
 
+        def _run_view(self, fn, *args, **kwargs):
+            """Track the memory and time used by the view if requested."""
+            run_view = super(ProtectedAdminView, self)._run_view
+            try:
+                if current_app.config.get("ADMIN_WARMUP_REPORT"):
+                    return current_admin.memory_report.track(
+                        run_view, fn, *args, **kwargs
+                    )
+                return run_view(fn, *args, **kwargs)
+            finally:
+                finish_profile()
+
+        def get_url(self, endpoint, **kwargs):
+            """Link the fingerprinted copies of Flask-Admin's static files."""
+            if endpoint == "{0}.static".format(self.admin.endpoint):
+                url = asset_url(kwargs.get("filename"))
+                if url:
+                    return url
+            return super(ProtectedAdminView, self).get_url(endpoint, **kwargs)
+
         def is_accessible(self):
             """Require authentication and authorization."""
             return (
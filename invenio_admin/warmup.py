@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Warm up the admin interface before forking worker processes.
+
+Preforking servers (e.g. ``gunicorn --preload``) create the application in a
+master process and fork the workers from it. Building everything the admin
+interface otherwise creates lazily (compiled templates, the URL matcher) in
+the master process
+allows the workers to share these memory pages copy-on-write instead of
+building their own copy. Enable it with
+:data:`invenio_admin.config.ADMIN_WARMUP`.
+
+Collections of the garbage collector in the workers still touch (and copy)
+the pages of the objects created in the master process. Freezing them with
+:func:`gc.freeze` avoids it, but changes the garbage collection of the whole
+application: all objects allocated so far are never collected. It is best
+done by the server right before forking, e.g. in gunicorn's configuration:
+
+.. code-block:: python
+
+    def pre_fork(server, worker):
+        gc.freeze()
+
+or by the warmup itself with
+:data:`invenio_admin.config.ADMIN_WARMUP_GC_FREEZE`.
+
+With :data:`invenio_admin.config.ADMIN_WARMUP_REPORT` each worker tracks and
+logs the unique memory (pages not shared with other processes) it allocates
+while serving admin requests.
+"""
+
+from __future__ import absolute_import, print_function
+
+import gc
+import os
+import time
+from contextlib import contextmanager
+
+from flask import current_app
+
+from .bytecode import precompile_templates
+
+
+def unique_memory():
+    """Get the unique set size (USS) of the current process.
+
+    :returns: Memory only used by this process in bytes, or ``None`` if it
+        cannot be determined on this platform.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as fp:
+            lines = fp.readlines()
+    except OSError:
+        return None
+    uss = 0
+    for line in lines:
+        if line.startswith(("Private_Clean:", "Private_Dirty:")):
+            uss += int(line.split()[1]) * 1024
+    return uss
+
+
+def warmup_admin(state):
+    """Build the lazily created parts of the admin interface.
+
+    :param state: The :class:`invenio_admin.ext._AdminState` to warm up.
+    :returns: Dictionary reporting the warmed up views and templates and the
+        unique memory of the process before and after the warmup.
+    """
+    app, admin = state.app, state.admin
+    uss_before = unique_memory()
+
+    # Views, their forms and filters are built on registration; the URL
+    # matcher and the templates are only built on first use.
+    app.url_map.update()
+    templates = precompile_templates(app, admin)
+
+    if app.config.get("ADMIN_WARMUP_GC_FREEZE") and hasattr(gc, "freeze"):
+        # Move the created objects out of the garbage collector generations,
+        # so that collections in the workers do not touch their pages.
+        gc.collect()
+        gc.freeze()
+
+    return {
+        "views": len(admin._views),
+        "templates": templates,
+        "uss_before": uss_before,
+        "uss_after": unique_memory(),
+    }
+
+
+class MemoryReport(object):
+    """Track the unique memory allocated by admin requests per worker."""
+
+    def __init__(self):
+        """Initialize the report."""
+        self.pid = None
+        self.requests = 0
+        self.allocated = 0
+
+    def track(self, fn, *args, **kwargs):
+        """Run a view function and track the unique memory it allocated.
+
+        :param fn: Function to run.
+        :returns: Return value of the function.
+        """
+        before = unique_memory()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            after = unique_memory()
+            if before is not None and after is not None:
+                self._add(after - before)
+
+    def _add(self, allocated):
+        """Add the memory allocated by one request of this process."""
+        pid = os.getpid()
+        if pid != self.pid:
+            # Forked worker: start a new report.
+            self.pid, self.requests, self.allocated = pid, 0, 0
+        self.requests += 1
+        self.allocated += allocated
+        current_app.logger.info(
+            "Admin memory report: pid=%s requests=%s unique_memory=%s",
+            self.pid,
+            self.requests,
+            self.allocated,
+        )
+
+
+class StartupCost(object):
+    """Time and unique memory spent building the admin interface.
+
+    The amount saved by skipping entry points (or the whole interface) is
+    the difference with the cost logged by a process loading them all.
+    """
+
+    def __init__(self):
+        """Initialize the report."""
+        self.seconds = 0.0
+        self.unique_memory = None
+        self.entry_points = {}
+        self.skipped = []
+
+    @contextmanager
+    def measure(self):
+        """Add the time and unique memory spent in a block to the report."""
+        started, before = time.perf_counter(), unique_memory()
+        try:
+            yield
+        finally:
+            self.seconds += time.perf_counter() - started
+            after = unique_memory()
+            if before is not None and after is not None:
+                self.unique_memory = (self.unique_memory or 0) + after - before
+
+    def load(self, ep):
+        """Load an entry point and record the time spent importing it.
+
+        :param ep: The entry point.
+        :returns: The loaded object.
+        """
+        started = time.perf_counter()
+        try:
+            return ep.load()
+        finally:
+            self.entry_points[ep.name] = time.perf_counter() - started
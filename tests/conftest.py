@@ -10,6 +10,7 @@ from __future__ import absolute_import, print_function
 import shutil
 import tempfile
 import uuid
+from datetime import datetime
 
 import pytest
 from flask import Flask
@@ -34,7 +35,8 @@ from sqlalchemy_utils.types import UUIDType
 
 from invenio_admin import InvenioAdmin
 from invenio_admin.ext import finalize_app
-from invenio_admin.permissions import action_admin_access
+from invenio_admin.filters import FilterConverter
+from invenio_admin.permissions import action_admin_access, superuser_access
 from invenio_admin.views import blueprint
 
 
@@ -52,10 +54,32 @@ class TestModel(db.Model):
         nullable=True,
     )
 
+    email = db.Column(db.String(255), nullable=True)
+    """E-mail address test column."""
+
+    json = db.Column(db.JSON, nullable=True)
+    """JSON test column."""
+
+    blob = db.Column(db.LargeBinary, nullable=True)
+    """Binary test column."""
+
+    updated = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    """Last update of the model."""
+
+    version_id = db.Column(db.Integer, nullable=False)
+    """Version of the model."""
+
+    __mapper_args__ = {"version_id_col": version_id}
+
 
 class TestModelView(ModelView):
     """AdminModelView of the TestModel."""
 
+    can_view_details = True
+    column_editable_list = ("email",)
+    column_filters = ("uuidcol",)
+    filter_converter = FilterConverter()
+
 
 class TestBase(BaseView):
     """Base AdminView."""
@@ -91,7 +115,13 @@ def testmodelcls():
 
 
 @pytest.fixture()
-def app(request):
+def app_config():
+    """Configuration of the application fixture, overridden by test modules."""
+    return {}
+
+
+@pytest.fixture()
+def app(request, app_config):
     """Flask application fixture."""
     instance_path = tempfile.mkdtemp()
     app = Flask("testapp", instance_path=instance_path)
@@ -104,6 +134,7 @@ def app(request):
         THEME_ICONS=[],
         DB_VERSIONING=False,
     )
+    app.config.update(app_config)
     Babel(app)
     InvenioDB(app)
     InvenioAccess(app)
@@ -132,8 +163,10 @@ def app(request):
     def on_identity_loaded(sender, identity):
         identity.user = current_user
         identity.provides.add(UserNeed(current_user.id))
-        if current_user.id == 1:
+        if current_user.id in (1, 3):
             identity.provides.add(action_admin_access)
+        if current_user.id == 3:
+            identity.provides.add(superuser_access)
 
     # Register admin view
     InvenioAdmin(app, permission_factory=lambda x: Permission(action_admin_access))
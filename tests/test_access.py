@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Request-level permission loading tests."""
+
+from __future__ import absolute_import, print_function
+
+import pytest
+from flask_admin import BaseView, expose
+from invenio_access.models import ActionUsers
+from invenio_db import db
+from sqlalchemy import event
+
+from invenio_admin.permissions import action_admin_access, admin_permission_factory
+
+
+def _make_view(index):
+    """Create an admin view class."""
+
+    class View(BaseView):
+        """Admin view."""
+
+        @expose("/")
+        def index(self):
+            """Index page."""
+            return "View"
+
+    View.__name__ = "View{0}".format(index)
+    return View
+
+
+def _count_queries(app, client, url):
+    """Count the SQL statements executed by a request."""
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        assert client.get(url).status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return len(statements)
+
+
+@pytest.mark.parametrize("views", [1, 30])
+def test_query_count(app, views):
+    """Test that permission checks do not query once per view."""
+    state = app.extensions["invenio-admin"]
+    checks = []
+
+    def permission_factory(view):
+        checks.append(view)
+        return admin_permission_factory(view)
+
+    state.permission_factory = permission_factory
+    for index in range(views):
+        state.register_view(_make_view(index), category="Views")
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        # The actions granted to the identity are loaded with one query.
+        assert _count_queries(app, client, "/admin/") == 1
+    assert len(checks) > views
+
+
+def test_grants(app):
+    """Test permissions granted and denied in the database."""
+    state = app.extensions["invenio-admin"]
+    state.permission_factory = admin_permission_factory
+    with app.test_client() as client:
+        # Identities providing the action are allowed when nobody is granted.
+        client.get("/login/?user=1")
+        assert client.get("/admin/testmodel/").status_code == 200
+        client.get("/login/?user=2")
+        assert client.get("/admin/testmodel/").status_code == 403
+
+    with app.app_context():
+        db.session.add(ActionUsers.allow(action_admin_access, user_id=2))
+        db.session.add(ActionUsers.deny(action_admin_access, user_id=3))
+        db.session.commit()
+
+    with app.test_client() as client:
+        client.get("/login/?user=2")
+        assert client.get("/admin/testmodel/").status_code == 200
+        # Once granted to users, providing the action is not enough.
+        client.get("/login/?user=1")
+        assert client.get("/admin/testmodel/").status_code == 403
+        client.get("/login/?user=3")
+        assert client.get("/admin/testmodel/").status_code == 403
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Index advisor tests."""
+
+from __future__ import absolute_import, print_function
+
+from unittest.mock import patch
+
+from invenio_admin.advisor import Finding, audit_view, hide_unindexed_sorts
+from invenio_admin.cli import admin
+
+
+def test_audit_view(app):
+    """Test finding the columns used without an index."""
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    with app.app_context():
+        findings = audit_view(view)
+    assert Finding("testmodel", "test_model", "uuidcol", "filter", None) in findings
+    assert Finding("testmodel", "test_model", "email", "sort", None) in findings
+    # The primary key is indexed.
+    assert not [f for f in findings if f.column == "id"]
+
+    view.column_default_sort = "email"
+    view.column_searchable_list = ("email",)
+    view._refresh_cache()
+    with app.app_context():
+        findings = audit_view(view)
+    assert Finding("testmodel", "test_model", "email", "default sort", None) in (
+        findings
+    )
+    assert Finding("testmodel", "test_model", "email", "search", None) in findings
+
+
+def test_hide_unindexed_sorts(app):
+    """Test removing the unindexed sorts of large tables."""
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    sortable = set(view._sortable_columns)
+    assert {"email", "dt"} <= sortable
+    with app.app_context():
+        with patch("invenio_admin.advisor.estimate_rows", return_value=1000):
+            assert hide_unindexed_sorts(view, 10000) == []
+            hidden = hide_unindexed_sorts(view, 100)
+    assert {"email", "dt"} <= set(hidden)
+    assert "id" not in hidden
+    assert set(view._sortable_columns) == sortable - set(hidden)
+    # Hidden sorts are not restored when the view refreshes its columns.
+    view._refresh_cache()
+    assert set(view._sortable_columns) == sortable - set(hidden)
+
+
+def test_hide_default_sort(app):
+    """Test keeping the unindexed default sort."""
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    view.column_default_sort = "dt"
+    view._refresh_cache()
+    with app.app_context():
+        with patch("invenio_admin.advisor.estimate_rows", return_value=1000):
+            hidden = hide_unindexed_sorts(view, 100)
+    assert "email" in hidden
+    assert "dt" not in hidden
+    assert "dt" in view._sortable_columns
+
+
+def test_indexes_cli(app):
+    """Test the index advisor command."""
+    result = app.test_cli_runner().invoke(admin, ["indexes"])
+    assert result.exit_code == 0
+    assert "testmodel: filter on test_model.uuidcol (unknown rows)" in result.output
+    assert "columns without index." in result.output
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""JSON API tests."""
+
+from __future__ import absolute_import, print_function
+
+import uuid
+
+from invenio_db import db
+
+
+def test_api(app, testmodelcls):
+    """Test listing records with cursor paging."""
+    with app.app_context():
+        uuids = [uuid.uuid4() for _ in range(5)]
+        for value in uuids:
+            db.session.add(testmodelcls(uuidcol=value))
+        db.session.commit()
+
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        # Disabled by default.
+        assert client.get("/admin/testmodel/api/").status_code == 404
+
+        app.config["ADMIN_API_ENABLED"] = True
+        res = client.get("/admin/testmodel/api/?size=2")
+        assert res.status_code == 200
+        data = res.get_json()
+        assert [hit["id"] for hit in data["hits"]] == ["1", "2"]
+        assert data["hits"][0]["uuidcol"] == str(uuids[0])
+
+        ids = []
+        cursor = None
+        while True:
+            url = "/admin/testmodel/api/?size=2"
+            if cursor:
+                url += "&cursor=" + cursor
+            data = client.get(url).get_json()
+            ids.extend(hit["id"] for hit in data["hits"])
+            cursor = data["next"]
+            if not cursor:
+                break
+        assert ids == ["1", "2", "3", "4", "5"]
+
+        # Filters of the view are supported.
+        res = client.get("/admin/testmodel/api/?flt0_0={0}".format(uuids[3]))
+        assert [hit["id"] for hit in res.get_json()["hits"]] == ["4"]
+
+        assert client.get("/admin/testmodel/api/?cursor=invalid").status_code == 400
+
+        res = client.get("/admin/testmodel/api/details/?id=3")
+        assert res.get_json()["uuidcol"] == str(uuids[2])
+        assert client.get("/admin/testmodel/api/details/?id=42").status_code == 404
+
+    # The API is protected like the view.
+    with app.test_client() as client:
+        client.get("/login/?user=2")
+        assert client.get("/admin/testmodel/api/").status_code == 403
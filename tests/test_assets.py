@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Static assets tests."""
+
+from __future__ import absolute_import, print_function
+
+import gzip
+import json
+import os
+
+import pytest
+from flask import Flask
+
+from invenio_admin import InvenioAdmin
+from invenio_admin.assets import build_assets, fingerprint, is_template_mode_file
+from invenio_admin.cli import admin
+
+
+@pytest.fixture()
+def app_config(tmp_path):
+    """Serve the fingerprinted files of a temporary folder."""
+    return {"ADMIN_STATIC_ASSETS_FOLDER": str(tmp_path / "assets")}
+
+
+def test_is_template_mode_file():
+    """Test the selection of the files of a template mode."""
+    assert is_template_mode_file("admin/js/form.js", "bootstrap4")
+    assert is_template_mode_file("vendor/jquery.min.js", "bootstrap4")
+    assert is_template_mode_file("bootstrap/bootstrap4/js/x.js", "bootstrap4")
+    assert not is_template_mode_file("bootstrap/bootstrap3/js/x.js", "bootstrap4")
+    assert not is_template_mode_file("vendor/bootstrap4/util.js", "bootstrap3")
+
+
+def test_build_assets(tmp_path):
+    """Test building the fingerprinted files."""
+    source = tmp_path / "source"
+    (source / "js").mkdir(parents=True)
+    (source / "js" / "app.js").write_bytes(b"alert(1);")
+    (source / "logo.png").write_bytes(b"PNG")
+
+    manifest = build_assets(str(tmp_path / "out"), "bootstrap4", str(source))
+    assert manifest == {
+        "js/app.js": fingerprint("js/app.js", b"alert(1);"),
+        "logo.png": fingerprint("logo.png", b"PNG"),
+    }
+    assert manifest["js/app.js"].startswith("js/app.")
+    target = tmp_path / "out" / manifest["js/app.js"]
+    assert target.read_bytes() == b"alert(1);"
+    assert (
+        gzip.decompress(
+            (tmp_path / "out" / (manifest["js/app.js"] + ".gz")).read_bytes()
+        )
+        == b"alert(1);"
+    )
+    assert not os.path.exists(str(tmp_path / "out" / (manifest["logo.png"] + ".gz")))
+    assert json.loads((tmp_path / "out" / "manifest.json").read_text()) == manifest
+
+
+def test_assets_disabled():
+    """Test that the files are only served when configured."""
+    app = Flask("testapp")
+    InvenioAdmin(app)
+    assert "invenio_admin_assets" not in app.view_functions
+
+
+def test_assets(app, tmp_path):
+    """Test serving the fingerprinted files."""
+    output = app.config["ADMIN_STATIC_ASSETS_FOLDER"]
+    runner = app.test_cli_runner()
+    result = runner.invoke(admin, ["assets"])
+    assert result.exit_code == 0
+    with open(os.path.join(output, "manifest.json")) as fp:
+        manifest = json.load(fp)
+    assert "vendor/jquery.min.js" in manifest
+    assert "bootstrap/bootstrap4/css/bootstrap.min.css" not in manifest
+
+    with app.test_client() as client:
+        assert client.get("/admin/assets/x.js").status_code == 404
+
+        client.get("/login/?user=1")
+        html = client.get("/admin/").get_data(as_text=True)
+        url = "/admin/assets/" + manifest["vendor/jquery.min.js"]
+        assert url in html
+        assert "/admin/static/vendor/jquery.min.js" not in html
+
+        res = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert res.status_code == 200
+        assert res.headers["Content-Encoding"] == "gzip"
+        assert res.mimetype in ("application/javascript", "text/javascript")
+        assert res.cache_control.immutable
+        assert res.cache_control.max_age == 31536000
+        res.close()
+
+        res = client.get(url)
+        assert "Content-Encoding" not in res.headers
+        assert res.get_data().startswith(b"/*!")
+        res.close()
@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Audit trail tests."""
+
+from __future__ import absolute_import, print_function
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+from flask import Flask, flash
+from invenio_db import db
+
+from invenio_admin.audit import AuditQueue, file_sink_factory
+
+
+class BlockingSink(object):
+    """Sink recording batches, blocked until released."""
+
+    def __init__(self):
+        """Initialize the sink."""
+        self.batches = []
+        self.released = threading.Event()
+
+    def write(self, events):
+        """Record a batch of events."""
+        self.released.wait(5)
+        self.batches.append(events)
+
+
+def test_audit_queue():
+    """Test writing the events in batches."""
+    sink = BlockingSink()
+    audit = AuditQueue(Flask("testapp"), sink, batch_size=2, interval=0.01)
+    for i in range(5):
+        assert audit.put({"id": i})
+    sink.released.set()
+    audit.flush()
+    assert [e["id"] for batch in sink.batches for e in batch] == list(range(5))
+    assert max(len(batch) for batch in sink.batches) == 2
+
+    # Pending events are written when closing.
+    sink.released.clear()
+    audit.put({"id": 5})
+    audit.put({"id": 6})
+    sink.released.set()
+    audit.close()
+    assert [e["id"] for batch in sink.batches for e in batch] == list(range(7))
+
+
+def test_audit_backpressure():
+    """Test dropping events when the writer cannot keep up."""
+    sink = BlockingSink()
+    audit = AuditQueue(Flask("testapp"), sink, maxsize=1, interval=0.01)
+    assert audit.put({"id": 0})
+    # Wait for the writer to take the first event.
+    deadline = time.monotonic() + 5
+    while audit._queue.qsize() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert not audit._queue.qsize()
+    assert audit.put({"id": 1})
+    assert not audit.put({"id": 2}, timeout=0.01)
+    assert audit.dropped == 1
+    sink.released.set()
+    audit.close()
+    assert [e["id"] for batch in sink.batches for e in batch] == [0, 1]
+
+
+def test_audit_views(app, testmodelcls, tmp_path):
+    """Test recording the mutations of the model views."""
+    path = tmp_path / "audit.jsonl"
+    app.config.update(ADMIN_AUDIT_ENABLED=True, ADMIN_AUDIT_FILE=str(path))
+    with app.app_context():
+        for _ in range(3):
+            db.session.add(testmodelcls())
+        db.session.commit()
+
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    view.can_batch_edit = True
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        res = client.post(
+            "/admin/testmodel/ajax/update_batch/",
+            json={"edits": [{"pk": 1, "data": {"email": "a@example.org"}}]},
+        )
+        assert res.status_code == 200
+        client.post("/admin/testmodel/delete/", data={"id": "1"})
+        client.post(
+            "/admin/testmodel/action/",
+            data={"action": "delete", "rowid": ["2", "3"]},
+        )
+        # Failed actions are not recorded.
+        with app.app_context():
+            model = testmodelcls()
+            db.session.add(model)
+            db.session.commit()
+            rowid = str(model.id)
+
+        def delete_model(model):
+            flash("Failed to delete record.", "error")
+            return False
+
+        with patch.object(view, "delete_model", side_effect=delete_model):
+            client.post(
+                "/admin/testmodel/action/", data={"action": "delete", "rowid": [rowid]}
+            )
+
+    app.extensions["invenio-admin"].audit.close()
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(e["operation"], e["ids"]) for e in events] == [
+        ("update", ["1"]),
+        ("delete", ["1"]),
+        ("action:delete", ["2", "3"]),
+    ]
+    assert {e["user_id"] for e in events} == {"1"}
+    assert {(e["endpoint"], e["model"]) for e in events} == {("testmodel", "TestModel")}
+
+
+def test_file_sink_folder(tmp_path):
+    """Test creating the missing instance folder of the default file."""
+    app = Flask("testapp", instance_path=str(tmp_path / "instance"))
+    app.config["ADMIN_AUDIT_FILE"] = None
+    sink = file_sink_factory(app)
+    sink.write([{"id": 1}])
+    assert json.loads((tmp_path / "instance" / "admin_audit.jsonl").read_text()) == {
+        "id": 1
+    }
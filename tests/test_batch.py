@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Batched inline edits tests."""
+
+from __future__ import absolute_import, print_function
+
+from unittest.mock import patch
+
+from flask_admin.contrib.sqla import ModelView
+from invenio_db import db
+
+
+def test_batch_edit(app, testmodelcls):
+    """Test applying a batch of inline edits."""
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    with app.app_context():
+        for _ in range(3):
+            db.session.add(testmodelcls())
+        db.session.commit()
+
+    url = "/admin/testmodel/ajax/update_batch/"
+    edits = [
+        {"pk": 1, "version": 1, "data": {"email": "a@example.org"}},
+        {"pk": "2", "data": {"email": "b@example.org"}},
+    ]
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        # Disabled by default.
+        assert client.post(url, json={"edits": edits}).status_code == 404
+        assert "batch_edit.js" not in client.get("/admin/testmodel/").get_data(
+            as_text=True
+        )
+
+        view.can_batch_edit = True
+        try:
+            html = client.get("/admin/testmodel/").get_data(as_text=True)
+            assert "batch_edit.js" in html
+            assert "invenio-admin-batch-edit" in html
+            # Bootstrap 3 classes of the default template mode.
+            assert "navbar-fixed-bottom" in html
+            assert 'data-queued-class="warning"' in html
+            assert (
+                client.get(
+                    "/invenio_admin/static/js/invenio_admin/batch_edit.js"
+                ).status_code
+                == 200
+            )
+
+            res = client.post(url, json={"edits": edits})
+            assert res.status_code == 200
+            assert res.get_json() == {"updated": {"1": 2, "2": 2}, "errors": {}}
+
+            # Outdated versions and unknown records are reported per row.
+            res = client.post(
+                url,
+                json={
+                    "edits": [
+                        {"pk": 1, "version": 1, "data": {"email": "c@example.org"}},
+                        {"pk": 3, "version": 1, "data": {"email": "c@example.org"}},
+                        {"pk": 42, "data": {"email": "d@example.org"}},
+                    ]
+                },
+            )
+            assert res.status_code == 409
+            data = res.get_json()
+            assert data["updated"] == {"3": 2}
+            assert set(data["errors"]) == {"1", "42"}
+
+            # Other rejected edits are not conflicts.
+            res = client.post(url, json={"edits": [{"pk": 42, "data": {}}]})
+            assert res.status_code == 422
+
+            # Views overriding ``update_model`` save each edit through it.
+            calls = []
+
+            def update_model(self, form, model):
+                calls.append(model.id)
+                return ModelView.update_model(self, form, model)
+
+            with patch.object(type(view), "update_model", update_model, create=True):
+                res = client.post(
+                    url, json={"edits": [{"pk": 2, "data": {"email": "e@example.org"}}]}
+                )
+                assert res.status_code == 200
+                assert res.get_json()["updated"] == {"2": 3}
+            assert calls == [2]
+
+            assert client.post(url, json={"edits": "invalid"}).status_code == 400
+            assert client.post(url, json={"edits": [{"pk": 1}]}).status_code == 400
+        finally:
+            del view.can_batch_edit
+
+    with app.app_context():
+        assert [m.email for m in testmodelcls.query.order_by("id")] == [
+            "a@example.org",
+            "e@example.org",
+            "c@example.org",
+        ]
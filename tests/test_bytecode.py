@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Template precompilation tests."""
+
+from __future__ import absolute_import, print_function
+
+import os
+
+from invenio_admin.bytecode import reachable_templates, referenced_templates
+from invenio_admin.cli import admin
+
+
+def test_reachable_templates(app):
+    """Test the discovery of the admin templates."""
+    names = reachable_templates(app, app.extensions["invenio-admin"].admin)
+    assert "admin/model/list.html" in names
+    assert "invenio_admin/model/list.html" in names
+    # Referenced by the model templates.
+    assert "admin/lib.html" in names
+    assert "admin/static.html" in names
+    assert "admin/base.html" in names
+    assert "admin/model/layout.html" in names
+    assert "admin/lib.html" in referenced_templates(
+        app.jinja_env, "admin/model/list.html"
+    )
+
+
+def test_templates_cli(app, tmp_path):
+    """Test the precompilation command."""
+    runner = app.test_cli_runner()
+    assert runner.invoke(admin, ["templates"]).exit_code != 0
+
+    output = str(tmp_path / "bytecode")
+    result = runner.invoke(admin, ["templates", "-o", output])
+    assert result.exit_code == 0
+    files = os.listdir(output)
+    assert len(files) >= 10
+    assert app.jinja_env.bytecode_cache.directory == output
+
+    # Compiled templates are loaded from the cache by other workers.
+    app.jinja_env.cache.clear()
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        assert client.get("/admin/testmodel/").status_code == 200
+    assert sorted(os.listdir(output)) == sorted(files)
+
+
+def test_templates_cli_after_warmup(app, tmp_path):
+    """Test precompiling templates already loaded by the warmup."""
+    state = app.extensions["invenio-admin"]
+    with app.app_context():
+        names = state.warmup()["templates"]
+    assert app.jinja_env.cache
+
+    output = str(tmp_path / "bytecode")
+    result = app.test_cli_runner().invoke(admin, ["templates", "-o", output])
+    assert result.exit_code == 0
+    assert "Compiled {0} templates".format(len(names)) in result.output
+    assert len(os.listdir(output)) == len(names)
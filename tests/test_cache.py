@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Cache module tests."""
+
+from __future__ import absolute_import, print_function
+
+import time
+
+from cachelib import SimpleCache
+from flask_admin.base import BaseView, expose
+
+from invenio_admin.admin import cache_adminview
+from invenio_admin.cache import AdminCache, LRUCache, cached_view
+
+
+def test_lru_cache():
+    """Test LRU cache eviction and expiration."""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    # "b" was the least recently used entry.
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    assert cache.delete("a")
+    assert not cache.delete("a")
+    assert cache.get("a") is None
+
+    cache.set("d", 4, timeout=0.01)
+    time.sleep(0.02)
+    assert cache.get("d") is None
+
+
+def test_admin_cache():
+    """Test namespaces, expirations and invalidation across processes."""
+    # Two workers sharing a backend (e.g. Redis).
+    backend = SimpleCache()
+    worker1 = AdminCache(backend)
+    worker2 = AdminCache(backend)
+
+    worker1.set("stats", ("daily", 1), {"count": 3})
+    worker1.set("other", ("daily", 1), "other")
+    assert worker2.get("stats", ("daily", 1)) == {"count": 3}
+    assert worker1.key("stats", "x").startswith("invenio_admin:stats:")
+    assert worker1.key("stats", "x") == worker2.key("stats", "x")
+
+    worker2.invalidate("stats")
+    assert worker1.get("stats", ("daily", 1)) is None
+    assert worker1.get("other", ("daily", 1)) == "other"
+
+    # Expiration by namespace.
+    cache = AdminCache(LRUCache(), timeouts={"short": 0.01})
+    cache.set("short", "a", 1)
+    cache.set("long", "a", 1)
+    time.sleep(0.02)
+    assert cache.get("short", "a") is None
+    assert cache.get("long", "a") == 1
+
+    worker1.set("stats", "b", 2)
+    worker1.delete("stats", "b")
+    assert worker2.get("stats", "b") is None
+
+    assert AdminCache(backend, prefix="other").get("other", ("daily", 1)) is None
+
+
+def test_registry_invalidation(app):
+    """Test invalidation of cached pages when views are registered."""
+    state = app.extensions["invenio-admin"]
+    with app.app_context():
+        state.cache.set("fragments", "page", "html")
+        state.cache.set("models:testmodel", "pks", [1])
+
+        class NewView(BaseView):
+            @expose("/")
+            def index(self):
+                return "New"
+
+        state.register_view(NewView)
+        assert state.cache.get("fragments", "page") is None
+        assert state.cache.get("models:testmodel", "pks") == [1]
+
+
+def test_cached_view(app):
+    """Test caching of rendered admin pages."""
+    calls = []
+
+    class StatsView(BaseView):
+        @expose("/")
+        @cached_view(timeout=60)
+        def index(self):
+            calls.append(1)
+            return "Stats {0}".format(len(calls))
+
+    state = app.extensions["invenio-admin"]
+    state.register_view(StatsView)
+    # The cache view is not registered by default.
+    assert state.get_view("invenio_admin_cache") is None
+    state.register_view(cache_adminview["view_class"], **cache_adminview["kwargs"])
+
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        assert client.get("/admin/statsview/").get_data(as_text=True) == "Stats 1"
+        assert client.get("/admin/statsview/").get_data(as_text=True) == "Stats 1"
+        # Query arguments are part of the cache key.
+        res = client.get("/admin/statsview/?year=2026")
+        assert res.get_data(as_text=True) == "Stats 2"
+        assert len(calls) == 2
+
+        # Purge from the admin interface.
+        res = client.get("/admin/invenio_admin_cache/")
+        assert res.status_code == 200
+        assert "LRUCache" in res.get_data(as_text=True)
+        res = client.post("/admin/invenio_admin_cache/purge/")
+        assert res.status_code == 302
+        # Missing CSRF token.
+        assert client.get("/admin/statsview/").get_data(as_text=True) == "Stats 1"
+
+        res = client.post(
+            "/admin/invenio_admin_cache/purge/",
+            data={"csrf_token": _csrf_token(client)},
+        )
+        assert res.status_code == 302
+        assert client.get("/admin/statsview/").get_data(as_text=True) == "Stats 3"
+
+    # Users without access never reach the cache.
+    with app.test_client() as client:
+        client.get("/login/?user=2")
+        assert client.get("/admin/statsview/").status_code == 403
+        assert len(calls) == 3
+
+
+def _csrf_token(client):
+    """Extract the CSRF token of the cache purge form."""
+    html = client.get("/admin/invenio_admin_cache/").get_data(as_text=True)
+    return html.split('name="csrf_token" type="hidden" value="')[1].split('"')[0]
@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Dashboard index view tests."""
+
+from __future__ import absolute_import, print_function
+
+from datetime import datetime, timedelta
+from unittest.mock import PropertyMock, patch
+
+from conftest import TestModel
+from invenio_db import db
+
+from invenio_admin.cli import admin
+from invenio_admin.dashboard import (
+    DashboardIndexView,
+    Panel,
+    Stat,
+    _refresh_in_thread,
+    get_stats,
+    model_counts,
+    refresh_stats,
+)
+
+
+def _add_records(app):
+    """Add two recently updated records and an old one."""
+    with app.app_context():
+        old = datetime.utcnow() - timedelta(days=3)
+        db.session.add_all([TestModel(), TestModel(), TestModel(updated=old, dt=old)])
+        db.session.commit()
+
+
+def test_refresh_stats(app):
+    """Test computing and caching the dashboard statistics."""
+    _add_records(app)
+    state = app.extensions["invenio-admin"]
+    with app.app_context():
+        stats = refresh_stats(state)
+        # No Invenio-Celery, no queues panel.
+        assert [p.title for p in stats["panels"]] == [
+            "Records",
+            "Updated in the last 24 hours",
+        ]
+        records, activity = stats["panels"]
+        assert Stat("Test Model", 3, "testmodel") in records.stats
+        assert Stat("Test Model", 2, "testmodel") in activity.stats
+
+        # Served from the cache until the next refresh.
+        db.session.add(TestModel())
+        db.session.commit()
+        assert get_stats(state) == stats
+        assert Stat("Test Model", 4, "testmodel") in (
+            refresh_stats(state)["panels"][0].stats
+        )
+
+
+def test_failing_provider(app):
+    """Test that a failing provider does not break the dashboard."""
+
+    def failing(state):
+        raise RuntimeError()
+
+    app.config["ADMIN_DASHBOARD_PROVIDERS"] = [
+        failing,
+        lambda state: Panel("Custom", [Stat("Answer", 42)]),
+    ]
+    with app.app_context():
+        stats = refresh_stats(app.extensions["invenio-admin"])
+    assert stats["panels"] == [Panel("Custom", [Stat("Answer", 42)])]
+
+
+def test_dashboard_view(app):
+    """Test rendering the cached statistics."""
+    _add_records(app)
+    app.extensions["invenio-admin"].register_view(
+        DashboardIndexView, name="Dashboard", endpoint="dashboard", url="/dashboard"
+    )
+
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        res = client.get("/dashboard/")
+        assert res.status_code == 200
+        html = res.get_data(as_text=True)
+        assert "Updated in the last 24 hours" in html
+        assert '<a href="/admin/testmodel/">Test Model</a>' in html
+
+        client.get("/login/?user=2")
+        assert client.get("/dashboard/").status_code == 403
+
+
+def test_dashboard_cli(app):
+    """Test refreshing the statistics from the command line."""
+    _add_records(app)
+    result = app.test_cli_runner().invoke(admin, ["dashboard"])
+    assert result.exit_code == 0
+    assert "Records\n  Test Model: 3\n" in result.output
+
+
+def test_outdated_stats(app):
+    """Test that outdated statistics are shown while refreshed."""
+    app.config["ADMIN_DASHBOARD_CACHE_TIMEOUT"] = 60
+    state = app.extensions["invenio-admin"]
+    with app.app_context():
+        stats = refresh_stats(state)
+        with patch("invenio_admin.dashboard.threading.Thread") as thread:
+            assert get_stats(state) is stats
+            assert not thread.called
+
+            stats["refreshed"] -= timedelta(seconds=61)
+            assert get_stats(state) is stats
+            assert get_stats(state) is stats
+            # Refreshed once in the background.
+            thread.assert_called_once()
+            assert thread.call_args[1]["target"] is _refresh_in_thread
+
+        # The Celery task is used with a cache shared with the workers.
+        refresh_stats(state)["refreshed"] -= timedelta(seconds=61)
+        app.extensions["invenio-celery"] = object()
+        with (
+            patch.object(
+                type(state.cache),
+                "shared",
+                new_callable=PropertyMock,
+                return_value=True,
+            ),
+            patch("invenio_admin.tasks.refresh_dashboard.delay") as delay,
+        ):
+            get_stats(state)
+        delay.assert_called_once_with()
+
+
+def test_estimated_counts(app):
+    """Test that large tables are not counted."""
+    _add_records(app)
+    state = app.extensions["invenio-admin"]
+    with app.app_context():
+        with patch("invenio_admin.dashboard.estimate_rows", return_value=5e6):
+            records = model_counts(state)
+    assert Stat("Test Model", 5000000, "testmodel", True) in records.stats
+
+    result = app.test_cli_runner().invoke(admin, ["dashboard"])
+    assert "Test Model: 3\n" in result.output
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Query inspector tests."""
+
+from __future__ import absolute_import, print_function
+
+import uuid
+
+from invenio_db import db
+
+from invenio_admin.explain import explain, indexed_columns, is_indexed, plan_nodes
+
+
+def test_explain(app, testmodelcls):
+    """Test the execution plan of a query."""
+    with app.app_context():
+        plan = explain(db.session, testmodelcls.query.filter_by(dt=None))
+        assert plan["format"] == "sqlite"
+        nodes = plan_nodes(plan)
+        assert nodes[0]["full_scan"]
+
+        plan = explain(db.session, testmodelcls.query.filter_by(id=1))
+        assert not plan_nodes(plan)[0]["full_scan"]
+
+        # The pending changes of the session are kept.
+        model = testmodelcls(email="pending@example.org")
+        db.session.add(model)
+        explain(db.session, testmodelcls.query)
+        assert model in db.session
+        db.session.commit()
+        assert testmodelcls.query.filter_by(email="pending@example.org").count() == 1
+
+
+def test_indexed_columns(testmodelcls):
+    """Test detection of indexed columns."""
+    assert indexed_columns(testmodelcls.__table__) == {"id"}
+    assert is_indexed(testmodelcls.id)
+    assert not is_indexed(testmodelcls.uuidcol)
+
+
+def test_explain_view(app):
+    """Test the query inspector of list views."""
+    url = "/admin/testmodel/explain/?flt0_0={0}".format(uuid.uuid4())
+    with app.test_client() as client:
+        client.get("/login/?user=3")
+        assert client.get(url).status_code == 404
+        assert "Query inspector" not in client.get("/admin/testmodel/").get_data(
+            as_text=True
+        )
+
+        app.config["ADMIN_QUERY_INSPECTOR_ENABLED"] = True
+        res = client.get(url)
+        assert res.status_code == 200
+        html = res.get_data(as_text=True)
+        assert "SELECT" in html
+        assert "uuidcol" in html
+        assert "SCAN" in html
+        assert "/admin/testmodel/explain/" in client.get(
+            "/admin/testmodel/?flt0_0=x"
+        ).get_data(as_text=True)
+
+    # Restricted to superusers.
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        assert client.get(url).status_code == 404
+        assert client.get("/admin/testmodel/").status_code == 200
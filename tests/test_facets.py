@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Facet counts tests."""
+
+from __future__ import absolute_import, print_function
+
+from datetime import datetime
+from unittest.mock import patch
+
+from invenio_db import db
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from invenio_admin.facets import facets_statement, sample_statement
+
+
+def _facet_view(app, testmodelcls):
+    """Get the test model view with facets on the e-mail and date."""
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    view.column_facets = ("email", "dt")
+    view.column_filters = ("uuidcol", "email")
+    view._refresh_filters_cache()
+    with app.app_context():
+        day = datetime(2026, 1, 1)
+        for email in ("a@cern.ch", "a@cern.ch", "b@cern.ch", None):
+            db.session.add(testmodelcls(email=email, dt=day))
+        db.session.commit()
+    return view
+
+
+def test_count_facets(app, testmodelcls):
+    """Test counting all facets with one query."""
+    view = _facet_view(app, testmodelcls)
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.test_request_context():
+        event.listen(db.engine, "before_cursor_execute", count)
+        try:
+            counts, approximate = view.get_cached_facets(None, [])
+            assert counts == {
+                "email": [("a@cern.ch", 2), ("b@cern.ch", 1)],
+                "dt": [(datetime(2026, 1, 1), 4)],
+            }
+            assert not approximate
+            assert len(statements) == 1
+            assert "UNION ALL" in statements[0]
+
+            # Served from the cache.
+            view.get_cached_facets(None, [])
+            assert len(statements) == 1
+
+            # Not shared with identities with other permissions.
+            with patch("invenio_admin.facets.permission_key", return_value="other"):
+                view.get_cached_facets(None, [])
+            assert len(statements) == 2
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count)
+
+        # Filtered with the equality filter of the e-mail.
+        index, flt = view.get_facet_filter("email")
+        counts, _ = view.count_facets(None, [(index, flt.name, "b@cern.ch")])
+        assert counts["email"] == [("b@cern.ch", 1)]
+
+        # Modifying the model invalidates the counts.
+        db.session.add(testmodelcls(email="b@cern.ch"))
+        db.session.commit()
+        counts, _ = view.get_cached_facets(None, [])
+        assert counts["email"] == [("a@cern.ch", 2), ("b@cern.ch", 2)]
+
+
+def test_approximate_facets(app, testmodelcls):
+    """Test scaling the counts of a sampled table."""
+    view = _facet_view(app, testmodelcls)
+    app.config["ADMIN_FACETS_SAMPLE_THRESHOLD"] = 2
+    with app.test_request_context():
+        # The sampling itself is only supported by PostgreSQL.
+        with (
+            patch("invenio_admin.facets.estimate_rows", return_value=8),
+            patch(
+                "invenio_admin.facets.sample_statement", side_effect=lambda s, t, p: s
+            ) as sample,
+        ):
+            counts, approximate = view.count_facets(None, [])
+        assert sample.call_args[0][2] == 25.0
+        assert approximate
+        assert counts["email"] == [("a@cern.ch", 8), ("b@cern.ch", 4)]
+
+
+def test_postgresql_statement(testmodelcls):
+    """Test the grouping sets and sampling of PostgreSQL."""
+    query = Query(testmodelcls).filter(testmodelcls.email.isnot(None))
+    columns = [testmodelcls.email, testmodelcls.dt]
+    statement = facets_statement(query, columns, "postgresql")
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "GROUP BY GROUPING SETS((test_model.email), (test_model.dt))" in sql
+    assert "UNION" not in sql
+
+    sampled = sample_statement(statement, testmodelcls.__table__, 1.5)
+    sql = str(sampled.compile(dialect=postgresql.dialect()))
+    assert "FROM test_model AS test_model TABLESAMPLE system(" in sql
+    assert "WHERE test_model.email IS NOT NULL" in sql
+
+
+def test_list_facets(app, testmodelcls):
+    """Test rendering the facets in the list view."""
+    _facet_view(app, testmodelcls)
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        html = client.get("/admin/testmodel/").get_data(as_text=True)
+        assert "invenio-admin-facets" in html
+        assert "a@cern.ch</a>" in html
+        assert '<span class="badge">2</span>' in html
@@ -7,7 +7,7 @@ from __future__ import absolute_import, print_function
 
 import uuid
 
-from invenio_admin.filters import FilterConverter, UUIDEqualFilter
+from invenio_admin.filters import FilterConverter, UUIDEqualFilter, parse_uuid
 
 
 def test_uuid_filter(app, testmodelcls):
@@ -27,6 +27,15 @@ def test_uuid_filter(app, testmodelcls):
         assert q_applied.whereclause is None
 
 
+def test_parse_uuid():
+    """Test UUID parsing."""
+    value = uuid.uuid4()
+    assert parse_uuid(str(value)) == value
+    assert parse_uuid(" {0} ".format(value)) == value
+    assert parse_uuid("test") is None
+    assert parse_uuid("") is None
+
+
 def test_filter_converter_uuid(testmodelcls):
     """Test filter converter."""
     c = FilterConverter()
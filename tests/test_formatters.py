@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Formatters module tests."""
+
+from __future__ import absolute_import, print_function
+
+import gzip
+import json
+
+import pytest
+from invenio_db import db
+from sqlalchemy import event
+
+from invenio_admin.formatters import (
+    blob_formatter,
+    format_size,
+    json_preview,
+    json_preview_formatter,
+)
+
+
+def test_format_size():
+    """Test formatting of sizes."""
+    assert format_size(12) == "12 B"
+    assert format_size(1500) == "1.5 kB"
+    assert format_size(2500000) == "2.5 MB"
+    assert format_size(3 * 10**12) == "3000.0 GB"
+
+
+def test_json_preview():
+    """Test the preview of JSON values."""
+    value = {"title": "x" * 100}
+    assert json_preview(value, 10) == ('{\n  "title', True)
+    assert json_preview(value, 1000) == (json.dumps(value, indent=2), False)
+    length = len(json.dumps(value, indent=2))
+    assert json_preview(value, length) == (json.dumps(value, indent=2), False)
+
+
+def test_json_column(app, testmodelcls):
+    """Test the preview and the full value of JSON columns."""
+    value = {"items": ["x" * 100] * 1000}
+    with app.app_context():
+        db.session.add(testmodelcls(json=value))
+        db.session.add(testmodelcls(json={"small": True}))
+        db.session.commit()
+
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    view.column_formatters_detail = {"json": json_preview_formatter(max_length=50)}
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    try:
+        with app.test_client() as client:
+            client.get("/login/?user=1")
+            html = client.get("/admin/testmodel/details/?id=1").get_data(as_text=True)
+            assert "x" * 100 not in html
+            assert "Show full value</a>" in html
+            assert "/admin/testmodel/details/json/?id=1&amp;column=json" in html
+            html = client.get("/admin/testmodel/details/?id=2").get_data(as_text=True)
+            assert "Show full value" not in html
+
+            url = "/admin/testmodel/details/json/?id=1&column=json"
+            res = client.get(url, headers={"Accept-Encoding": "gzip"})
+            assert res.headers["Content-Encoding"] == "gzip"
+            assert json.loads(gzip.decompress(res.get_data())) == value
+            res = client.get(url)
+            assert "Content-Encoding" not in res.headers
+            assert json.loads(res.get_data()) == value
+
+            assert client.get(url.replace("=json", "=unknown")).status_code == 404
+            assert client.get(url.replace("id=1", "id=42")).status_code == 404
+
+            # Deferred column, with the preview and size read from the database.
+            view.column_json_previews = ("json",)
+            event.listen(db.engine, "before_cursor_execute", count)
+            try:
+                html = client.get("/admin/testmodel/details/?id=1").get_data(
+                    as_text=True
+                )
+            finally:
+                event.remove(db.engine, "before_cursor_execute", count)
+            assert not any(
+                "test_model.json AS test_model_json" in s for s in statements
+            )
+            assert "{&#34;items&#34;: [&#34;xxxxx" in html
+            size = format_size(len(json.dumps(value)))
+            assert "Show full value ({0})".format(size) in html
+            html = client.get("/admin/testmodel/details/?id=2").get_data(as_text=True)
+            assert "Show full value" not in html
+            assert json.loads(client.get(url).get_data()) == value
+    finally:
+        del view.column_formatters_detail
+        view.__dict__.pop("column_json_previews", None)
+
+
+def test_blob_column(app, testmodelcls):
+    """Test streaming binary columns in chunks."""
+    value = bytes(range(256)) * 40
+    with app.app_context():
+        db.session.add(testmodelcls(blob=value))
+        db.session.add(testmodelcls())
+        db.session.commit()
+
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    view.column_blobs = ("blob",)
+    view.column_formatters_detail = {"blob": blob_formatter}
+    view.blob_chunk_size = 4000
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    try:
+        with app.test_client() as client:
+            client.get("/login/?user=1")
+            html = client.get("/admin/testmodel/details/?id=1").get_data(as_text=True)
+            assert "Download (10.2 kB)" in html
+            assert "/admin/testmodel/details/blob/?id=1&amp;column=blob" in html
+            html = client.get("/admin/testmodel/details/?id=2").get_data(as_text=True)
+            assert "Download" not in html
+
+            url = "/admin/testmodel/details/blob/?id=1&column=blob"
+            event.listen(db.engine, "before_cursor_execute", count)
+            try:
+                res = client.get(url)
+                assert res.status_code == 200
+                assert res.headers["Content-Length"] == "10240"
+                assert res.headers["Accept-Ranges"] == "bytes"
+                assert res.get_data() == value
+            finally:
+                event.remove(db.engine, "before_cursor_execute", count)
+            # The record is loaded without the value, which is read in chunks.
+            assert not any("test_model.blob AS" in s for s in statements)
+            assert len([s for s in statements if "substr" in s]) == 3
+
+            res = client.get(url, headers={"Range": "bytes=100-4099"})
+            assert res.status_code == 206
+            assert res.headers["Content-Range"] == "bytes 100-4099/10240"
+            assert res.headers["Content-Length"] == "4000"
+            assert res.get_data() == value[100:4100]
+            res = client.get(url, headers={"Range": "bytes=-10"})
+            assert res.get_data() == value[-10:]
+            assert (
+                res.headers["Content-Disposition"] == "attachment; filename=blob-1.bin"
+            )
+
+            # Ranges are resumed only for the same version of the value.
+            etag = res.headers["ETag"].strip('"')
+            res = client.get(url, headers={"Range": "bytes=-10", "If-Range": etag})
+            assert res.status_code == 206
+            assert res.get_data() == value[-10:]
+            res = client.get(
+                url, headers={"Range": "bytes=-10", "If-Range": '"outdated"'}
+            )
+            assert res.status_code == 200
+            assert res.get_data() == value
+
+            res = client.get(url, headers={"Range": "bytes=20000-"})
+            assert res.status_code == 416
+            assert res.headers["Content-Range"] == "bytes */10240"
+
+            assert client.get(url.replace("=blob", "=email")).status_code == 404
+            assert client.get(url.replace("id=1", "id=2")).status_code == 404
+            assert client.get(url.replace("id=1", "id=42")).status_code == 404
+    finally:
+        del view.column_blobs, view.column_formatters_detail, view.blob_chunk_size
+
+
+def test_blob_modified(app, testmodelcls):
+    """Test that a value modified during a download is not mixed."""
+    value = b"x" * 10000
+    with app.app_context():
+        db.session.add(testmodelcls(blob=value))
+        db.session.commit()
+
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    view.column_blobs = ("blob",)
+    view.blob_chunk_size = 4000
+    try:
+        with app.test_request_context():
+            model = view.get_one("1")
+            state = view.get_blob_state(model, "blob")
+            chunks = view.iter_blob(model, "blob", 0, len(value), state)
+            assert next(chunks) == value[:4000]
+            db.session.execute(
+                testmodelcls.__table__.update().values(blob=b"y" * 10000)
+            )
+            with pytest.raises(RuntimeError):
+                next(chunks)
+    finally:
+        del view.column_blobs, view.blob_chunk_size
@@ -5,7 +5,13 @@
 
 from __future__ import absolute_import, print_function
 
-from invenio_admin.forms import LazyChoices
+import uuid
+from unittest.mock import patch
+
+import pytest
+from invenio_db import db
+
+from invenio_admin.forms import IndexedAjaxModelLoader, LazyChoices
 
 
 def test_lazy_choices():
@@ -20,3 +26,78 @@ def test_lazy_choices():
     assert not called["val"]
     assert list(choices) == [1, 2]
     assert called["val"]
+
+
+def test_indexed_ajax_loader(app, testmodelcls):
+    """Test the index-backed AJAX model loader."""
+    with app.test_request_context():
+        uuids = [uuid.uuid4() for _ in range(3)]
+        emails = ["alice@example.org", "albert@example.org", "bob_1@example.org"]
+        for value, email in zip(uuids, emails):
+            db.session.add(testmodelcls(uuidcol=value, email=email))
+        db.session.commit()
+
+        loader = IndexedAjaxModelLoader(
+            "test", db.session, testmodelcls, fields=["email", "uuidcol"]
+        )
+
+        def lookup(term):
+            return [m.id for m in loader.get_list(term)]
+
+        assert lookup("al") == [1, 2]
+        assert lookup("AL") == [1, 2]
+        assert lookup("b") == [3]
+        assert lookup("%") == []
+        assert lookup("bob_") == [3]
+        assert lookup("") == []
+        # Exact matches.
+        assert lookup(str(uuids[1])) == [2]
+        assert lookup("Alice@Example.org") == [1]
+        assert lookup("3") == [3]
+
+        # Results are cached until the model is modified.
+        db.session.add(testmodelcls(email="alfred@example.org"))
+        db.session.flush()
+        assert lookup("al") == [1, 2]
+        db.session.commit()
+        assert lookup("al") == [1, 2, 4]
+        assert lookup("example") == []
+
+        loader = IndexedAjaxModelLoader(
+            "test", db.session, testmodelcls, fields=["email"], lookup="trigram"
+        )
+        assert lookup("example") == [1, 2, 3, 4]
+
+        # Pages of exact matches.
+        for _ in range(3):
+            db.session.add(testmodelcls(email="dup@example.org"))
+        db.session.commit()
+
+        def page(term, offset):
+            return [m.id for m in loader.get_list(term, offset=offset, limit=2)]
+
+        assert page("dup@example.org", 0) == [5, 6]
+        assert page("dup@example.org", 2) == [7]
+        assert page("dup@example.org", 4) == []
+        assert page("example", 2) == [3, 4]
+
+        # Loaders with other filters do not share their cached results.
+        filtered = IndexedAjaxModelLoader(
+            "test",
+            db.session,
+            testmodelcls,
+            fields=["email"],
+            lookup="trigram",
+            filters=["email LIKE 'a%'"],
+        )
+        assert [m.id for m in filtered.get_list("example")] == [1, 2, 4]
+        assert lookup("example") == [1, 2, 3, 4, 5, 6, 7]
+        # The filters apply to the cached keys of outdated results.
+        with patch.object(filtered, "get_list_pks", return_value=[1, 3]):
+            filtered.cache_timeout = None
+            assert [m.id for m in filtered.get_list("example")] == [1]
+
+        with pytest.raises(ValueError):
+            IndexedAjaxModelLoader(
+                "test", db.session, testmodelcls, fields=["email"], lookup="any"
+            )
@@ -6,12 +6,18 @@
 """Module tests."""
 
 import importlib
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
 from importlib.metadata import EntryPoint, PackageNotFoundError
 from unittest.mock import patch
 
 import flask_admin
 import pytest
 from flask import Flask
+from flask_admin.base import BaseView, expose
 from flask_admin.contrib.sqla import ModelView
 from flask_menu import current_menu
 from invenio_access.permissions import Permission
@@ -19,8 +25,10 @@ from invenio_db import db
 from invenio_theme import InvenioTheme
 
 from invenio_admin import InvenioAdmin
+from invenio_admin.cli import admin
 from invenio_admin.ext import finalize_app
 from invenio_admin.permissions import admin_permission_factory
+from invenio_admin.proxies import current_admin
 from invenio_admin.views import protected_adminview_factory
 
 
@@ -31,6 +39,45 @@ def test_version():
     assert __version__
 
 
+def test_import_is_lazy():
+    """Test that importing the extension does not import its dependencies."""
+    code = (
+        "import sys\n"
+        "import invenio_admin\n"
+        "from invenio_admin import InvenioAdmin, current_admin\n"
+        "from invenio_admin.ext import finalize_app\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = set(result.stdout.split())
+    imported.update(
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    )
+    heavy = {
+        "flask_admin",
+        "flask_login",
+        "flask_menu",
+        "invenio_db",
+        "invenio_i18n",
+        "invenio_theme",
+        "sqlalchemy",
+    }
+    assert not heavy & {name.split(".")[0] for name in imported}
+    assert {n for n in imported if n.startswith("invenio_admin")} == {
+        "invenio_admin",
+        "invenio_admin.config",
+        "invenio_admin.ext",
+        "invenio_admin.proxies",
+    }
+
+
 def test_init():
     """Test extension initialization."""
     app = Flask("testapp")
@@ -341,3 +388,259 @@ def test_talisman_csp_config_overridden(app):
         res = client.get("/admin/")
         assert res.status_code == 200
         assert not invenio_app.talisman.content_security_policy
+
+
+def test_conditional_requests(app, testmodelcls):
+    """Test ETag and Last-Modified support of detail and edit views."""
+    app.config["ADMIN_CONDITIONAL_REQUESTS"] = True
+    with app.app_context():
+        obj = testmodelcls()
+        db.session.add(obj)
+        db.session.commit()
+        obj_id = obj.id
+
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        for url in (
+            "/admin/testmodel/details/?id={0}".format(obj_id),
+            "/admin/testmodel/edit/?id={0}".format(obj_id),
+        ):
+            res = client.get(url)
+            assert res.status_code == 200
+            etag = res.headers["ETag"]
+            assert res.headers["Last-Modified"]
+
+            res = client.get(url, headers={"If-None-Match": etag})
+            assert res.status_code == 304
+            assert res.headers["ETag"] == etag
+            assert not res.get_data()
+
+            res = client.get(url, headers={"If-None-Match": '"outdated"'})
+            assert res.status_code == 200
+
+        # Saving an outdated version is rejected.
+        url = "/admin/testmodel/edit/?id={0}".format(obj_id)
+        data = {"version_id": 1}
+        res = client.post(url, data=data, headers={"If-Match": '"outdated"'})
+        assert res.status_code == 412
+        res = client.post(url, data=data, headers={"If-Match": etag})
+        assert res.status_code == 302
+
+        with app.app_context():
+            obj = testmodelcls.query.get(obj_id)
+            obj.dt = datetime.utcnow()
+            db.session.commit()
+
+        # Any modification of the record changes the ETag.
+        res = client.get(url, headers={"If-None-Match": etag})
+        assert res.status_code == 200
+        assert res.headers["ETag"] != etag
+
+    # Edit forms carry the ETag of the edited version.
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        with patch.object(
+            ModelView, "get_one", autospec=True, side_effect=ModelView.get_one
+        ) as get_one:
+            res = client.get(url)
+        # The record is loaded once.
+        assert get_one.call_count == 1
+        etag = res.headers["ETag"].strip('"')
+        assert 'name="invenio_admin_etag"' in res.get_data(as_text=True)
+        assert 'value="{0}"'.format(etag) in res.get_data(as_text=True)
+
+    # The requests share the session of the application context of the test.
+    obj = db.session.get(testmodelcls, obj_id)
+    obj.dt = datetime.utcnow()
+    db.session.commit()
+    version_id = obj.version_id
+
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        data = {"version_id": version_id, "invenio_admin_etag": etag}
+        res = client.post(url, data=data)
+        assert res.status_code == 302
+        assert res.headers["Location"].endswith(url)
+        res = client.get(url)
+        assert "modified by someone else" in res.get_data(as_text=True)
+
+        data["invenio_admin_etag"] = res.headers["ETag"].strip('"')
+        res = client.post(url, data=data)
+        assert res.status_code == 302
+        assert not res.headers["Location"].endswith(url)
+
+    # Conditional requests are disabled by default.
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        etag = client.get(url).headers["ETag"]
+        app.config["ADMIN_CONDITIONAL_REQUESTS"] = False
+        res = client.get(url, headers={"If-None-Match": etag})
+        assert res.status_code == 200
+        assert "ETag" not in res.headers
+
+
+class LoadTracker(object):
+    """Count the entry points being loaded at the same time."""
+
+    def __init__(self):
+        """Initialize the tracker."""
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        """Start loading an entry point."""
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def __exit__(self, *exc):
+        """Finish loading an entry point."""
+        with self.lock:
+            self.active -= 1
+
+
+class SlowEntryPoint(object):
+    """Entry point spending time in I/O when loaded."""
+
+    def __init__(self, index, tracker=None):
+        """Initialize the entry point."""
+        self.index = index
+        self.name = "slow_{0}".format(index)
+        self.tracker = tracker or LoadTracker()
+
+    def load(self):
+        """Simulate importing a module."""
+        with self.tracker:
+            time.sleep(0.005)
+        return dict(
+            view_class=SlowView,
+            kwargs=dict(name="View {0}".format(self.index), endpoint=str(self.index)),
+        )
+
+
+class SlowView(BaseView):
+    """View registered by the synthetic entry points."""
+
+    @expose("/")
+    def index(self):
+        """Index page."""
+        return "Slow"
+
+
+@pytest.mark.parametrize("workers", [None, 8])
+def test_entry_points_concurrency(workers):
+    """Test loading a group of entry points concurrently."""
+    app = Flask("testapp")
+    app.config["ADMIN_ENTRY_POINTS_WORKERS"] = workers
+    admin_app = InvenioAdmin(app, view_class_factory=lambda x: x)
+    tracker = LoadTracker()
+    eps = [SlowEntryPoint(i, tracker) for i in range(50)]
+
+    with patch("invenio_admin.ext.entry_points", return_value=eps):
+        admin_app.load_entry_point_group("invenio_admin.views")
+
+    # Views are registered in the order of the entry points.
+    names = [str(item.name) for item in admin_app.admin.menu()]
+    assert names[1:] == ["View {0}".format(i) for i in range(50)]
+    if workers:
+        assert 1 < tracker.max_active <= workers
+    else:
+        assert tracker.max_active == 1
+
+
+def test_entry_points_benchmark(record_property):
+    """Benchmark loading 200 I/O-bound entry points with and without workers.
+
+    The timings are reported as properties of the test (e.g. in the JUnit XML
+    report), not asserted, as they depend on the load of the machine.
+    """
+    for workers in (None, 8):
+        app = Flask("testapp")
+        app.config["ADMIN_ENTRY_POINTS_WORKERS"] = workers
+        admin_app = InvenioAdmin(app, view_class_factory=lambda x: x)
+        eps = [SlowEntryPoint(i) for i in range(200)]
+
+        start = time.perf_counter()
+        with patch("invenio_admin.ext.entry_points", return_value=eps):
+            admin_app.load_entry_point_group("invenio_admin.views")
+        seconds = time.perf_counter() - start
+
+        record_property("seconds_workers_{0}".format(workers or 0), seconds)
+        assert len(admin_app.admin.menu()) == 201
+
+
+def test_disabled():
+    """Test that a disabled admin interface is not built."""
+    app = Flask("testapp")
+    app.config["ADMIN_ENABLED"] = False
+    InvenioAdmin(app)
+    finalize_app(app)
+    state = app.extensions["invenio-admin"]
+    assert not state.enabled
+    assert state.admin is None
+    assert "admin" not in app.blueprints
+    assert "invenio_admin_assets" not in app.view_functions
+    with app.app_context():
+        assert current_admin.get_view("admin") is None
+        assert current_admin.get_models() == []
+
+    result = app.test_cli_runner().invoke(admin, ["dashboard"])
+    assert result.exit_code == 2
+    assert "disabled" in result.output
+
+
+@pytest.mark.parametrize(
+    "allowlist,denylist,expected",
+    [
+        (None, [], [0, 1, 2, 3]),
+        (["slow_1", "slow_2"], [], [1, 2]),
+        (None, ["slow_[02]"], [1, 3]),
+        (["slow_*"], ["slow_3"], [0, 1, 2]),
+    ],
+)
+def test_entry_points_selection(allowlist, denylist, expected):
+    """Test loading only the selected entry points."""
+    app = Flask("testapp")
+    app.config.update(
+        ADMIN_ENTRY_POINTS_ALLOWLIST=allowlist,
+        ADMIN_ENTRY_POINTS_DENYLIST=denylist,
+    )
+    admin_app = InvenioAdmin(app, view_class_factory=lambda x: x)
+    eps = [SlowEntryPoint(i) for i in range(4)]
+    with patch("invenio_admin.ext.entry_points", return_value=eps):
+        admin_app.load_entry_point_group("invenio_admin.views")
+
+    names = [str(item.name) for item in admin_app.admin.menu()]
+    assert names[1:] == ["View {0}".format(i) for i in expected]
+    startup = admin_app.startup_cost
+    assert sorted(startup.entry_points) == ["slow_{0}".format(i) for i in expected]
+    assert startup.skipped == [
+        "slow_{0}".format(i) for i in range(4) if i not in expected
+    ]
+    assert startup.seconds >= 0.005 * len(expected)
+
+
+def test_view_registry(app, testmodelcls):
+    """Test lookup of registered views."""
+    state = app.extensions["invenio-admin"]
+    assert state.get_view("admin") is state.admin.index_view
+    assert state.get_view("testmodel").model is testmodelcls
+    assert state.get_view("unknown") is None
+    assert [v.endpoint for v in state.get_views_by_model(testmodelcls)] == ["testmodel"]
+    assert state.get_views_by_model(object) == []
+    assert testmodelcls in state.get_models()
+    assert object not in state.get_models()
+
+    class CategoryView(BaseView):
+        """View in a category."""
+
+        @expose("/")
+        def index(self):
+            """Index page."""
+            return "Category"
+
+    view = state.register_view(CategoryView, category="Tools")
+    assert state.get_view("categoryview") is view
+    assert state.get_views_by_category("Tools") == [view]
+    assert view in state.admin._views
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Entry points manifest tests."""
+
+from __future__ import absolute_import, print_function
+
+import json
+import os
+import sys
+from unittest.mock import patch
+
+from flask import Flask
+
+from invenio_admin import InvenioAdmin
+from invenio_admin.cli import admin
+from invenio_admin.manifest import build_manifest, load_manifest, write_manifest
+
+
+def test_manifest(app, tmp_path):
+    """Test writing and validating the manifest."""
+    path = str(tmp_path / "manifest.json")
+    with app.app_context():
+        manifest = write_manifest(path, "invenio_admin.views")
+        assert "invenio-accounts" in manifest["distributions"]
+        assert "invenio_accounts_user" in [
+            ep["name"] for ep in manifest["entry_points"]
+        ]
+
+        eps = load_manifest(path, "invenio_admin.views")
+        assert [ep.name for ep in eps] == [
+            ep["name"] for ep in manifest["entry_points"]
+        ]
+        assert load_manifest(path, "other.group") is None
+        assert (
+            load_manifest(str(tmp_path / "missing.json"), "invenio_admin.views") is None
+        )
+
+        # Other import paths may differ between processes.
+        with patch.object(sys, "path", [str(tmp_path), ""] + sys.path):
+            assert load_manifest(path, "invenio_admin.views") is not None
+
+        # Installing or removing distributions invalidates the manifest.
+        site_path = next(iter(manifest["paths"]))
+        manifest["paths"][site_path] -= 1
+        with open(path, "w") as fp:
+            json.dump(manifest, fp)
+        assert load_manifest(path, "invenio_admin.views") is None
+        manifest["paths"][site_path] += 1
+
+        # Upgraded distributions invalidate the manifest.
+        manifest["distributions"]["invenio-accounts"] = "0.0.0"
+        with open(path, "w") as fp:
+            json.dump(manifest, fp)
+        assert load_manifest(path, "invenio_admin.views") is None
+
+
+def test_manifest_cli(app, tmp_path):
+    """Test the manifest command."""
+    path = str(tmp_path / "manifest.json")
+    runner = app.test_cli_runner()
+    result = runner.invoke(admin, ["manifest"])
+    assert result.exit_code != 0
+
+    result = runner.invoke(admin, ["manifest", "-o", path])
+    assert result.exit_code == 0
+    assert os.path.exists(path)
+
+
+def test_load_from_manifest(tmp_path):
+    """Test loading the admin views from the manifest."""
+    path = str(tmp_path / "manifest.json")
+    manifest = build_manifest("invenio_admin.views")
+    manifest["entry_points"] = [
+        {"name": "four", "value": "demo.four:four", "dist": None},
+    ]
+    with open(path, "w") as fp:
+        json.dump(manifest, fp)
+
+    app = Flask("testapp")
+    app.config["ADMIN_ENTRY_POINTS_MANIFEST"] = path
+    admin_app = InvenioAdmin(app, view_class_factory=lambda x: x)
+    with patch("invenio_admin.ext.entry_points") as entry_points:
+        admin_app.load_entry_point_group("invenio_admin.views")
+        assert not entry_points.called
+    assert "Four" in [str(item.name) for item in admin_app.admin.menu()]
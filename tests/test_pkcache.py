@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Cached primary keys tests."""
+
+from __future__ import absolute_import, print_function
+
+from flask import g
+from flask_principal import Identity, UserNeed
+from invenio_db import db
+from sqlalchemy import event
+
+from invenio_admin.ext import _DisabledAdminState
+from invenio_admin.pkcache import track_model
+
+
+def test_pk_cache(app, testmodelcls):
+    """Test paging through cached primary keys."""
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    view.pk_cache_enabled = True
+    view.page_size = 2
+
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.test_request_context():
+        for _ in range(5):
+            db.session.add(testmodelcls())
+        db.session.commit()
+
+        event.listen(db.engine, "before_cursor_execute", count)
+        try:
+            count_, rows = view.get_list(0, None, False, None, [])
+            assert count_ == 5
+            assert [r.id for r in rows] == [1, 2]
+            assert len(statements) == 2
+
+            # Further pages are fetched by primary key.
+            del statements[:]
+            count_, rows = view.get_list(2, None, False, None, [])
+            assert [r.id for r in rows] == [5]
+            assert len(statements) == 1
+            assert "IN" in statements[0]
+
+            count_, rows = view.get_list(0, "updated", True, None, [])
+            assert [r.id for r in rows] == [5, 4]
+
+            # Committed changes invalidate the cached keys.
+            db.session.add(testmodelcls())
+            db.session.commit()
+            count_, rows = view.get_list(0, None, False, None, [], page_size=0)
+            assert count_ == 6
+            assert len(rows) == 6
+
+            # Lists larger than the limit are not cached.
+            view.pk_cache_max_size = 3
+            assert view.get_list(1, None, False, None, [])[0] == 6
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count)
+            for attr in ("pk_cache_enabled", "page_size", "pk_cache_max_size"):
+                view.__dict__.pop(attr, None)
+
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        assert client.get("/admin/testmodel/").status_code == 200
+
+
+def test_pk_cache_per_identity(app, testmodelcls):
+    """Test that identities with different permissions do not share keys."""
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    with app.test_request_context():
+        g.identity = Identity(1)
+        g.identity.provides.add(UserNeed(1))
+        first = view._pk_cache_key(None, False, None, [])
+        assert view._pk_cache_key(None, False, None, []) == first
+        g.identity = Identity(2)
+        g.identity.provides.add(UserNeed(2))
+        assert view._pk_cache_key(None, False, None, []) != first
+
+
+def test_pk_cache_without_admin(app, testmodelcls):
+    """Test committing tracked models without an enabled admin interface."""
+    track_model(testmodelcls)
+    state = app.extensions["invenio-admin"]
+    for other in (None, _DisabledAdminState(app)):
+        app.extensions["invenio-admin"] = other
+        with app.app_context():
+            db.session.add(testmodelcls())
+            db.session.commit()
+    app.extensions["invenio-admin"] = state
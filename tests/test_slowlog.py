@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Slow requests log tests."""
+
+from __future__ import absolute_import, print_function
+
+import json
+import logging
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from invenio_admin import slowlog
+
+
+@pytest.fixture()
+def listeners():
+    """Listen to the SQL statements of all engines during a test."""
+    slowlog.install_listeners()
+    yield
+    for name in ("before_cursor_execute", "after_cursor_execute"):
+        listener = getattr(slowlog, "_" + name)
+        if event.contains(Engine, name, listener):
+            event.remove(Engine, name, listener)
+
+
+def _slow_requests(caplog):
+    """Get the logged slow requests."""
+    return [
+        json.loads(r.getMessage())
+        for r in caplog.records
+        if "slow_admin_request" in r.getMessage()
+    ]
+
+
+def test_slow_request_log(app, caplog, listeners):
+    """Test logging of slow admin requests."""
+    caplog.set_level(logging.WARNING)
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        client.get("/admin/testmodel/")
+        assert _slow_requests(caplog) == []
+
+        app.config["ADMIN_SLOW_REQUEST_THRESHOLD"] = 0
+        app.config["ADMIN_SLOW_REQUEST_TOP_N"] = 1
+        client.get("/admin/testmodel/?flt0_0=test")
+        (entry,) = _slow_requests(caplog)
+        assert entry["endpoint"] == "testmodel.index_view"
+        assert entry["user_id"] == "1"
+        assert entry["args"] == {"flt0_0": ["test"]}
+        assert entry["sql_count"] >= 2
+        assert entry["sql_time_ms"] <= entry["duration_ms"]
+        assert len(entry["slowest_sql"]) == 1
+        assert "SELECT" in entry["slowest_sql"][0]["statement"]
+
+        # Requests faster than the threshold are not logged.
+        app.config["ADMIN_SLOW_REQUEST_THRESHOLD"] = 60
+        client.get("/admin/testmodel/")
+        assert len(_slow_requests(caplog)) == 1
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Live updates tests."""
+
+from __future__ import absolute_import, print_function
+
+import json
+import uuid
+from unittest.mock import MagicMock
+
+from invenio_db import db
+
+from invenio_admin.api import encode_cursor
+from invenio_admin.filters import UUIDEqualFilter
+from invenio_admin.stream import ChangePoller
+
+
+def _events(res):
+    """Parse the change events of a stream."""
+    events = []
+    for chunk in res.get_data(as_text=True).split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in chunk.splitlines())
+        if lines.get("event") == "change":
+            events.append(json.loads(lines["data"]))
+    return events
+
+
+def test_stream(app, testmodelcls):
+    """Test streaming changed records."""
+    with app.app_context():
+        db.session.add_all([testmodelcls(), testmodelcls()])
+        db.session.commit()
+
+    view = app.extensions["invenio-admin"].get_view("testmodel")
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        assert client.get("/admin/testmodel/stream/").status_code == 404
+
+        view.can_stream = True
+        view.stream_interval = 0
+        app.config["ADMIN_STREAM_TIMEOUT"] = 0
+        res = client.get("/admin/testmodel/stream/?cursor=" + encode_cursor([1]))
+        assert res.mimetype == "text/event-stream"
+        assert [e["id"] for e in _events(res)] == ["2"]
+
+        with app.app_context():
+            db.session.add(testmodelcls())
+            db.session.commit()
+
+        res = client.get(
+            "/admin/testmodel/stream/",
+            headers={"Last-Event-ID": encode_cursor([2])},
+        )
+        assert [e["id"] for e in _events(res)] == ["3"]
+        # Clients with the same permissions share a poller.
+        assert [p.high_water for p in view._stream_pollers.values()] == [3]
+        client.get("/login/?user=3")
+        res = client.get("/admin/testmodel/stream/?cursor=" + encode_cursor([2]))
+        assert [e["id"] for e in _events(res)] == ["3"]
+        assert len(view._stream_pollers) == 2
+
+        # The filters of the list are applied.
+        with app.app_context():
+            value = uuid.uuid4()
+            db.session.add_all([testmodelcls(), testmodelcls(uuidcol=value)])
+            db.session.commit()
+        index = [type(f) for f in view._filters].index(UUIDEqualFilter)
+        res = client.get(
+            "/admin/testmodel/stream/",
+            query_string={"cursor": encode_cursor([3]), "flt0_%d" % index: value},
+        )
+        assert [e["id"] for e in _events(res)] == ["5"]
+
+        res = client.get("/admin/testmodel/stream/?cursor=invalid")
+        assert res.status_code == 400
+
+
+def test_change_poller():
+    """Test that clients share the queries of the poller."""
+    view = MagicMock()
+    view.get_stream_high_water.return_value = 1
+    view.get_stream_changes.return_value = [(2, {"id": "2"}), (3, {"id": "3"})]
+    poller = ChangePoller(view, interval=0, maxsize=2)
+    assert poller.since(1) is None
+
+    poller.poll()
+    assert poller.since(1) == []
+    poller.poll()
+    assert poller.since(1) == [(2, {"id": "2"}), (3, {"id": "3"})]
+    assert poller.since(2) == [(3, {"id": "3"})]
+    assert view.get_stream_changes.call_count == 1
+
+    poller.interval = 60
+    poller.poll()
+    assert view.get_stream_changes.call_count == 1
+
+    # Changes older than the buffer must be queried by the client.
+    poller.interval = 0
+    view.get_stream_changes.return_value = [(4, {"id": "4"})]
+    poller.poll()
+    assert poller.since(1) is None
+    assert poller.since(2) == [(3, {"id": "3"}), (4, {"id": "4"})]
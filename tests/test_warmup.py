@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Warmup tests."""
+
+from __future__ import absolute_import, print_function
+
+from unittest.mock import patch
+
+from invenio_admin.cli import admin
+from invenio_admin.warmup import unique_memory
+
+
+@patch("gc.freeze")
+def test_warmup(freeze, app):
+    """Test warming up the admin interface."""
+    state = app.extensions["invenio-admin"]
+    with app.app_context():
+        report = state.warmup()
+    # The garbage collector is only frozen on request.
+    assert not freeze.called
+    assert report["views"] == len(state.admin._views)
+    assert "admin/model/list.html" in report["templates"]
+    assert "admin/master.html" in report["templates"]
+    # The templates rendered by the protected views and the referenced ones.
+    assert "invenio_admin/model/list.html" in report["templates"]
+    assert "admin/lib.html" in report["templates"]
+    assert app.jinja_env.cache
+
+    result = app.test_cli_runner().invoke(admin, ["warmup"])
+    assert result.exit_code == 0
+    assert "admin/model/edit.html" in result.output
+
+    app.config["ADMIN_WARMUP_GC_FREEZE"] = True
+    with app.app_context():
+        state.warmup()
+    assert freeze.called
+
+
+def test_memory_report(app):
+    """Test reporting of memory allocated by admin requests."""
+    state = app.extensions["invenio-admin"]
+    with app.test_client() as client:
+        client.get("/login/?user=1")
+        client.get("/admin/testmodel/")
+        assert state.memory_report.requests == 0
+
+        app.config["ADMIN_WARMUP_REPORT"] = True
+        client.get("/admin/testmodel/")
+        client.get("/admin/testbase/")
+        if unique_memory() is not None:
+            assert state.memory_report.requests == 2